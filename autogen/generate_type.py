@@ -1,13 +1,23 @@
+import os
+import ast
 import json
 
-def json2py(infile: str, outfile: str):
+
+def json2py(infile: str, outfile: str, slots: bool = False, weakref: tuple = (), decoders: str = None):
+    """Generate NSData classes from a spec file. Methods written by hand in an existing `outfile` are kept.
+    With `slots`, the classes in `weakref` get a __weakref__ slot, so they can be shared through weak references.
+    `decoders` is the name of the module generated by json2decoders(), which is imported at the end."""
     with open(infile) as f:
         spec = json.load(f)
+    methods = existing_methods(outfile)
     with open(outfile, 'wt') as f:
         f.write('import typing\nimport datetime\n\nfrom . import NSData\n')
         for name, obj in spec.items():
             f.write('\n\n')
             f.write(f'class {name}(NSData):\n')
+            if slots:
+                names = tuple(attr['name'] for attr in obj['params']) + (('__weakref__',) if name in weakref else ())
+                f.write(f'    __slots__ = {names!r}\n\n')
             for attr in obj['params']:
                 dtype = decode_dtype(attr["type"])
                 if attr['required'].lower() != 'true':
@@ -15,6 +25,82 @@ def json2py(infile: str, outfile: str):
                 description = attr['description'].strip()
                 comment = f'  # {description}' if len(description) > 0 else ''
                 f.write(f'    {attr["name"]}: {dtype}{comment}\n')
+            for method in methods.get(name, []):
+                f.write(f'\n{method}\n')
+        if decoders is not None:
+            f.write(f'\n\nfrom . import {decoders}  # noqa: E402 (installs the generated decoders on the classes above)\n')
+
+
+def json2decoders(infile: str, outfile: str, module: str, typesfile: str):
+    """Generate a straight-line decoder per class of `module` (generated by json2py() as `typesfile`).
+    NSData uses them for JSON with only the exact attribute names as keys, other JSON goes through the generic decoder."""
+    with open(infile) as f:
+        spec = json.load(f)
+    methods = existing_methods(typesfile)
+    with open(outfile, 'wt') as f:
+        f.write(f'"""Decoders for the classes in {module}, generated by autogen/generate_type.py. Do not edit."""\n')
+        f.write('from .timestamps import parse_datetime, parse_date\n')
+        f.write(f'from .{module} import (\n')
+        for name in spec:
+            f.write(f'    {name},\n')
+        f.write(')\n\n_new = object.__new__\n')
+        for name, obj in spec.items():
+            keys = ', '.join(repr(attr['name']) for attr in obj['params'])
+            f.write(f'\n_{name}_keys = frozenset(({keys}{"," if len(obj["params"]) == 1 else ""}))\n\n\n')
+            f.write(f'def decode_{name}(data, self=None):\n')
+            f.write(f'    if not data.keys() <= _{name}_keys:\n')
+            f.write(f'        return None\n')
+            f.write(f'    if self is None:\n')
+            f.write(f'        self = _new({name})\n')
+            if obj['params']:
+                f.write('    get = data.get\n')
+            for attr in obj['params']:
+                expression = decode_expression(attr['type'], spec, 'value')
+                if expression == 'value':
+                    f.write(f'    self.{attr["name"]} = get({attr["name"]!r})\n')
+                else:
+                    f.write(f'    value = get({attr["name"]!r})\n')
+                    f.write(f'    self.{attr["name"]} = None if value is None else {expression}\n')
+            if any(method.lstrip().startswith('def __post_init__') for method in methods.get(name, [])):
+                f.write('    self.__post_init__({})\n')
+            f.write('    return self\n\n')
+        f.write('\n')
+        for name in spec:
+            f.write(f'{name}._from_json = decode_{name}\n')
+
+
+def decode_expression(dtype: str, spec: dict, value: str, depth: int = 0):
+    """Python expression decoding the JSON in variable `value` as `dtype`"""
+    if dtype.endswith('[]'):
+        item = f'item{depth or ""}'
+        expression = decode_expression(dtype[:-2], spec, item, depth + 1)
+        if expression == item:
+            return value
+        return f'[{expression} for {item} in {value}]'
+    if dtype == 'date-time':
+        return f'parse_datetime({value})'
+    if dtype == 'date':
+        return f'parse_date({value})'
+    if dtype in spec:
+        return f'(decode_{dtype}({value}) or {dtype}({value}))'
+    return value
+
+
+def existing_methods(file: str) -> dict[str, list[str]]:
+    """Get the source of all methods defined on the classes in `file`"""
+    if not os.path.exists(file):
+        return {}
+    with open(file) as f:
+        source = f.read()
+    lines = source.splitlines()
+    methods = {}
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.ClassDef):
+            for child in node.body:
+                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    start = min([child.lineno] + [decorator.lineno for decorator in child.decorator_list])
+                    methods.setdefault(node.name, []).append('\n'.join(lines[start - 1:child.end_lineno]))
+    return methods
 
 
 def decode_dtype(dtype: str):
@@ -36,4 +122,9 @@ def decode_dtype(dtype: str):
         return 'str'
     return f'"{dtype}"'
 
-json2py('reisinformatie.json', '../nsapi/dtypes/travel_information.py')
+
+if __name__ == '__main__':
+    json2py('reisinformatie.json', '../nsapi/dtypes/travel_information.py', slots=True,
+            weakref=('Product', 'RouteStation', 'StationsNamen', 'NesColor'), decoders='travel_information_decoders')
+    json2decoders('reisinformatie.json', '../nsapi/dtypes/travel_information_decoders.py', 'travel_information',
+                  '../nsapi/dtypes/travel_information.py')
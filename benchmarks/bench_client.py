@@ -0,0 +1,56 @@
+"""The whole client stack (rate limiting, concurrency, decoding) against recorded responses: in-process replay,
+and a local stand-in server adding latency"""
+import json
+import time
+import asyncio
+
+import payloads
+from nsapi import NSAPI, AsyncNSAPI, RateLimiter
+from nsapi.transport import Archive, ReplayAdapter, AsyncReplayTransport, StandInServer
+
+STATIONS = [f'S{i}' for i in range(200)]
+
+
+def build_archive():
+    archive = Archive()
+    for i, station in enumerate(STATIONS):
+        body = json.dumps(payloads.departures(count=40, seed=i)).encode()
+        archive.add('GET', f'/reisinformatie-api/api/v2/departures?station={station}', 200,
+                    {'Content-Type': 'application/json'}, body)
+    return archive
+
+
+def run_sync(api):
+    start = time.perf_counter()
+    failed = sum(isinstance(result, Exception) for _, result in api.travel_information.departures_many(STATIONS, max_workers=16))
+    return time.perf_counter() - start, failed
+
+
+async def run_async(api):
+    start = time.perf_counter()
+    failed = 0
+    async for _, result in api.travel_information.departures_many(STATIONS, max_workers=50):
+        failed += isinstance(result, Exception)
+    await api.aclose()
+    return time.perf_counter() - start, failed
+
+
+def report(name, seconds, failed):
+    print(f'{name:>40}: {seconds * 1000:8.1f} ms  {len(STATIONS) / seconds:8.0f} requests/s  {failed} failed')
+
+
+def main():
+    archive = build_archive()
+    report('sync, in-process replay', *run_sync(NSAPI('token', transport=ReplayAdapter(archive))))
+    report('async, in-process replay', *asyncio.run(run_async(AsyncNSAPI('token', transport=AsyncReplayTransport(archive)))))
+    with StandInServer(archive, latency=0.02, jitter=0.01) as url:
+        report('sync, stand-in 20-30 ms', *run_sync(NSAPI('token', base_url=url, pool_size=16)))
+        report('async, stand-in 20-30 ms', *asyncio.run(run_async(AsyncNSAPI('token', base_url=url))))
+    with StandInServer(archive, latency=0.02, errors={429: 0.1}, retry_after=0.05, seed=0) as url:
+        limiter = RateLimiter(500, backoff=0.05)
+        report('async, stand-in, 10% HTTP 429, 500/s', *asyncio.run(run_async(AsyncNSAPI('token', base_url=url, rate_limiter=limiter))))
+        print(f'{"":>40}  {limiter.stats()}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Cold start: the time to import nsapi, create a client and make the first (and second) request, in fresh interpreters
+against a local stand-in server. The first request includes importing the HTTP stack and compiling the decoders.
+
+    python bench_cold_start.py [--precompile]
+"""
+import sys
+import json
+import argparse
+import subprocess
+
+import payloads
+from nsapi.transport import Archive, StandInServer
+
+CHILD = '''
+import sys
+import json
+import time
+
+timings = {}
+start = time.perf_counter()
+import nsapi
+timings['import nsapi'] = time.perf_counter() - start
+start = time.perf_counter()
+from nsapi import NSAPI
+timings['import NSAPI'] = time.perf_counter() - start
+start = time.perf_counter()
+api = NSAPI('token', base_url=sys.argv[1])
+timings['create client'] = time.perf_counter() - start
+if sys.argv[2] == 'precompile':
+    start = time.perf_counter()
+    nsapi.precompile()
+    timings['precompile'] = time.perf_counter() - start
+for request in ('first request', 'second request'):
+    start = time.perf_counter()
+    api.travel_information.departures('UT')
+    timings[request] = time.perf_counter() - start
+timings['modules'] = len(sys.modules)
+print(json.dumps(timings))
+'''
+
+
+def cold_start(repeat=5, precompile=False):
+    """Best time of every phase, over `repeat` fresh interpreters"""
+    archive = Archive()
+    archive.add('GET', '/reisinformatie-api/api/v2/departures?station=UT', 200, {'Content-Type': 'application/json'},
+                json.dumps(payloads.departures(count=40)).encode())
+    runs = []
+    with StandInServer(archive) as url:
+        for _ in range(repeat):
+            process = subprocess.run([sys.executable, '-c', CHILD, url, 'precompile' if precompile else ''],
+                                     capture_output=True, text=True, check=True)
+            runs.append(json.loads(process.stdout))
+    return {phase: min(run[phase] for run in runs) for phase in runs[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--precompile', action='store_true', help='Compile the decoders before the first request')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    timings = cold_start(args.repeat, args.precompile)
+    modules = timings.pop('modules')
+    for phase, seconds in timings.items():
+        print(f'{phase:>16}: {seconds * 1000:8.2f} ms')
+    print(f'{"total":>16}: {sum(timings.values()) * 1000:8.2f} ms, {modules} modules loaded')
+
+
+if __name__ == '__main__':
+    main()
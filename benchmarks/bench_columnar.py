@@ -0,0 +1,52 @@
+"""Mean delay over many departure boards: NSData objects versus the columnar representation"""
+import time
+import datetime
+
+import numpy as np
+
+import payloads
+from nsapi.columnar import Board
+from nsapi.dtypes.travel_information import RepresentationResponseDeparturesPayload
+
+
+def with_objects(boards):
+    delays = []
+    for data in boards:
+        for departure in RepresentationResponseDeparturesPayload(data).payload.departures:
+            if departure.actualDateTime is not None and departure.plannedDateTime is not None:
+                delays.append((departure.actualDateTime - departure.plannedDateTime).total_seconds())
+    return sum(delays) / len(delays)
+
+
+def with_concat(boards):
+    board = Board.concat(Board.from_payload(data, station=str(i)) for i, data in enumerate(boards))
+    return np.nanmean(board.delay_seconds)
+
+
+def with_columns(boards):
+    board = Board.from_payloads(boards, [str(i) for i in range(len(boards))])
+    return np.nanmean(board.delay_seconds)
+
+
+def check_offsets():
+    """Timestamps with other UTC offset notations convert to the same instants as with the dtypes"""
+    values = ['2023-05-01T08:15:00+0200', '2023-05-01T08:15:00+02:00', '2023-05-01T08:15:00Z', '2023-05-01T08:15:00-0130']
+    data = {'payload': {'departures': [{'name': 'IC 1', 'plannedDateTime': value} for value in values]}}
+    board = Board.from_payload(data)
+    departures = RepresentationResponseDeparturesPayload(data).payload.departures
+    expected = [np.datetime64(departure.plannedDateTime.astimezone(datetime.timezone.utc).replace(tzinfo=None), 's')
+                for departure in departures]
+    assert list(board.columns['planned']) == expected, (board.columns['planned'], expected)
+
+
+def main(count=500, per_board=40):
+    check_offsets()
+    boards = [payloads.departures(count=per_board, seed=seed) for seed in range(count)]
+    for name, run in (('objects', with_objects), ('concat', with_concat), ('columnar', with_columns)):
+        start = time.perf_counter()
+        mean = run(boards)
+        print(f'{name:>10}: mean delay {mean:6.1f} s over {count * per_board} departures in {(time.perf_counter() - start) * 1000:7.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""Compare NSData decoding against the previous per-instance reflection approach, and the generated decoders against
+the compiled decoding plans"""
+import sys
+import timeit
+import typing
+import datetime
+
+import payloads
+from nsapi.dtypes import NSData
+from nsapi.dtypes import travel_information
+from nsapi.dtypes.travel_information import TravelAdvice
+
+
+def reflective_decode(cls, data):
+    """The decoder as it was before per-class decoding plans, kept as a reference point"""
+    self = cls.__new__(cls)
+    data = {key.lower(): value for key, value in data.items()}
+    for attr, typehint in typing.get_type_hints(cls, localns={'array': list}).items():
+        if attr.lower() in data:
+            setattr(self, attr, reflective_resolve(cls, typehint, data.pop(attr.lower())))
+        else:
+            setattr(self, attr, None)
+    if hasattr(self, '__post_init__'):
+        self.__post_init__(data)
+    return self
+
+
+def reflective_resolve(cls, typehint, data):
+    origin = typing.get_origin(typehint)
+    if origin is not None and origin is typing.Union:
+        args = typing.get_args(typehint)
+        typehint = args[0] if issubclass(args[1], type(None)) else args[1]
+        return reflective_resolve(cls, typehint, data)
+    if origin is not None and issubclass(origin, list):
+        typehint = typing.get_args(typehint)[0]
+        return [reflective_resolve(cls, typehint, item) for item in data]
+    if isinstance(typehint, str):
+        return reflective_decode(getattr(sys.modules[cls.__module__], typehint), data)
+    if issubclass(typehint, datetime.datetime):
+        return datetime.datetime.strptime(data, "%Y-%m-%dT%H:%M:%S%z")
+    if issubclass(typehint, datetime.date):
+        return datetime.datetime.strptime(data, '%Y-%m-%d').date()
+    if typehint is not None and issubclass(typehint, NSData):
+        return reflective_decode(typehint, data)
+    return data
+
+
+def generic(cls, data):
+    """Decode with the compiled per-class plans only, ignoring the decoders generated by autogen"""
+    classes = [cls for cls in vars(travel_information).values() if isinstance(cls, type) and '_from_json' in cls.__dict__]
+    for klass in classes:
+        (klass.__dict__.get('_decoder') or klass._compile_decoder()).generated = None
+    try:
+        return cls(data)
+    finally:
+        for klass in classes:
+            klass._decoder.generated = klass.__dict__.get('_from_json')
+
+
+def main():
+    data = payloads.trips(count=10, legs=3, stops=12)
+    TravelAdvice(data)
+    for name, decode in (('reflective', lambda: reflective_decode(TravelAdvice, data)),
+                         ('compiled', lambda: generic(TravelAdvice, data)),
+                         ('generated', lambda: TravelAdvice(data))):
+        number, _ = timeit.Timer(decode).autorange()
+        best = min(timeit.repeat(decode, number=number, repeat=5)) / number
+        print(f'{name:>12}: {best * 1000:8.2f} ms per trips() payload')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Schema drift: the decode time of a journey() payload where every stop carries a field unknown to the dtypes, and a
+check that every new field is logged, also when it arrives within the warning interval."""
+import copy
+import timeit
+import logging
+
+import payloads
+from nsapi.dtypes import drift
+from nsapi.dtypes.travel_information import Coordinate, RepresentationResponseJourney
+
+
+class Records(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def check_flush():
+    """Keys first seen within the interval are held back until the next warning, and logged by flush()"""
+    handler = Records()
+    drift.logger.addHandler(handler)
+    try:
+        collector = drift.DriftCollector(interval=3600)
+        collector.record(RepresentationResponseJourney, {'first': 1})
+        collector.record(RepresentationResponseJourney, {'second': 2})
+        assert len(handler.messages) == 1 and 'first' in handler.messages[0], handler.messages
+        collector.flush()
+        assert len(handler.messages) == 2 and 'second' in handler.messages[1], handler.messages
+        collector.flush()
+        assert len(handler.messages) == 2, handler.messages
+    finally:
+        drift.logger.removeHandler(handler)
+
+
+def check_keys():
+    """Unknown keys are reported and retained as received, not lowercased"""
+    saved = drift.collector
+    drift.collector = drift.DriftCollector(retain=True)
+    drift.logger.disabled = True
+    try:
+        coordinate = Coordinate({'lat': 52.0, 'altitudeMeters': 5})
+        assert coordinate.extra_attributes() == {'altitudeMeters': 5}, coordinate.extra_attributes()
+        assert drift.collector.summary() == {'Coordinate': {'altitudeMeters': {'count': 1, 'sample': 5}}}
+    finally:
+        drift.collector = saved
+        drift.logger.disabled = False
+
+
+def main():
+    check_flush()
+    check_keys()
+    clean = payloads.journey(stops=40, split=True)
+    drifted = copy.deepcopy(clean)
+    for stop in drifted['payload']['stops']:
+        stop['newField'] = 'value'
+    drift.logger.disabled = True
+    for name, data in (('clean', clean), ('drifted', drifted)):
+        run = lambda: RepresentationResponseJourney(data)
+        number, _ = timeit.Timer(run).autorange()
+        best = min(timeit.repeat(run, number=number, repeat=5)) / number
+        print(f'{name:>8}: {best * 1000:7.3f} ms')
+    print(drift.collector.summary())
+
+
+if __name__ == '__main__':
+    main()
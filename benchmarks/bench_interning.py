@@ -0,0 +1,66 @@
+"""Memory of a day of departure boards kept in memory, with and without interning.
+Every station is polled every 10 minutes, so most departures (and their products) appear on several boards."""
+import gc
+import json
+import time
+import tracemalloc
+
+import payloads
+from nsapi.dtypes import interning
+from nsapi.dtypes.travel_information import RepresentationResponseDeparturesPayload
+
+POLLS = 72          # 12 hours, every 10 minutes
+BOARD = 40
+
+
+def recorded_day():
+    """JSON of every poll, as received (parsed separately, so no strings are shared between them)"""
+    timetables = [payloads.departures(count=POLLS * 5 + BOARD, seed=seed)['payload']['departures']
+                  for seed in range(len(payloads.STATIONS))]
+    return [json.dumps({'payload': {'source': 'PPV', 'departures': timetable[poll * 5:poll * 5 + BOARD]}})
+            for poll in range(POLLS) for timetable in timetables]
+
+
+def measure(boards):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    decoded = [RepresentationResponseDeparturesPayload(json.loads(board)) for board in boards]
+    seconds = time.perf_counter() - start
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return decoded, size, seconds
+
+
+def decode_time(boards, repeat=3):
+    """Best time to decode the boards, without tracemalloc (which slows the allocations down)"""
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        decoded = [RepresentationResponseDeparturesPayload(json.loads(board)) for board in boards]
+        times.append(time.perf_counter() - start)
+        del decoded
+    return min(times)
+
+
+def main():
+    boards = recorded_day()
+    print(f'{len(boards)} boards, {len(boards) * BOARD} departures')
+    decoded, plain, plain_seconds = measure(boards)
+    del decoded
+    plain_seconds = decode_time(boards)
+    interning.enable()
+    decoded, interned, interned_seconds = measure(boards)
+    stats = interning.stats()
+    del decoded
+    interned_seconds = decode_time(boards)
+    print(f'   plain: {plain / 2**20:7.1f} MiB, decoded in {plain_seconds:.2f} s')
+    print(f'interned: {interned / 2**20:7.1f} MiB, decoded in {interned_seconds:.2f} s, '
+          f'{1 - interned / plain:.0%} less memory, {interned_seconds / plain_seconds - 1:+.0%} decode time')
+    print(f'    pool: {stats}')
+
+
+if __name__ == '__main__':
+    main()
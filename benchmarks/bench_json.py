@@ -0,0 +1,33 @@
+"""Parsing large trips responses: requests' response.json() versus the backends of nsapi.json_backend on the raw bytes"""
+import json
+import timeit
+
+import requests
+
+import payloads
+from nsapi.json_backend import BACKENDS
+from nsapi.dtypes.travel_information import TravelAdvice
+
+
+def response(body):
+    result = requests.Response()
+    result._content = body
+    result.status_code = 200
+    return result
+
+
+def main():
+    for count in (10, 50, 200):
+        body = json.dumps(payloads.trips(count=count)).encode()
+        print(f'{count} trips, {len(body) / 2**20:.1f} MiB')
+        candidates = {'response.json()': lambda: response(body).json()}
+        candidates.update({f'{name}.loads(bytes)': lambda loads=loads: loads(body) for name, loads in BACKENDS.items()})
+        for name, parse in candidates.items():
+            number = max(1, 20 // count)
+            parse_time = min(timeit.repeat(parse, number=number, repeat=5)) / number
+            total_time = min(timeit.repeat(lambda: TravelAdvice(parse()), number=number, repeat=5)) / number
+            print(f'{name:>22}: parse {parse_time * 1000:7.1f} ms, parse + decode {total_time * 1000:7.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,29 @@
+"""Eager versus lazy decoding for callers that only read a few fields of a trips() response"""
+import timeit
+import tracemalloc
+
+import payloads
+from nsapi.dtypes.travel_information import TravelAdvice
+
+
+def read_few(advice):
+    trip = advice.trips[0]
+    return trip.optimal, trip.plannedDurationInMinutes, trip.legs[0].origin.name
+
+
+def main():
+    data = payloads.trips(count=10, legs=3, stops=12)
+    for name, decode in (('eager', TravelAdvice), ('lazy', TravelAdvice.lazy)):
+        assert read_few(decode(data)) == read_few(TravelAdvice(data))
+        run = lambda: read_few(decode(data))
+        number, _ = timeit.Timer(run).autorange()
+        best = min(timeit.repeat(run, number=number, repeat=5)) / number
+        tracemalloc.start()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f'{name:>6}: {best * 1000:8.3f} ms, {peak / 1024:8.1f} KiB peak allocated per decode + read')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""Memory footprint of decoded departure boards, with and without __slots__"""
+import os
+import sys
+import tempfile
+import tracemalloc
+import importlib.util
+
+import payloads
+from nsapi.dtypes import travel_information
+
+AUTOGEN = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'autogen')
+sys.path.insert(0, AUTOGEN)
+from generate_type import json2py
+
+
+def load_unslotted():
+    """Generate and import a copy of the travel information dtypes without __slots__"""
+    directory = tempfile.mkdtemp()
+    file = os.path.join(directory, 'travel_information_dict.py')
+    json2py(os.path.join(AUTOGEN, 'reisinformatie.json'), file, slots=False)
+    spec = importlib.util.spec_from_file_location('nsapi.dtypes.travel_information_dict', file)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def measure(module, boards):
+    tracemalloc.start()
+    decoded = [module.RepresentationResponseDeparturesPayload(board) for board in boards]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    count = sum(len(board.payload.departures) for board in decoded)
+    return size, count
+
+
+def main(boards=250, per_board=40):
+    data = [payloads.departures(count=per_board, seed=seed) for seed in range(boards)]
+    for name, module in (('__dict__', load_unslotted()), ('__slots__', travel_information)):
+        module.RepresentationResponseDeparturesPayload(data[0])  # Compile decoders outside of the measurement
+        size, count = measure(module, data)
+        print(f'{name:>10}: {size / 2**20:7.2f} MiB for {count} departures, {size / count:7.0f} B per departure (incl. products, route stations)')
+
+
+if __name__ == '__main__':
+    main()
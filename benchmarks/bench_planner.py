@@ -0,0 +1,91 @@
+"""Connection Scan planning on a synthetic national timetable: a few hundred stations, lines of 8-20 stations
+running in both directions every 30 or 60 minutes from 05:00 to midnight."""
+import time
+import random
+import datetime
+import statistics
+
+import payloads
+from nsapi.planner import ConnectionPlanner, Call
+from nsapi.dtypes.travel_information import Station, Product, RepresentationResponseJourney
+
+STATIONS = 400
+LINES = 150
+QUERIES = 500
+DAY = datetime.datetime(2023, 5, 1, tzinfo=payloads.TZ)
+
+
+def timetable(planner, seed=0):
+    rng = random.Random(seed)
+    stations = [Station(payloads.station(i, rng)) for i in range(STATIONS)]
+    # Lines mostly run between neighbouring stations, so that they meet at hubs
+    for line in range(LINES):
+        route = [rng.randrange(STATIONS)]
+        while len(route) < rng.randint(8, 20):
+            station = (route[-1] + rng.randint(-15, 15)) % STATIONS
+            if station not in route:
+                route.append(station)
+        hops = [rng.randint(3, 8) for _ in route[1:]]
+        interval = rng.choice((30, 60))
+        offset = rng.randrange(interval)
+        for direction, (stops, minutes) in enumerate(((route, hops), (route[::-1], hops[::-1]))):
+            product = Product({'number': str(line * 1000 + direction), 'categoryCode': 'IC', 'operatorName': 'NS',
+                               'longCategoryName': 'Intercity'})
+            for departure in range(5 * 60 + offset, 24 * 60, interval):
+                calls = []
+                moment = DAY + datetime.timedelta(minutes=departure)
+                for i, station in enumerate(stops):
+                    arrival = moment if i else None
+                    if i:
+                        moment += datetime.timedelta(minutes=1)
+                    calls.append(Call(stations[station], arrival, moment if i < len(stops) - 1 else None))
+                    if i < len(minutes):
+                        moment += datetime.timedelta(minutes=minutes[i])
+                planner.add_trip(calls, product, f'NS Intercity {product.number}',
+                                 stations[stops[-1]].namen.lang)
+    return stations
+
+
+def measure(function, arguments):
+    times = []
+    results = 0
+    for args in arguments:
+        start = time.perf_counter()
+        result = function(*args)
+        times.append(time.perf_counter() - start)
+        results += result is not None and result != []
+    return statistics.median(times) * 1000, max(times) * 1000, results
+
+
+def main():
+    rng = random.Random(1)
+    journeys = [RepresentationResponseJourney(payloads.journey(stops=20, split=seed % 4 == 0, seed=seed))
+                for seed in range(200)]
+    start = time.perf_counter()
+    planner = ConnectionPlanner()
+    for journey in journeys:
+        planner.add_journey(journey)
+    print(f'add_journey: {(time.perf_counter() - start) / len(journeys) * 1e6:.0f} µs per journey')
+
+    planner = ConnectionPlanner()
+    start = time.perf_counter()
+    stations = timetable(planner)
+    ingest = time.perf_counter() - start
+    start = time.perf_counter()
+    connections = len(planner)
+    build = time.perf_counter() - start
+    served = planner.stations.stations
+    print(f'{len(served)} of {len(stations)} stations served, {len(planner.runs)} trains, {connections} connections: '
+          f'added in {ingest:.2f} s, sorted in {build:.2f} s')
+
+    queries = [(rng.choice(served), rng.choice(served), DAY + datetime.timedelta(minutes=rng.randint(6 * 60, 20 * 60)))
+               for _ in range(QUERIES)]
+    median, worst, found = measure(planner.earliest_arrival, queries)
+    print(f'earliest_arrival: median {median:.2f} ms, max {worst:.2f} ms ({found}/{QUERIES} found)')
+    window = datetime.timedelta(hours=1)
+    median, worst, found = measure(planner.profile, [(a, b, t, t + window) for a, b, t in queries[:QUERIES // 5]])
+    print(f'profile (1 hour): median {median:.2f} ms, max {worst:.2f} ms ({found}/{QUERIES // 5} found)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""Retries after HTTP 429: many threads throttled at the same moment should retry spread out over time, not together"""
+import time
+import statistics
+import threading
+
+from nsapi import RateLimiter
+
+CALLERS = 50
+RETRY_AFTER = 0.2
+
+
+def main():
+    limiter = RateLimiter(1000, burst=CALLERS)
+    start = time.monotonic()
+    retries = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(CALLERS)
+
+    def caller():
+        limiter.acquire()
+        barrier.wait()          # Every request is answered with HTTP 429 at about the same moment
+        time.sleep(limiter.on_throttled({'Retry-After': str(RETRY_AFTER)}, 0))
+        limiter.acquire()
+        with lock:
+            retries.append(time.monotonic() - start)
+
+    threads = [threading.Thread(target=caller) for _ in range(CALLERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    spread = max(retries) - min(retries)
+    print(f'{CALLERS} retries between {min(retries) * 1000:.0f} and {max(retries) * 1000:.0f} ms '
+          f'(Retry-After {RETRY_AFTER * 1000:.0f} ms), stdev {statistics.stdev(retries) * 1000:.1f} ms')
+    assert min(retries) >= RETRY_AFTER, 'A request was retried during the pause'
+    assert spread > RETRY_AFTER / 4, 'The retries were not spread out'
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+"""Restoring decoded objects: re-decoding JSON (raw, or already parsed as in the response cache), pickle, and NSData
+snapshots"""
+import json
+import pickle
+import marshal
+import timeit
+
+import payloads
+from nsapi.dtypes.snapshot import HEADER_SIZE
+from nsapi.dtypes.travel_information import TravelAdvice, RepresentationResponseJourney
+
+
+def main():
+    for name, dtype, data in (('50 trips', TravelAdvice, payloads.trips(count=50)),
+                              ('journey, 150 stops', RepresentationResponseJourney, payloads.journey(stops=150, split=True))):
+        obj = dtype(data)
+        raw = json.dumps(data).encode()
+        pickled = pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+        snapshot = obj.to_snapshot()
+        # Compared unmarshalled: marshal shares repeated objects by reference, so the bytes may differ
+        body = lambda snapshot: marshal.loads(snapshot[HEADER_SIZE:])
+        assert body(dtype.from_snapshot(snapshot).to_snapshot()) == body(snapshot)
+        print(name)
+        for method, size, load in (('json + decode', raw, lambda: dtype(json.loads(raw))),
+                                   ('decode (parsed)', raw, lambda: dtype(data)),
+                                   ('pickle', pickled, lambda: pickle.loads(pickled)),
+                                   ('snapshot', snapshot, lambda: dtype.from_snapshot(snapshot))):
+            seconds = min(timeit.repeat(load, number=5, repeat=5)) / 5
+            print(f'{method:>15}: {len(size) / 2**10:8.1f} KiB  load {seconds * 1000:7.2f} ms')
+        seconds = min(timeit.repeat(obj.to_snapshot, number=5, repeat=5)) / 5
+        print(f'{"":>15}  snapshot dump {seconds * 1000:7.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
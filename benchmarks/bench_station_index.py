@@ -0,0 +1,27 @@
+"""Lookups in an offline StationIndex"""
+import os
+import timeit
+import tempfile
+
+import payloads
+from nsapi.dtypes.travel_information import StationResponse
+from nsapi.station_index import StationIndex
+
+
+def main(count=4000):
+    stations = StationResponse(payloads.stations(count=count)).payload
+    build = timeit.timeit(lambda: StationIndex(stations), number=1)
+    index = StationIndex(stations)
+    file = os.path.join(tempfile.mkdtemp(), 'stations.json.gz')
+    index.save(file)
+    load = timeit.timeit(lambda: StationIndex.load(file), number=1)
+    print(f'{count} stations: build {build * 1000:.0f} ms, saved {os.path.getsize(file) / 1024:.0f} KiB, load {load * 1000:.0f} ms')
+    for name, run in (('search("noord ams")', lambda: index.search('noord ams')),
+                      ('get("S123")', lambda: index.get('S123')),
+                      ('nearest(k=5)', lambda: index.nearest(52.09, 5.11, k=5))):
+        number, _ = timeit.Timer(run).autorange()
+        print(f'{name:>20}: {min(timeit.repeat(run, number=number, repeat=5)) / number * 1e6:8.2f} us')
+
+
+if __name__ == '__main__':
+    main()
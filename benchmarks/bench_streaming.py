@@ -0,0 +1,41 @@
+"""Time to first trip and peak memory: streaming versus decoding the whole trips() response"""
+import json
+import time
+import tracemalloc
+
+import payloads
+from nsapi.streaming import ArrayStream
+from nsapi.dtypes.travel_information import TravelAdvice, Trip
+
+
+def chunked(body, size=64 * 1024):
+    for i in range(0, len(body), size):
+        yield body[i:i + size]
+
+
+def whole(body):
+    advice = TravelAdvice(json.loads(b''.join(chunked(body))))
+    yield from advice.trips
+
+
+def streamed(body):
+    return ArrayStream(chunked(body), TravelAdvice, 'trips', Trip)
+
+
+def main():
+    body = json.dumps(payloads.trips(count=40, legs=5, stops=16)).encode()
+    print(f'trips() response of {len(body) / 2**20:.1f} MiB')
+    for name, decode in (('whole', whole), ('streamed', streamed)):
+        tracemalloc.start()
+        start = time.perf_counter()
+        first = None
+        for trip in decode(body):
+            first = first or time.perf_counter() - start
+        total = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f'{name:>10}: first trip after {first * 1000:7.1f} ms, all after {total * 1000:7.1f} ms, peak {peak / 2**20:6.1f} MiB')
+
+
+if __name__ == '__main__':
+    main()
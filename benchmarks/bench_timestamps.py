@@ -0,0 +1,47 @@
+"""Timestamp parsing: strptime versus the dedicated NS timestamp parser"""
+import timeit
+import datetime
+
+import payloads
+from nsapi.dtypes import timestamps
+
+
+def strptime(value):
+    return datetime.datetime.strptime(value, "%Y-%m-%dT%H:%M:%S%z")
+
+
+def collect(data, found):
+    """All timestamp strings in a payload, in order of appearance"""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if isinstance(value, str) and key.endswith(('DateTime', 'Time')):
+                found.append(value)
+            else:
+                collect(value, found)
+    elif isinstance(data, list):
+        for item in data:
+            collect(item, found)
+    return found
+
+
+def main():
+    values = collect(payloads.trips(count=10, legs=3, stops=12), [])
+    print(f'{len(values)} timestamps, {len(set(values))} distinct')
+    uncached = timestamps.parse_datetime.__wrapped__
+    assert [strptime(value) for value in values] == [uncached(value) for value in values]
+
+    def cached():
+        timestamps.parse_datetime.cache_clear()     # Every run starts cold, like a fresh response
+        for value in values:
+            timestamps.parse_datetime(value)
+
+    for name, run in (('strptime', lambda: [strptime(value) for value in values]),
+                      ('fast', lambda: [uncached(value) for value in values]),
+                      ('fast+cache', cached)):
+        number, _ = timeit.Timer(run).autorange()
+        best = min(timeit.repeat(run, number=number, repeat=5)) / number
+        print(f'{name:>12}: {best / len(values) * 1e6:6.2f} us per timestamp')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,414 @@
+"""Synthetic, but realistically shaped, NS API payloads for offline benchmarks"""
+import random
+import datetime
+
+STATIONS = [
+    ('8400058', 'ASD', 'Amsterdam Centraal', 'A\'dam C.', 52.3789, 4.9003),
+    ('8400621', 'UT', 'Utrecht Centraal', 'Utrecht C.', 52.0894, 5.1100),
+    ('8400530', 'RTD', 'Rotterdam Centraal', 'R\'dam C.', 51.9249, 4.4690),
+    ('8400282', 'GVC', 'Den Haag Centraal', 'Den Haag C.', 52.0808, 4.3250),
+    ('8400206', 'EHV', 'Eindhoven Centraal', 'Eindhoven C.', 51.4430, 5.4813),
+    ('8400319', 'HT', '\'s-Hertogenbosch', '\'s-Hertogenb.', 51.6905, 5.2937),
+    ('8400053', 'AMF', 'Amersfoort Centraal', 'Amersfoort C.', 52.1534, 5.3736),
+    ('8400071', 'AH', 'Arnhem Centraal', 'Arnhem C.', 51.9849, 5.9013),
+    ('8400470', 'NM', 'Nijmegen', 'Nijmegen', 51.8430, 5.8538),
+    ('8400263', 'GDM', 'Geldermalsen', 'Geldermalsen', 51.8817, 5.2722),
+    ('8400285', 'GS', 'Goes', 'Goes', 51.4983, 3.8906),
+    ('8400371', 'LW', 'Leeuwarden', 'Leeuwarden', 53.1961, 5.7925),
+    ('8400261', 'GN', 'Groningen', 'Groningen', 53.2108, 6.5650),
+    ('8400680', 'ZL', 'Zwolle', 'Zwolle', 52.5046, 6.0913),
+    ('8400180', 'DV', 'Deventer', 'Deventer', 52.2574, 6.1603),
+    ('8400389', 'LEDN', 'Leiden Centraal', 'Leiden C.', 52.1663, 4.4817),
+]
+# Stations are looked up by UIC code and by code, e.g. in StationIndex and JourneyIndex
+assert len({station[0] for station in STATIONS}) == len({station[1] for station in STATIONS}) == len(STATIONS)
+
+CATEGORIES = [('IC', 'Intercity'), ('SPR', 'Sprinter'), ('ICD', 'Intercity direct')]
+TZ = datetime.timezone(datetime.timedelta(hours=2))
+
+
+def timestamp(time: datetime.datetime) -> str:
+    return time.strftime('%Y-%m-%dT%H:%M:%S%z')
+
+
+def product(rng: random.Random) -> dict:
+    code, name = rng.choice(CATEGORIES)
+    return {
+        'number': str(rng.randint(800, 9999)),
+        'categoryCode': code,
+        'shortCategoryName': code,
+        'longCategoryName': name,
+        'operatorCode': 'NS',
+        'operatorName': 'NS',
+        'operatorAdministrativeCode': 100,
+        'type': 'TRAIN',
+        'displayName': f'NS {name}',
+    }
+
+
+def message(rng: random.Random) -> dict:
+    return {
+        'id': str(rng.randint(1, 10**6)),
+        'externalId': str(rng.randint(1, 10**6)),
+        'head': 'Werkzaamheden',
+        'text': 'Door werkzaamheden rijden er minder treinen. ' * 3,
+        'type': 'MAINTENANCE',
+        'nesColor': {'type': 'WARNING', 'color': '#DB0029'},
+        'startDate': '2023-05-01',
+        'endDate': '2023-05-07',
+    }
+
+
+def note(rng: random.Random) -> dict:
+    return {
+        'value': 'Toeslag',
+        'key': 'PR',
+        'noteType': 'ATTRIBUTE',
+        'priority': rng.randint(1, 5),
+        'isPresentationRequired': False,
+        'category': 'OTHER',
+    }
+
+
+def origin_destination(station: tuple, time: datetime.datetime, rng: random.Random, kind='STATION') -> dict:
+    uic, code, name, _, lat, lng = station
+    delayed = time + datetime.timedelta(minutes=rng.choice((0, 0, 0, 1, 3)))
+    track = str(rng.randint(1, 20))
+    return {
+        'name': name,
+        'lng': lng,
+        'lat': lat,
+        'countryCode': 'NL',
+        'uicCode': uic,
+        'type': kind,
+        'prognosisType': 'PROGNOSED',
+        'plannedTimeZoneOffset': 120,
+        'plannedDateTime': timestamp(time),
+        'actualTimeZoneOffset': 120,
+        'actualDateTime': timestamp(delayed),
+        'plannedTrack': track,
+        'actualTrack': track,
+        'exitSide': rng.choice(('LEFT', 'RIGHT')),
+        'checkinStatus': 'NOTHING',
+        'notes': [],
+    }
+
+
+def stop(station: tuple, time: datetime.datetime, index: int, rng: random.Random) -> dict:
+    uic, code, name, _, lat, lng = station
+    departure = time + datetime.timedelta(minutes=1)
+    track = str(rng.randint(1, 20))
+    return {
+        'uicCode': uic,
+        'name': name,
+        'lat': lat,
+        'lng': lng,
+        'countryCode': 'NL',
+        'notes': [],
+        'routeIdx': index,
+        'departurePrognosisType': 'PROGNOSED',
+        'plannedDepartureDateTime': timestamp(departure),
+        'plannedDepartureTimeZoneOffset': 120,
+        'actualDepartureDateTime': timestamp(departure),
+        'actualDepartureTimeZoneOffset': 120,
+        'plannedArrivalDateTime': timestamp(time),
+        'plannedArrivalTimeZoneOffset': 120,
+        'actualArrivalDateTime': timestamp(time),
+        'actualArrivalTimeZoneOffset': 120,
+        'actualDepartureTrack': track,
+        'plannedDepartureTrack': track,
+        'plannedArrivalTrack': track,
+        'actualArrivalTrack': track,
+        'departureDelayInSeconds': 0,
+        'arrivalDelayInSeconds': 0,
+        'cancelled': False,
+        'borderStop': False,
+        'passing': False,
+    }
+
+
+def coordinate(station: tuple, rng: random.Random) -> dict:
+    return {'lat': station[4] + rng.uniform(-.05, .05), 'lng': station[5] + rng.uniform(-.05, .05)}
+
+
+def fare(rng: random.Random) -> dict:
+    price = rng.randint(200, 4000)
+    return {
+        'priceInCents': price,
+        'priceInCentsExcludingSupplement': price,
+        'supplementInCents': 0,
+        'buyableTicketPriceInCents': price,
+        'buyableTicketPriceInCentsExcludingSupplement': price,
+        'buyableTicketSupplementPriceInCents': 0,
+        'product': 'OVCHIPKAART_ENKELE_REIS',
+        'travelClass': rng.choice(('FIRST_CLASS', 'SECOND_CLASS')),
+        'discountType': 'NO_DISCOUNT',
+    }
+
+
+def leg(index: int, departure: datetime.datetime, rng: random.Random, stops=12) -> tuple[dict, datetime.datetime]:
+    route = rng.sample(STATIONS, k=min(stops, len(STATIONS)))
+    times = [departure + datetime.timedelta(minutes=6 * i) for i in range(len(route))]
+    data = {
+        'idx': str(index),
+        'name': f'NS Intercity {rng.randint(800, 9999)}',
+        'travelType': 'PUBLIC_TRANSIT',
+        'direction': route[-1][2],
+        'cancelled': False,
+        'changePossible': True,
+        'alternativeTransport': False,
+        'journeyDetailRef': f'HARP_MM-2|#VN#1#ST#{rng.randint(10**8, 10**9)}#',
+        'origin': origin_destination(route[0], times[0], rng),
+        'destination': origin_destination(route[-1], times[-1], rng),
+        'product': product(rng),
+        'notes': [note(rng) for _ in range(rng.randint(0, 3))],
+        'messages': [message(rng) for _ in range(rng.randint(0, 1))],
+        'stops': [stop(station, time, i, rng) for i, (station, time) in enumerate(zip(route, times))],
+        'coordinates': [[station[5], station[4]] for station in route],
+        'crowdForecast': rng.choice(('LOW', 'MEDIUM', 'HIGH')),
+        'punctuality': rng.uniform(60, 100),
+        'shorterStock': False,
+        'journeyDetail': [{'type': 'TRAIN_XML', 'link': {'uri': '/api/v2/journey?id=1&train=1'}}],
+        'reachable': True,
+        'plannedDurationInMinutes': 6 * (len(route) - 1),
+        'overviewPolyLine': [coordinate(station, rng) for station in route for _ in range(4)],
+    }
+    return data, times[-1]
+
+
+def trip(index: int, departure: datetime.datetime, rng: random.Random, legs=3, stops=12) -> dict:
+    leg_data = []
+    time = departure
+    for i in range(legs):
+        data, time = leg(i, time, rng, stops=stops)
+        leg_data.append(data)
+        time += datetime.timedelta(minutes=rng.randint(3, 12))
+    duration = int((time - departure).total_seconds() // 60)
+    return {
+        'uid': f'arnu|fromStation=8400206|toStation=8400263|plannedFromTime={timestamp(departure)}|{index}',
+        'ctxRecon': 'arnu|' + 'x' * 200,
+        'plannedDurationInMinutes': duration,
+        'actualDurationInMinutes': duration,
+        'transfers': legs - 1,
+        'status': 'NORMAL',
+        'messages': [],
+        'legs': leg_data,
+        'overviewPolyLine': [coordinate(rng.choice(STATIONS), rng) for _ in range(20)],
+        'crowdForecast': 'MEDIUM',
+        'punctuality': rng.uniform(60, 100),
+        'optimal': index == 0,
+        'fareRoute': {'routeId': 'route', 'origin': {'varCode': 8}, 'destination': {'varCode': 9}},
+        'fares': [],
+        'fareLegs': [{
+            'origin': origin_destination(STATIONS[0], departure, rng),
+            'destination': origin_destination(STATIONS[1], time, rng),
+            'operator': 'NS',
+            'productTypes': ['TRAIN'],
+            'fares': [fare(rng) for _ in range(4)],
+        }],
+        'productFare': fare(rng),
+        'fareOptions': {
+            'isInternationalBookable': False,
+            'isInternational': False,
+            'isEticketBuyable': True,
+            'isPossibleWithOvChipkaart': True,
+            'isTotalPriceUnknown': False,
+        },
+        'type': 'NS',
+        'shareUrl': {'uri': 'https://www.ns.nl/rpx?ctx=x'},
+        'realtime': True,
+        'routeId': '1234',
+        'registerJourney': {'url': 'https://example.invalid', 'searchUrl': 'https://example.invalid', 'status': 'NOT_NEEDED', 'bicycleReservationRequired': False},
+        'eco': {'co2kg': rng.uniform(0, 5)},
+    }
+
+
+def trips(count=10, legs=3, stops=12, seed=0) -> dict:
+    """Payload of the `api/v3/trips` endpoint"""
+    rng = random.Random(seed)
+    start = datetime.datetime(2023, 5, 1, 8, 0, tzinfo=TZ)
+    return {
+        'source': 'HARP',
+        'trips': [trip(i, start + datetime.timedelta(minutes=15 * i), rng, legs=legs, stops=stops) for i in range(count)],
+        'scrollRequestBackwardContext': 'backward',
+        'scrollRequestForwardContext': 'forward',
+    }
+
+
+def departure(station: tuple, time: datetime.datetime, rng: random.Random) -> dict:
+    route = rng.sample(STATIONS, k=4)
+    delayed = time + datetime.timedelta(minutes=rng.choice((0, 0, 0, 1, 3, 8)))
+    track = str(rng.randint(1, 20))
+    data = product(rng)
+    return {
+        'direction': route[-1][2],
+        'name': f'NS {data["longCategoryName"]} {data["number"]}',
+        'plannedDateTime': timestamp(time),
+        'plannedTimeZoneOffset': 120,
+        'actualDateTime': timestamp(delayed),
+        'actualTimeZoneOffset': 120,
+        'plannedTrack': track,
+        'actualTrack': track if rng.random() > .1 else str(rng.randint(1, 20)),
+        'product': data,
+        'trainCategory': data['categoryCode'],
+        'cancelled': rng.random() < .02,
+        'journeyDetailRef': f'HARP_MM-2|#VN#1#ST#{rng.randint(10**8, 10**9)}#',
+        'routeStations': [{'uicCode': uic, 'mediumName': medium} for uic, _, _, medium, _, _ in route[:-1]],
+        'messages': [],
+        'departureStatus': rng.choice(('ON_STATION', 'INCOMING', 'UNKNOWN')),
+    }
+
+
+def departures(count=40, seed=0) -> dict:
+    """Payload of the `api/v2/departures` endpoint"""
+    rng = random.Random(seed)
+    station = rng.choice(STATIONS)
+    start = datetime.datetime(2023, 5, 1, 8, 0, tzinfo=TZ)
+    return {
+        'payload': {
+            'source': 'PPV',
+            'departures': [departure(station, start + datetime.timedelta(minutes=2 * i), rng) for i in range(count)],
+        },
+    }
+
+
+def station(index: int, rng: random.Random) -> dict:
+    name = f'{rng.choice(("Noord", "Zuid", "Oost", "West", "Nieuw", "Oud", "Sint"))} {rng.choice(STATIONS)[2].split()[0]} {index}'
+    return {
+        'UICCode': str(8400000 + index),
+        'stationType': rng.choice(('STOPTREIN_STATION', 'INTERCITY_STATION', 'KNOOPPUNT_INTERCITY_STATION')),
+        'EVACode': str(8400000 + index),
+        'code': f'S{index}',
+        'sporen': [{'spoorNummer': str(track)} for track in range(1, rng.randint(2, 12))],
+        'synoniemen': [name.upper()] if rng.random() < .2 else [],
+        'heeftFaciliteiten': True,
+        'heeftVertrektijden': True,
+        'heeftReisassistentie': rng.random() < .5,
+        'namen': {'lang': name, 'middel': name[:16], 'kort': name[:10]},
+        'land': 'NL',
+        'lat': rng.uniform(50.75, 53.5),
+        'lng': rng.uniform(3.4, 7.2),
+        'radius': 1,
+        'naderenRadius': 1,
+        'ingangsDatum': '2020-01-01',
+    }
+
+
+def stations(count=600, seed=0) -> dict:
+    """Payload of the `api/v2/stations` endpoint"""
+    rng = random.Random(seed)
+    return {'payload': [station(i, rng) for i in range(count)]}
+
+
+def arrival(station: tuple, time: datetime.datetime, rng: random.Random) -> dict:
+    data = departure(station, time, rng)
+    data['origin'] = data.pop('direction')
+    data['arrivalStatus'] = data.pop('departureStatus')
+    del data['routeStations']
+    return data
+
+
+def arrivals(count=40, seed=0) -> dict:
+    """Payload of the `api/v2/arrivals` endpoint"""
+    rng = random.Random(seed)
+    station = rng.choice(STATIONS)
+    start = datetime.datetime(2023, 5, 1, 8, 0, tzinfo=TZ)
+    return {
+        'payload': {
+            'source': 'PPV',
+            'arrivals': [arrival(station, start + datetime.timedelta(minutes=2 * i), rng) for i in range(count)],
+        },
+    }
+
+
+def journey_station(station: tuple) -> dict:
+    uic, code, name, _, lat, lng = station
+    return {'name': name, 'lat': lat, 'lng': lng, 'countryCode': 'NL', 'uicCode': uic}
+
+
+def stock(parts: int, destination: tuple, rng: random.Random) -> dict:
+    return {
+        'trainType': 'VIRM',
+        'numberOfSeats': 200 * parts,
+        'numberOfParts': parts,
+        'trainParts': [{
+            'stockIdentifier': str(rng.randint(8600, 9600)),
+            'destination': journey_station(destination),
+            'facilities': ['TOILET', 'WIFI', 'STILTE'],
+            'image': {'uri': 'https://example.invalid/virm.png'},
+        } for _ in range(parts)],
+        'hasSignificantChange': False,
+    }
+
+
+def arrival_or_departure(data: dict, origin: tuple, destination: tuple, time: datetime.datetime, track: str,
+                         rng: random.Random) -> dict:
+    delay = rng.choice((0, 0, 0, 60, 180))
+    return {
+        'product': data,
+        'origin': journey_station(origin),
+        'destination': journey_station(destination),
+        'plannedTime': timestamp(time),
+        'actualTime': timestamp(time + datetime.timedelta(seconds=delay)),
+        'delayInSeconds': delay,
+        'plannedTrack': track,
+        'actualTrack': track,
+        'cancelled': False,
+        'punctuality': rng.uniform(60, 100),
+        'crowdForecast': rng.choice(('LOW', 'MEDIUM', 'HIGH')),
+        'stockIdentifiers': [str(rng.randint(8600, 9600))],
+    }
+
+
+def journey_stop(stop_id: str, station: tuple, time: datetime.datetime, previous: list, next: list, data: dict,
+                 origin: tuple, destination: tuple, train: dict, rng: random.Random) -> dict:
+    track = str(rng.randint(1, 20))
+    return {
+        'id': stop_id,
+        'stop': journey_station(station),
+        'previousStopId': previous,
+        'nextStopId': next,
+        'destination': destination[2],
+        'status': 'ORIGIN' if not previous else 'DESTINATION' if not next else 'STOP',
+        'kind': 'DEPARTURE' if not previous else 'ARRIVAL' if not next else 'STOP',
+        'arrivals': [arrival_or_departure(data, origin, destination, time, track, rng)] if previous else [],
+        'departures': [arrival_or_departure(data, origin, destination, time + datetime.timedelta(minutes=1), track, rng)] if next else [],
+        'actualStock': train,
+        'plannedStock': train,
+        'platformFeatures': [{'paddingLeft': 10 * i, 'width': 8, 'type': 'ELEVATOR', 'description': 'Lift'} for i in range(2)],
+        'coachCrowdForecast': [{'paddingLeft': 20 * i, 'width': 20, 'classification': 'LOW'} for i in range(train['numberOfParts'] * 4)],
+    }
+
+
+def journey(stops=20, split=False, seed=0) -> dict:
+    """Payload of the `api/v2/journey` endpoint. With `split`, the train splits halfway into two parts, each
+    continuing to a different destination with another `stops // 2` stops."""
+    rng = random.Random(seed)
+    data = product(rng)
+    start = datetime.datetime(2023, 5, 1, 8, 0, tzinfo=TZ)
+    branches = [[rng.choice(STATIONS) for _ in range(stops)]]
+    if split:
+        branches.append(branches[0][:stops // 2 + 1] + [rng.choice(STATIONS) for _ in range(stops // 2)])
+    ids = [[f'{station[0]}_{b}_{i}' if b and i > stops // 2 else f'{station[0]}_0_{i}' for i, station in enumerate(route)]
+           for b, route in enumerate(branches)]
+    # The stock of the whole train, and of each part after the split
+    stocks = [stock(4 if split else 2, branches[0][-1], rng)] + [stock(2, route[-1], rng) for route in branches[:len(branches) - 1 + split]]
+    result = {}
+    for b, route in enumerate(branches):
+        for i, station in enumerate(route):
+            if ids[b][i] in result:
+                continue
+            previous = [ids[b][i - 1]] if i else []
+            next = sorted({branch[i + 1] for branch in ids if len(branch) > i + 1 and branch[i] == ids[b][i]})
+            train = stocks[b + 1] if split and i > stops // 2 else stocks[0]
+            result[ids[b][i]] = journey_stop(ids[b][i], station, start + datetime.timedelta(minutes=4 * i), previous, next,
+                                             data, route[0], route[-1], train, rng)
+    return {
+        'payload': {
+            'notes': [],
+            'productNumbers': [data['number']],
+            'stops': list(result.values()),
+            'allowCrowdReporting': True,
+            'source': 'PPV',
+        },
+    }
@@ -0,0 +1,130 @@
+"""Offline decoding benchmark suite over synthetic payloads of every endpoint, at several sizes.
+
+    python suite.py                             # Run and print the results
+    python suite.py --save baseline.json        # Also save them as a baseline
+    python suite.py --compare baseline.json     # Report (and exit with 1 on) regressions against a baseline
+
+Reported per payload: decode time, objects/s, MB/s of JSON, and the peak memory allocated while decoding.
+The import time of the package, and the time to the first response of a new client (see bench_cold_start.py), are
+measured in fresh interpreters.
+"""
+import gc
+import sys
+import json
+import time
+import timeit
+import argparse
+import platform
+import subprocess
+import tracemalloc
+
+import payloads
+from bench_cold_start import cold_start
+from nsapi.instrumentation import count_objects
+from nsapi.dtypes.travel_information import TravelAdvice, StationResponse, RepresentationResponseDeparturesPayload, \
+    RepresentationResponseArrivalsPayload, RepresentationResponseJourney
+
+# Payload type -> (dtype, generator of a payload of a given size, sizes)
+CASES = {
+    'trips': (TravelAdvice, lambda size: payloads.trips(count=size), (1, 10, 50)),
+    'departures': (RepresentationResponseDeparturesPayload, lambda size: payloads.departures(count=size), (10, 40, 200)),
+    'arrivals': (RepresentationResponseArrivalsPayload, lambda size: payloads.arrivals(count=size), (10, 40, 200)),
+    'journey': (RepresentationResponseJourney, lambda size: payloads.journey(stops=size, split=True), (10, 40, 150)),
+    'stations': (StationResponse, lambda size: payloads.stations(count=size), (50, 600, 3000)),
+}
+
+
+def peak_memory(function):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = function()
+        return tracemalloc.get_traced_memory()[1], result
+    finally:
+        tracemalloc.stop()
+
+
+def bench_case(dtype, data, min_time=0.2):
+    size = len(json.dumps(data).encode())
+    decode = lambda: dtype(data)
+    objects = count_objects(decode())
+    timer = timeit.Timer(decode)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    seconds = min(timer.repeat(5, number)) / number
+    peak, _ = peak_memory(decode)
+    return {'seconds': seconds, 'objects': objects, 'bytes': size, 'objects_per_second': objects / seconds,
+            'mb_per_second': size / seconds / 2**20, 'peak_memory': peak}
+
+
+def import_time(repeat=5):
+    """Best time to `import nsapi` in a fresh interpreter"""
+    code = 'import time; start = time.perf_counter(); import nsapi; print(time.perf_counter() - start)'
+    times = [float(subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout)
+             for _ in range(repeat)]
+    return min(times)
+
+
+def run(cases=None, quick=False):
+    results = {}
+    for name, (dtype, generate, sizes) in CASES.items():
+        if cases and name not in cases:
+            continue
+        for size in sizes[:2] if quick else sizes:
+            result = bench_case(dtype, generate(size), min_time=0.05 if quick else 0.2)
+            results[f'{name}[{size}]'] = result
+            print(f'{name + f"[{size}]":>18}: {result["seconds"] * 1000:9.3f} ms  {result["objects"]:7} objects  '
+                  f'{result["objects_per_second"]:11,.0f} objects/s  {result["mb_per_second"]:7.1f} MB/s  '
+                  f'{result["peak_memory"] / 2**10:9.1f} KiB peak')
+    seconds = import_time()
+    print(f'{"import nsapi":>18}: {seconds * 1000:9.3f} ms')
+    phases = cold_start(repeat=3 if quick else 5)
+    phases = {phase: phases[phase] for phase in ('import NSAPI', 'first request')}     # The others are too short to compare
+    for phase, elapsed in phases.items():
+        print(f'{phase:>18}: {elapsed * 1000:9.3f} ms')
+    return {'python': platform.python_version(), 'machine': platform.machine(), 'created': time.time(),
+            'import_seconds': seconds, 'cold_start': phases, 'cases': results}
+
+
+def compare(results, baseline, threshold):
+    """Report cases that got slower or use more memory by more than `threshold` (a fraction). Returns the regressions."""
+    regressions = []
+    pairs = [('import', results['import_seconds'], baseline['import_seconds'])]
+    for phase, seconds in results['cold_start'].items():
+        if phase in baseline.get('cold_start', {}):
+            pairs.append((phase, seconds, baseline['cold_start'][phase]))
+    for name, result in results['cases'].items():
+        if name in baseline['cases']:
+            old = baseline['cases'][name]
+            pairs.append((name, result['seconds'], old['seconds']))
+            pairs.append((f'{name} memory', result['peak_memory'], old['peak_memory']))
+    for name, new, old in pairs:
+        change = new / old - 1 if old else 0.0
+        marker = 'REGRESSION' if change > threshold else 'improved' if change < -threshold else ''
+        print(f'{name:>25}: {change:+7.1%} {marker}')
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('cases', nargs='*', help=f'Payload types to run, from {", ".join(CASES)} (default: all)')
+    parser.add_argument('--quick', action='store_true', help='Only the smaller sizes, with shorter timing runs')
+    parser.add_argument('--save', metavar='FILE', help='Save the results as JSON')
+    parser.add_argument('--compare', metavar='FILE', help='Compare against results saved earlier')
+    parser.add_argument('--threshold', type=float, default=0.15, help='Relative change counted as a regression')
+    args = parser.parse_args()
+    results = run(args.cases, args.quick)
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump(results, file, indent=2)
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,2 +1,31 @@
-from .api import NSAPI
+import importlib
+
 from .dtypes import *
+
+# The submodules are imported on first use of their classes, so that `import nsapi` stays cheap
+_LAZY = {
+    'NSAPI': 'api',
+    'AsyncNSAPI': 'aio',
+    'ResponseCache': 'cache',
+    'RateLimiter': 'ratelimit',
+    'StationIndex': 'station_index',
+    'JourneyIndex': 'journey_index',
+    'ConnectionPlanner': 'planner',
+    'BoardWatcher': 'watcher',
+    'HistogramAggregator': 'instrumentation',
+}
+
+__all__ = ['NSData', 'precompile', *_LAZY]
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
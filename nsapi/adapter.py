@@ -0,0 +1,52 @@
+"""The default transport of NSAPI: a requests HTTPAdapter that also measures the time to set up connections.
+Imported on the first request, with requests."""
+import time
+import threading
+
+import requests.utils
+import requests.adapters
+import urllib3.connection
+import urllib3.connectionpool
+
+# Seconds spent connecting (including TLS) during the current request, per thread
+_connecting = threading.local()
+
+
+class _TimedConnect:
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connecting.seconds = getattr(_connecting, 'seconds', 0.0) + time.perf_counter() - start
+
+
+class _TimedConnection(_TimedConnect, urllib3.connection.HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnect, urllib3.connection.HTTPSConnection):
+    pass
+
+
+class _TimedPool(urllib3.connectionpool.HTTPConnectionPool):
+    ConnectionCls = _TimedConnection
+
+
+class _TimedHTTPSPool(urllib3.connectionpool.HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(requests.adapters.HTTPAdapter):
+    """HTTPAdapter setting `response.connect_time`: the seconds spent setting up a connection (including TLS) for the
+    request, 0 when a pooled connection was reused, None for requests through a proxy (not timed)."""
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {'http': _TimedPool, 'https': _TimedHTTPSPool}
+
+    def send(self, request, *args, **kwargs):
+        _connecting.seconds = 0.0
+        response = super().send(request, *args, **kwargs)
+        proxied = requests.utils.select_proxy(request.url, kwargs.get('proxies')) is not None
+        response.connect_time = None if proxied else _connecting.seconds
+        return response
@@ -0,0 +1,108 @@
+import time
+import asyncio
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from .api import NSAPIBase, APIEndpoint
+from .ratelimit import PRIORITY_DEFAULT
+
+
+class AsyncNSAPI(NSAPIBase):
+    """asyncio version of NSAPI. The endpoints have the same methods, but return coroutines:
+
+        async with AsyncNSAPI(api_token) as api:
+            advice = await api.travel_information.trips('ut', 'gdm')
+    """
+    def __init__(self, api_token, base_url=NSAPIBase.PATH, max_connections=100, max_keepalive_connections=20, timeout=10.0,
+                 cache=None, rate_limiter=None, coalesce=False, instrument=None, transport=None,
+                 json_backend='auto'):
+        if httpx is None:
+            raise ImportError('AsyncNSAPI requires httpx, install it with `pip install nsapi[async]`')
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive_connections)
+        # An httpx transport, e.g. the AsyncReplayTransport or AsyncRecordingTransport in nsapi.transport
+        client = httpx.AsyncClient(headers={'Ocp-Apim-Subscription-Key': api_token}, limits=limits, timeout=timeout,
+                                   transport=transport)
+        super().__init__(client, base_url, cache, rate_limiter, coalesce, instrument, json_backend)
+
+    async def request(self, method, path, *args, dtype=None, lazy=False, priority=PRIORITY_DEFAULT, **kwargs):
+        flight = self._flight_key(method, path, args, kwargs, dtype, lazy)
+        if flight is not None:
+            return await self.singleflight.do_async(flight, lambda: self._request(method, path, args, kwargs, dtype, lazy, priority))
+        return await self._request(method, path, args, kwargs, dtype, lazy, priority)
+
+    async def _request(self, method, path, args, kwargs, dtype, lazy, priority):
+        event = self._event(method, path)
+        try:
+            key, entry = self._cache_lookup(method, path, args, kwargs)
+            if entry is not None and entry.fresh():
+                result = self._cached(entry, dtype, lazy, event)
+            else:
+                response = await self._send(method, path, args, kwargs, priority, event)
+                result = self._handle_response(key, entry, response, dtype, lazy, event)
+        except Exception as e:
+            if event is not None:
+                event._finish(self.instrument, error=e)
+            raise
+        if event is not None:
+            event._finish(self.instrument, result)
+        return result
+
+    async def _send(self, method, path, args, kwargs, priority, event=None):
+        attempt = 0
+        if event is not None:
+            kwargs = dict(kwargs, extensions={**kwargs.get('extensions', {}), 'trace': event.trace})
+        while True:
+            if self.rate_limiter is not None:
+                if event is None:
+                    await self.rate_limiter.acquire_async(priority)
+                else:
+                    start = time.perf_counter()
+                    await self.rate_limiter.acquire_async(priority)
+                    event.wait += time.perf_counter() - start
+            start = time.perf_counter()
+            response = await APIEndpoint.request(self, method, path, *args, **kwargs)
+            if event is not None:
+                event._response(response, start, time.perf_counter())
+            delay = self._retry(response, attempt)
+            if delay is None:
+                return response
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def stream(self, method, path, *args, priority=PRIORITY_DEFAULT, **kwargs):
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(priority)
+        async with self.session.stream(method, f'{self.path}/{path}', *args, **kwargs) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                yield chunk
+
+    async def map_concurrent(self, function, items, max_workers=8):
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def call(item):
+            async with semaphore:
+                try:
+                    return item, await function(item)
+                except Exception as e:
+                    return item, e
+
+        tasks = [asyncio.ensure_future(call(item)) for item in items]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def aclose(self):
+        await self.session.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
@@ -1,7 +1,16 @@
+import time
 import datetime
+import threading
+import concurrent.futures
 
-import requests
-from .dtypes.travel_information import TravelAdvice, StationResponse, RepresentationResponseArrivalsPayload, RepresentationResponseDeparturesPayload, \
+from .streaming import ArrayStream
+from .pagination import TripPager
+from .singleflight import SingleFlight
+from .watcher import BoardWatcher
+from .instrumentation import RequestEvent, timed
+from .json_backend import get_loads
+from .ratelimit import PRIORITY_INTERACTIVE, PRIORITY_DEFAULT, PRIORITY_BACKGROUND
+from .dtypes.travel_information import Trip, TravelAdvice, StationResponse, RepresentationResponseArrivalsPayload, RepresentationResponseDeparturesPayload, \
     RepresentationResponseJourney
 
 
@@ -16,55 +25,238 @@ class APIEndpoint:
     def get(self, path, *args, **kwargs):
         return self.request('GET', path, *args, **kwargs)
 
+    def stream(self, method, path, *args, **kwargs):
+        """Make a request, returning an iterator over the chunks of the response body"""
+        return self.session.stream(method, f'{self.path}/{path}', *args, **kwargs)
 
-class NSAPI(APIEndpoint):
-    # PATH = 'https://gateway.apiportal.ns.nl'
+    def map_concurrent(self, function, items, max_workers=8):
+        """Call `function` for every item concurrently, yielding (item, result or exception) as they complete"""
+        return self.session.map_concurrent(function, items, max_workers)
 
-    def __init__(self, api_token):
-        super().__init__(requests.Session(), 'https://gateway.apiportal.ns.nl')
-        self.session.headers['Ocp-Apim-Subscription-Key'] = api_token
+
+class NSAPIBase(APIEndpoint):
+    """Request handling shared by NSAPI and AsyncNSAPI"""
+    PATH = 'https://gateway.apiportal.ns.nl'
+
+    def __init__(self, session, base_url, cache=None, rate_limiter=None, coalesce=False, instrument=None,
+                 json_backend='auto'):
+        super().__init__(session, base_url)
+        self.loads = get_loads(json_backend)    # Parses the raw bytes of responses, see nsapi.json_backend
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.instrument = instrument        # Called with a RequestEvent after every request
+        self.singleflight = SingleFlight() if coalesce else None
         self.travel_information = TravelInformationEndpoint(self)
 
-    def request(self, method, path, *args, **kwargs):
-        response = super().request(method, path, *args, **kwargs)
+    def _flight_key(self, method, path, args, kwargs, dtype, lazy):
+        """Key to coalesce identical concurrent requests on, or None if the request should not be coalesced"""
+        if self.singleflight is None:
+            return None
+        key = request_key(method, path, args, kwargs)
+        return key and (key, dtype, lazy)
+
+    def _retry(self, response, attempt):
+        """Delay before retrying a throttled (HTTP 429) request, or None if it should not be retried"""
+        if self.rate_limiter is None or response.status_code != 429 or attempt >= self.rate_limiter.max_retries:
+            return None
+        return self.rate_limiter.on_throttled(response.headers, attempt)
+
+    def _cache_lookup(self, method, path, args, kwargs):
+        """Get (key, entry) for a request from the cache.
+        For a stale entry, the headers to revalidate it are added to the request's `kwargs`."""
+        if self.cache is None:
+            return None, None
+        key = self.cache.key(method, path, args, kwargs)
+        entry = self.cache.get(key) if key is not None else None
+        if entry is not None and not entry.fresh():
+            kwargs['headers'] = {**kwargs.get('headers', {}), **entry.validators()}
+        return key, entry
+
+    def _event(self, method, path):
+        return RequestEvent(method, path) if self.instrument is not None else None
+
+    def _cached(self, entry, dtype, lazy, event, cache='hit'):
+        if event is not None:
+            event.cache = cache
+        return timed(event, 'decode', entry.decode, dtype, lazy)
+
+    def _handle_response(self, key, entry, response, dtype, lazy, event=None):
+        if entry is not None and response.status_code == 304:
+            self.cache.revalidated(key, entry)
+            return self._cached(entry, dtype, lazy, event, 'revalidated')
         response.raise_for_status()
-        return response.json()
+        data = timed(event, 'parse', self.loads, response.content)
+        if key is not None:
+            entry = self.cache.put(key, data, len(response.content), response.headers)
+            if entry is not None:
+                return timed(event, 'decode', entry.decode, dtype, lazy)
+        return timed(event, 'decode', decode, data, dtype, lazy)
+
+
+class NSAPI(NSAPIBase):
+    def __init__(self, api_token, base_url=NSAPIBase.PATH, pool_size=10, cache=None, rate_limiter=None, coalesce=False,
+                 instrument=None, transport=None, json_backend='auto'):
+        self._session = None
+        self._session_lock = threading.Lock()
+        # A requests transport adapter, e.g. the ReplayAdapter or RecordingAdapter in nsapi.transport
+        self._session_options = (api_token, pool_size, transport)
+        super().__init__(None, base_url, cache, rate_limiter, coalesce, instrument, json_backend)
+
+    @property
+    def session(self):
+        """The requests.Session, created on first use so that requests is not imported before the first request"""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session(*self._session_options)
+        return self._session
+
+    @session.setter
+    def session(self, session):
+        self._session = session
+
+    @staticmethod
+    def _create_session(api_token, pool_size, transport):
+        import requests
+        from .adapter import TimedHTTPAdapter
+        session = requests.Session()
+        session.headers['Ocp-Apim-Subscription-Key'] = api_token
+        adapter = transport or TimedHTTPAdapter(pool_maxsize=pool_size)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def request(self, method, path, *args, dtype=None, lazy=False, priority=PRIORITY_DEFAULT, **kwargs):
+        flight = self._flight_key(method, path, args, kwargs, dtype, lazy)
+        if flight is not None:
+            return self.singleflight.do(flight, lambda: self._request(method, path, args, kwargs, dtype, lazy, priority))
+        return self._request(method, path, args, kwargs, dtype, lazy, priority)
+
+    def _request(self, method, path, args, kwargs, dtype, lazy, priority):
+        event = self._event(method, path)
+        try:
+            key, entry = self._cache_lookup(method, path, args, kwargs)
+            if entry is not None and entry.fresh():
+                result = self._cached(entry, dtype, lazy, event)
+            else:
+                response = self._send(method, path, args, kwargs, priority, event)
+                result = self._handle_response(key, entry, response, dtype, lazy, event)
+        except Exception as e:
+            if event is not None:
+                event._finish(self.instrument, error=e)
+            raise
+        if event is not None:
+            event._finish(self.instrument, result)
+        return result
+
+    def _send(self, method, path, args, kwargs, priority, event=None):
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                timed(event, 'wait', self.rate_limiter.acquire, priority)
+            start = time.perf_counter()
+            response = super().request(method, path, *args, **kwargs)
+            if event is not None:
+                event._response(response, start, time.perf_counter(), response.elapsed.total_seconds(),
+                                getattr(response, 'connect_time', None))
+            delay = self._retry(response, attempt)
+            if delay is None:
+                return response
+            time.sleep(delay)
+            attempt += 1
+
+    def stream(self, method, path, *args, chunk_size=64 * 1024, priority=PRIORITY_DEFAULT, **kwargs):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(priority)
+        with self.session.request(method, f'{self.path}/{path}', *args, stream=True, **kwargs) as response:
+            response.raise_for_status()
+            yield from response.iter_content(chunk_size)
+
+    def map_concurrent(self, function, items, max_workers=8):
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers)
+        try:
+            futures = {executor.submit(function, item): item for item in items}
+            for future in concurrent.futures.as_completed(futures):
+                error = future.exception()
+                yield futures[future], future.result() if error is None else error
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def request_key(method, path, args, kwargs):
+    """Hashable key identifying a GET request by its path and parameters, or None for other requests"""
+    if method != 'GET' or args or kwargs.keys() - {'params'}:
+        return None
+    params = kwargs.get('params') or {}
+    return path, tuple(sorted((key, str(value)) for key, value in params.items()))
+
+
+def decode(data, dtype=None, lazy=False):
+    """Decode a JSON response to `dtype`, or return it as-is if no dtype is given"""
+    if dtype is None:
+        return data
+    return dtype.lazy(data) if lazy else dtype(data)
 
 
 class TravelInformationEndpoint(APIEndpoint):
     def __init__(self, session):
         super().__init__(session, 'reisinformatie-api')
 
-    def trips(self, origin, destination, **kwargs) -> TravelAdvice:
+    def trips(self, origin, destination, lazy=False, priority=PRIORITY_INTERACTIVE, **kwargs) -> TravelAdvice:
         params = {'fromStation': origin, 'toStation': destination}
         params.update(kwargs)
-        return TravelAdvice(self.get('api/v3/trips', params=params))
+        return self.get('api/v3/trips', params=params, dtype=TravelAdvice, lazy=lazy, priority=priority)
 
-    def stations(self, q, country=None, limit=None) -> StationResponse:
-        params = {'q': q}
+    def trips_stream(self, origin, destination, lazy=False, priority=PRIORITY_INTERACTIVE, **kwargs) -> ArrayStream:
+        """Like trips(), but yields each Trip as soon as it has been received.
+        The other fields of the TravelAdvice are available on the stream once it is exhausted."""
+        params = {'fromStation': origin, 'toStation': destination}
+        params.update(kwargs)
+        return ArrayStream(self.stream('GET', 'api/v3/trips', params=params, priority=priority), TravelAdvice, 'trips', Trip, lazy)
+
+    def iter_trips(self, origin, destination, backward=False, limit=None, until=None, lazy=False, **kwargs) -> TripPager:
+        """Iterate over the trips of consecutive trips() pages, see TripPager"""
+        return TripPager(self, origin, destination, backward=backward, limit=limit, until=until, lazy=lazy, **kwargs)
+
+    def stations(self, q=None, country=None, limit=None, lazy=False) -> StationResponse:
+        params = {}
+        if q is not None:
+            params['q'] = q
         if country is not None:
             params['countryCodes'] = country
         if limit is not None:
             params['limit'] = limit
-        return StationResponse(self.get('api/v2/stations', params=params))
+        return self.get('api/v2/stations', params=params, dtype=StationResponse, lazy=lazy)
 
-    def arrivals(self, station, limit=None) -> RepresentationResponseArrivalsPayload:
+    def arrivals(self, station, limit=None, lazy=False, priority=PRIORITY_BACKGROUND) -> RepresentationResponseArrivalsPayload:
         params = {'station': station}
         if limit is not None:
             params['maxJourneys'] = limit
-        return RepresentationResponseArrivalsPayload(self.get('api/v2/arrivals', params))
+        return self.get('api/v2/arrivals', params=params, dtype=RepresentationResponseArrivalsPayload, lazy=lazy, priority=priority)
 
-    def departures(self, station, limit=None) -> RepresentationResponseDeparturesPayload:
+    def departures(self, station, limit=None, lazy=False, priority=PRIORITY_BACKGROUND) -> RepresentationResponseDeparturesPayload:
         params = {'station': station}
         if limit is not None:
             params['maxJourneys'] = limit
-        return RepresentationResponseDeparturesPayload(self.get('api/v2/departures', params))
+        return self.get('api/v2/departures', params=params, dtype=RepresentationResponseDeparturesPayload, lazy=lazy, priority=priority)
+
+    def arrivals_many(self, stations, limit=None, lazy=False, max_workers=8):
+        """Get the arrivals for many stations concurrently, yielding (station, payload or exception) as they complete"""
+        return self.map_concurrent(lambda station: self.arrivals(station, limit, lazy), stations, max_workers)
+
+    def watch(self, stations, interval=30.0, arrivals=False, **kwargs) -> BoardWatcher:
+        """Poll the departure (or arrival) boards of stations, yielding the changes, see BoardWatcher"""
+        return BoardWatcher(self, stations, interval=interval, arrivals=arrivals, **kwargs)
+
+    def departures_many(self, stations, limit=None, lazy=False, max_workers=8):
+        """Get the departures for many stations concurrently, yielding (station, payload or exception) as they complete"""
+        return self.map_concurrent(lambda station: self.departures(station, limit, lazy), stations, max_workers)
 
-    def journey(self, train=None, journey_id=None):
+    def journey(self, train=None, journey_id=None, lazy=False) -> RepresentationResponseJourney:
         if journey_id is not None:
             params = {'id': journey_id}
         elif train is not None:
             params = {'train': train}
         else:
             raise ValueError('Specify either `train` or `journey_id`.')
-        return RepresentationResponseJourney(self.get('api/v2/journey', params))
+        return self.get('api/v2/journey', params=params, dtype=RepresentationResponseJourney, lazy=lazy)
@@ -0,0 +1,128 @@
+import time
+import threading
+import collections
+
+from .api import decode, request_key
+
+# Seconds to keep responses, by (the end of) the request path
+DEFAULT_TTL = {
+    'api/v2/stations': 24 * 60 * 60,
+    'api/v2/departures': 30,
+    'api/v2/arrivals': 30,
+    'api/v2/journey': 30,
+}
+
+
+class CacheEntry:
+    def __init__(self, data, size, expires, etag=None, last_modified=None):
+        self.data = data
+        self.size = size
+        self.expires = expires
+        self.etag = etag
+        self.last_modified = last_modified
+        self.decoded = {}       # (dtype, lazy) -> decoded response
+
+    def fresh(self):
+        return time.monotonic() < self.expires
+
+    def validators(self):
+        """Headers for a conditional request revalidating this entry"""
+        headers = {}
+        if self.etag is not None:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified is not None:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def decode(self, dtype, lazy):
+        """Decode the response, reusing the result of earlier calls. Decoded objects are shared, treat them as read-only."""
+        if dtype is None:
+            return self.data
+        key = (dtype, lazy)
+        decoded = self.decoded.get(key)
+        if decoded is None:
+            decoded = self.decoded.setdefault(key, decode(self.data, dtype, lazy))
+        return decoded
+
+
+class ResponseCache:
+    """In-memory LRU cache of GET responses, bounded by the number of entries and their total size in bytes.
+    Expired entries with an ETag or Last-Modified header are kept, and revalidated with a conditional request."""
+    def __init__(self, ttl=None, default_ttl=0, max_entries=1024, max_bytes=64 * 2**20):
+        self.ttl = dict(DEFAULT_TTL)
+        if ttl is not None:
+            self.ttl.update(ttl)
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, method, path, args, kwargs):
+        """The cache key of a request, or None if it can not be cached"""
+        return request_key(method, path, args, kwargs)
+
+    def ttl_for(self, path):
+        for suffix, ttl in self.ttl.items():
+            if path.endswith(suffix):
+                return ttl
+        return self.default_ttl
+
+    def get(self, key):
+        """Get a fresh entry, or a stale entry that can be revalidated"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.fresh():
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry
+            # A stale entry needs a request either way, it only counts as revalidated once the server confirms it
+            self.misses += 1
+            if entry.etag is None and entry.last_modified is None:
+                self._remove(key)
+                return None
+            return entry
+
+    def put(self, key, data, size, headers):
+        """Store a response. Returns the new entry, or None if the response is not cached."""
+        ttl = self.ttl_for(key[0])
+        entry = CacheEntry(data, size, time.monotonic() + ttl, headers.get('ETag'), headers.get('Last-Modified'))
+        if (ttl <= 0 and entry.etag is None and entry.last_modified is None) or size > self.max_bytes:
+            return None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self.bytes += size
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+        return entry
+
+    def revalidated(self, key, entry):
+        """The server confirmed (HTTP 304) that a stale entry is still valid"""
+        with self._lock:
+            self.revalidations += 1
+            entry.expires = time.monotonic() + self.ttl_for(key[0])
+            if self._entries.get(key) is entry:
+                self._entries.move_to_end(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        return {'entries': len(self._entries), 'bytes': self.bytes, 'hits': self.hits, 'misses': self.misses,
+                'revalidations': self.revalidations, 'evictions': self.evictions}
+
+    def _remove(self, key):
+        self.bytes -= self._entries.pop(key).size
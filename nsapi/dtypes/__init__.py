@@ -1,10 +1,16 @@
 import sys
+import json
+import builtins
 import typing
 import datetime
 import logging
 
+from . import timestamps, drift
+
 logger = logging.getLogger(__name__)
 
+_interning = None       # Active interning.Interning, if enabled
+
 # class NSDataMeta(type):
 #     def __call__(cls, data):
 #         self = super().__call__(data)
@@ -54,48 +60,202 @@ logger = logging.getLogger(__name__)
 #         ...
 
 class NSData:
+    __slots__ = ('_lazy', '_extra')
+
     def __init__(self, data=None, **kwargs):
         if data is None:
             data = kwargs
+        self._decode(data, False)
+
+    @classmethod
+    def lazy(cls, data):
+        """Decode `data`, leaving nested objects, lists and datetimes as JSON until they are first accessed"""
+        self = cls.__new__(cls)
+        self._decode(data, True)
+        return self
+
+    @classmethod
+    def from_json(cls, raw, lazy=False, loads=json.loads):
+        """Decode raw JSON (bytes or str), parsed with `loads` (see nsapi.json_backend)"""
+        data = loads(raw)
+        return cls.lazy(data) if lazy else cls(data)
+
+    def to_snapshot(self) -> bytes:
+        """Serialize to a compact binary snapshot, see nsapi.dtypes.snapshot"""
+        from . import snapshot
+        return snapshot.dumps(self)
+
+    @classmethod
+    def from_snapshot(cls, data: bytes):
+        from . import snapshot
+        return snapshot.loads(cls, data)
+
+    def _decode(self, data, lazy):
         cls = self.__class__
-        data = {key.lower(): value for key,value in data.items()}
-        for attr, typehint in typing.get_type_hints(cls).items():
-            if attr.lower() in data:
-                setattr(self, attr, cls._resolve_data_type(typehint, data.pop(attr.lower())))
+        decoder = cls.__dict__.get('_decoder') or cls._compile_decoder()
+        if decoder.generated is not None and not lazy and decoder.generated(data, self) is not None:
+            return
+        fields = decoder.fields
+        values = dict.fromkeys(decoder.attributes)
+        extra = {}
+        pending = None
+        for key, value in data.items():
+            field = fields.get(key)
+            if field is None:
+                field = fields.get(key.lower())
+                if field is None:
+                    extra[key] = value      # As received, for the drift report
+                    continue
+            attr, convert, _ = field
+            if convert is None or value is None:
+                values[attr] = value
+            elif lazy:
+                if pending is None:
+                    pending = {}
+                pending[attr] = value
+                del values[attr]
             else:
-                setattr(self, attr, None)
-        if hasattr(self, '__post_init__'):
-            self.__post_init__(data)
-        if len(data) > 0:
-            logger.warning(f'{cls} received extra attributes: {data}')
+                values[attr] = convert(value)
+        if pending is not None:
+            self._lazy = pending
+        if decoder.slotted:
+            for attr, value in values.items():
+                setattr(self, attr, value)
+        else:
+            self.__dict__.update(values)
+        if decoder.post_init is not None:
+            # __post_init__ looks up (and pops the keys it uses from) the lowercase keys
+            lowered = {key.lower(): value for key, value in extra.items()}
+            decoder.post_init(self, lowered)
+            extra = {key: value for key, value in extra.items() if key.lower() in lowered}
+        if len(extra) > 0:
+            collector = drift.collector
+            collector.record(cls, extra)
+            if collector.retain:
+                self._extra = extra
+
+    def extra_attributes(self) -> dict:
+        """The received attributes that are not in the dtype, if they are retained (see nsapi.dtypes.drift)"""
+        try:
+            return self._extra
+        except AttributeError:
+            return {}
+
+    def __getattr__(self, name):
+        # Only called when normal lookup fails, i.e. for attributes that are still pending in lazy mode
+        if name != '_lazy':
+            pending = getattr(self, '_lazy', None)
+            if pending is not None and name in pending:
+                convert = self._decoder.fields[name][2]
+                value = convert(pending[name])
+                setattr(self, name, value)
+                pending.pop(name, None)
+                return value
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
     @classmethod
-    def _resolve_data_type(cls, typehint, data):
-        origin = typing.get_origin(typehint)
-        if origin is not None and origin is typing.Union:
-            # Optional[...]
-            args = typing.get_args(typehint)
-            if len(args) == 2 and type(None) in args:
-                typehint = args[0] if issubclass(args[1], type(None)) else args[1]
-                return cls._resolve_data_type(typehint, data)
-            raise ValueError('Union[x, y] not supported')
-        if origin is not None and issubclass(origin, list):
-            # list[...]
-            typehint = typing.get_args(typehint)[0]
-            return [cls._resolve_data_type(typehint, item) for item in data]
-        if origin is not None and issubclass(origin, dict):
-            # dict[..., ...]
-            key_hint, value_hint = typing.get_args(typehint)
-            return {cls._resolve_data_type(key_hint, key): cls._resolve_data_type(value_hint, value) for key, value in data.items()}
-        if isinstance(typehint, str):
-            # "..."
-            dtype = getattr(sys.modules[cls.__module__], typehint)
-            return dtype(data)
-        if issubclass(typehint, datetime.datetime):
-            return datetime.datetime.strptime(data, "%Y-%m-%dT%H:%M:%S%z")
-        if issubclass(typehint, datetime.date):
-            return datetime.datetime.strptime(data, '%Y-%m-%d').date()
-        if typehint is not None and issubclass(typehint, NSData):
-            # NSData subclass
-            return typehint(data)
-        return data
+    def _compile_decoder(cls):
+        """Build the decoding plan for this class and cache it on the class"""
+        decoder = _Decoder()
+        for klass in reversed(cls.__mro__):
+            annotations = klass.__dict__.get('__annotations__', {})
+            for attr, typehint in annotations.items():
+                module = sys.modules[klass.__module__]
+                convert = _compile_converter(typehint, module, False)
+                lazy_convert = _compile_converter(typehint, module, True)
+                if convert is None and _interning is not None and _interning.interns(attr, typehint, module):
+                    convert = lazy_convert = _interning.intern
+                field = (attr, convert, lazy_convert)
+                decoder.attributes.append(attr)
+                decoder.fields[attr] = field
+                decoder.fields[attr.lower()] = field
+        decoder.slotted = cls.__dictoffset__ == 0
+        decoder.post_init = getattr(cls, '__post_init__', None)
+        if _interning is None:
+            decoder.generated = cls.__dict__.get('_from_json')
+        cls._decoder = decoder
+        return decoder
+
+
+def precompile(*modules):
+    """Import the dtypes and compile the decoders of all their classes up front, e.g. while a serverless function
+    initializes, instead of on the first response. Defaults to the travel_information module.
+    Returns the number of classes."""
+    if not modules:
+        from . import travel_information
+        modules = (travel_information,)
+    count = 0
+    for module in modules:
+        for cls in vars(module).values():
+            if isinstance(cls, type) and issubclass(cls, NSData) and cls.__module__ == module.__name__:
+                if '_decoder' not in cls.__dict__:
+                    cls._compile_decoder()
+                count += 1
+    return count
+
+
+class _Decoder:
+    def __init__(self):
+        self.attributes = []        # Attribute names, in declaration order
+        self.fields = {}            # JSON key (exact and lowercase) -> (attribute, converter, lazy converter)
+        self.slotted = False        # Instances have no __dict__, attributes are stored in __slots__
+        self.post_init = None       # The __post_init__(self, extra) hook of the class, if any
+        self.generated = None       # Decoder generated by autogen (returning None for JSON it does not handle), if any
+
+
+def _resolve(typehint, module):
+    """Resolve a forward reference ("...") in `module`. Returns None for unknown types, whose values are kept as JSON."""
+    if isinstance(typehint, typing.ForwardRef):
+        typehint = typehint.__forward_arg__
+    if isinstance(typehint, str):
+        resolved = getattr(module, typehint, None)
+        if resolved is None:
+            resolved = getattr(builtins, typehint, None)
+        if resolved is None:
+            logger.debug(f'Unknown type "{typehint}" in {module.__name__}, using raw JSON values')
+        return resolved
+    return typehint
+
+
+def _compile_converter(typehint, module, lazy):
+    """Return a function converting a JSON value to `typehint`, or None if the value can be used as-is.
+    In `lazy` mode, nested NSData objects are created lazily as well."""
+    typehint = _resolve(typehint, module)
+    if typehint is None:
+        return None
+    origin = typing.get_origin(typehint)
+    if origin is typing.Union:
+        # Optional[...]
+        args = typing.get_args(typehint)
+        if len(args) == 2 and type(None) in args:
+            typehint = args[0] if args[1] is type(None) else args[1]
+            return _compile_converter(typehint, module, lazy)
+        raise ValueError('Union[x, y] not supported')
+    if origin is not None and issubclass(origin, list):
+        # list[...]
+        convert = _compile_converter(typing.get_args(typehint)[0], module, lazy)
+        if convert is None:
+            return None
+        return lambda data: [convert(item) for item in data]
+    if origin is not None and issubclass(origin, dict):
+        # dict[..., ...]
+        key_hint, value_hint = typing.get_args(typehint)
+        convert_key = _compile_converter(key_hint, module, lazy) or _identity
+        convert_value = _compile_converter(value_hint, module, lazy) or _identity
+        return lambda data: {convert_key(key): convert_value(value) for key, value in data.items()}
+    if not isinstance(typehint, type):
+        return None
+    if issubclass(typehint, datetime.datetime):
+        return timestamps.parse_datetime
+    if issubclass(typehint, datetime.date):
+        return timestamps.parse_date
+    if issubclass(typehint, NSData):
+        # NSData subclass
+        if _interning is not None and typehint in _interning.classes:
+            return _interning.converter(typehint)
+        return typehint.lazy if lazy else typehint
+    return None
+
+
+def _identity(data):
+    return data
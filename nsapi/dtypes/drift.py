@@ -0,0 +1,79 @@
+"""Schema drift: attributes in responses that the dtypes do not know about, e.g. fields NS added to the API.
+
+    from nsapi.dtypes import drift
+    drift.collector.summary()       # {'Stop': {'newField': {'count': 51234, 'sample': ...}}}
+
+Unknown attributes are counted per class and key, with the first value as a sample. Keys seen for the first time are
+logged as one warning per `interval` seconds at most, instead of a warning for every object. Keys still waiting for
+the next warning are logged by flush(), which is called at exit.
+With `retain`, the unknown attributes are also kept on the objects, see NSData.extra_attributes().
+Replace `collector` with a DriftCollector of your own to change the settings.
+"""
+import time
+import atexit
+import logging
+import reprlib
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class DriftCollector:
+    def __init__(self, interval=60.0, retain=False):
+        self.interval = interval
+        self.retain = retain
+        self.counts = {}            # (class, key) -> number of objects received with the key
+        self.samples = {}           # (class, key) -> first value received
+        self._new = []              # (class, key) first seen since the last warning
+        self._next_warning = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, cls, extra):
+        """Count the unknown attributes `extra` received for an object of `cls`"""
+        with self._lock:
+            for key, value in extra.items():
+                field = (cls, key)
+                count = self.counts.get(field)
+                if count is None:
+                    count = 0
+                    self.samples[field] = value
+                    self._new.append(field)
+                self.counts[field] = count + 1
+            if not self._new or time.monotonic() < self._next_warning:
+                return
+            new = self._take_new()
+        self._warn(new)
+
+    def flush(self):
+        """Log the keys seen for the first time that have not been logged yet"""
+        with self._lock:
+            new = self._take_new() if self._new else []
+        self._warn(new)
+
+    def _take_new(self):
+        new, self._new = self._new, []
+        self._next_warning = time.monotonic() + self.interval
+        return new
+
+    def _warn(self, new):
+        if new:
+            logger.warning('Received attributes unknown to the dtypes: ' + ', '.join(
+                f'{cls.__name__}.{key} (e.g. {reprlib.repr(self.samples[cls, key])})' for cls, key in new))
+
+    def summary(self):
+        with self._lock:
+            summary = {}
+            for (cls, key), count in self.counts.items():
+                summary.setdefault(cls.__name__, {})[key] = {'count': count, 'sample': self.samples[cls, key]}
+            return summary
+
+    def clear(self):
+        with self._lock:
+            self.counts.clear()
+            self.samples.clear()
+            self._new.clear()
+
+
+collector = DriftCollector()
+# Through the module global, so that a replaced collector is flushed
+atexit.register(lambda: collector.flush())
@@ -0,0 +1,132 @@
+"""Opt-in deduplication of values repeated across responses, to save memory when many responses are kept around.
+
+    from nsapi.dtypes import interning
+    interning.enable()
+
+Low-cardinality string fields (station names and codes, tracks, categories, statuses, ...) are interned, and objects of
+small immutable classes (Product, RouteStation, StationsNamen, NesColor) with identical content are shared through a
+pool of weak references. Shared objects must be treated as read-only.
+This trades decode time for memory: with interning the generic decoders are used instead of the generated ones, which
+makes decoding around 30-40% slower (see benchmarks/bench_interning.py, where it saves two thirds of the memory).
+Enabling or disabling recompiles the decoders, it only affects objects decoded afterwards.
+"""
+import sys
+import typing
+import weakref
+
+from . import NSData, _resolve
+
+# Attribute names of string fields that are interned
+FIELDS = frozenset({
+    'name', 'uicCode', 'UICCode', 'EVACode', 'code', 'countryCode', 'land', 'stationType', 'mediumName',
+    'direction', 'origin', 'destination', 'trainCategory', 'categoryCode', 'operatorCode', 'operatorName', 'type',
+    'status', 'kind', 'departureStatus', 'arrivalStatus', 'crowdForecast', 'prognosisType', 'departurePrognosisType',
+    'arrivalPrognosisType', 'exitSide', 'checkinStatus', 'travelType', 'noteType', 'category', 'trainType',
+    'classification', 'spoorNummer', 'plannedTrack', 'actualTrack', 'plannedDepartureTrack', 'actualDepartureTrack',
+    'plannedArrivalTrack', 'actualArrivalTrack', 'shortCategoryName', 'longCategoryName', 'displayName',
+})
+
+# Names of the classes whose objects are shared, they need a __weakref__ slot
+CLASSES = ('Product', 'RouteStation', 'StationsNamen', 'NesColor')
+
+
+class Pool:
+    """Objects keyed on their class and JSON content, holding them only as long as they are used elsewhere.
+    At most `max_size` objects of each class are pooled, objects decoded when that is reached are not shared."""
+    def __init__(self, max_size=100_000):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._objects = {}          # class -> JSON content -> weak reference to the object
+
+    def get(self, cls, data):
+        return self.getter(cls)(data)
+
+    def getter(self, cls):
+        """Function returning the pooled object of `cls` for JSON data, for use as a converter.
+        The references are looked up in plain dicts: a WeakValueDictionary costs a Python call per lookup."""
+        objects = self._objects.setdefault(cls, {})
+        pool = self
+
+        def get(data):
+            try:
+                key = tuple(data.items())
+                ref = objects.get(key)
+            except TypeError:
+                # Nested (unhashable) content
+                return cls(data)
+            if ref is not None:
+                obj = ref()
+                if obj is not None:
+                    pool.hits += 1
+                    return obj
+            pool.misses += 1
+            obj = cls(data)
+            if len(objects) < pool.max_size:
+                objects[key] = weakref.ref(obj, lambda ref, key=key: objects.get(key) is ref and objects.pop(key))
+            return obj
+        return get
+
+    def __len__(self):
+        return sum(len(objects) for objects in self._objects.values())
+
+
+class Interning:
+    def __init__(self, fields, classes, max_size):
+        self.fields = frozenset(fields)
+        self.classes = frozenset(classes)
+        self.pool = Pool(max_size)
+
+    def interns(self, attr, typehint, module):
+        """Whether to intern a field: string fields with a name in `fields`"""
+        if attr not in self.fields:
+            return False
+        typehint = _resolve(typehint, module)
+        if typing.get_origin(typehint) is typing.Union:
+            typehint = next(arg for arg in typing.get_args(typehint) if arg is not type(None))
+        return typehint is str
+
+    @staticmethod
+    def intern(value):
+        return sys.intern(value) if type(value) is str else value
+
+    def converter(self, cls):
+        return self.pool.getter(cls)
+
+
+def enable(fields=FIELDS, classes=None, max_size=100_000):
+    """Start interning. `classes` are the NSData classes to share, by default those named in CLASSES."""
+    from . import travel_information
+    if classes is None:
+        classes = [getattr(travel_information, name) for name in CLASSES]
+    for cls in classes:
+        if cls.__weakrefoffset__ == 0:
+            raise TypeError(f'{cls.__name__} can not be shared, it has no __weakref__ slot')
+    _set(Interning(fields, classes, max_size))
+
+
+def disable():
+    _set(None)
+
+
+def stats():
+    interning = _dtypes()._interning
+    if interning is None:
+        return None
+    pool = interning.pool
+    return {'pooled': len(pool), 'hits': pool.hits, 'misses': pool.misses}
+
+
+def _dtypes():
+    return sys.modules[NSData.__module__]
+
+
+def _set(interning):
+    _dtypes()._interning = interning
+    # Drop the compiled decoders, they are rebuilt with(out) interning on first use
+    classes = [NSData]
+    while classes:
+        cls = classes.pop()
+        if '_decoder' in cls.__dict__:
+            delattr(cls, '_decoder')
+        classes.extend(cls.__subclasses__())
@@ -0,0 +1,176 @@
+"""Compact binary snapshots of decoded NSData trees.
+
+Objects are stored as tuples of their attribute values, in the order of the type hints, so field names are not
+repeated per object. The tuples are serialized with `marshal`. Datetimes and dates are stored as ISO strings.
+A snapshot starts with a hash of the type hints of every class in the tree, and loading it with a different schema
+(e.g. after regenerating the dtypes) raises StaleSnapshotError.
+
+Like pickle, snapshots are not safe against maliciously constructed data: only load snapshots you created yourself.
+"""
+import sys
+import typing
+import marshal
+import hashlib
+import datetime
+import functools
+
+from . import NSData, _resolve
+
+MAGIC = b'NSS'
+FORMAT_VERSION = 1
+HEADER_SIZE = len(MAGIC) + 2 + 8
+
+
+class StaleSnapshotError(ValueError):
+    """The snapshot was made with a different version of the dtypes (or of the snapshot format)"""
+
+
+def dumps(obj: NSData) -> bytes:
+    codec = _codec(type(obj))
+    return MAGIC + bytes((FORMAT_VERSION, marshal.version)) + codec.schema + marshal.dumps(codec.dump(obj), marshal.version)
+
+
+def loads(cls, data: bytes):
+    codec = _codec(cls)
+    header = data[:HEADER_SIZE]
+    if header[:len(MAGIC)] != MAGIC:
+        raise ValueError('Not an NSData snapshot')
+    if header != MAGIC + bytes((FORMAT_VERSION, marshal.version)) + codec.schema:
+        raise StaleSnapshotError(f'Snapshot does not match the current {cls.__name__} schema')
+    return codec.load(marshal.loads(data[HEADER_SIZE:]))
+
+
+def schema_hash(cls) -> bytes:
+    return _codec(cls).schema
+
+
+class _Codec:
+    def __init__(self, cls):
+        self.cls = cls
+        self.attributes = []
+        self.dumpers = []           # Per attribute: function converting a value to marshallable data, or None
+        self.load = None            # Function building an object from its tuple of values, see _compile_load
+        self.schema = None
+
+    def dump(self, obj):
+        values = []
+        for attr, dump in zip(self.attributes, self.dumpers):
+            value = getattr(obj, attr, None)
+            values.append(value if dump is None or value is None else dump(value))
+        return tuple(values)
+
+
+def _codec(cls):
+    codec = cls.__dict__.get('_snapshot_codec')
+    if codec is not None:
+        return codec
+    codec = _Codec(cls)
+    cls._snapshot_codec = codec     # Stored before the fields are compiled, for recursive types
+    loaders = []
+    namespace = {'_new': object.__new__, '_cls': cls}
+    for klass in reversed(cls.__mro__):
+        module = sys.modules[klass.__module__]
+        for attr, typehint in klass.__dict__.get('__annotations__', {}).items():
+            codec.attributes.append(attr)
+            codec.dumpers.append(_dumper(typehint, module))
+            loaders.append(_load_expression(typehint, module, f'v{len(loaders)}', namespace))
+    codec.load = _compile_load(codec.attributes, loaders, namespace)
+    digest = hashlib.sha256()
+    for klass in sorted(_schema_classes(cls), key=lambda klass: (klass.__module__, klass.__qualname__)):
+        digest.update(f'{klass.__module__}.{klass.__qualname__}{klass.__dict__.get("__annotations__", {})!r}'.encode())
+    codec.schema = digest.digest()[:8]
+    return codec
+
+
+def _dumper(typehint, module):
+    """Function converting a value of `typehint` to marshallable data, or None if the value can be stored as-is"""
+    typehint = _resolve(typehint, module)
+    if typehint is None:
+        return None
+    origin = typing.get_origin(typehint)
+    if origin is typing.Union:
+        args = typing.get_args(typehint)
+        return _dumper(args[0] if args[1] is type(None) else args[1], module)
+    if origin is not None and issubclass(origin, list):
+        dump = _dumper(typing.get_args(typehint)[0], module)
+        if dump is None:
+            return None
+        return lambda values: [dump(value) for value in values]
+    if not isinstance(typehint, type):
+        return None
+    if issubclass(typehint, datetime.datetime):
+        return datetime.datetime.isoformat
+    if issubclass(typehint, datetime.date):
+        return datetime.date.isoformat
+    if issubclass(typehint, NSData):
+        # Looked up on use, as the codec of the class may still be under construction
+        return lambda obj: _codec(typehint).dump(obj)
+    return None
+
+
+def _load_expression(typehint, module, value, namespace):
+    """Python expression restoring a value of `typehint` from its stored form `value`, or None if it is stored as-is.
+    The functions and codecs it uses are added to `namespace`."""
+    typehint = _resolve(typehint, module)
+    if typehint is None:
+        return None
+    origin = typing.get_origin(typehint)
+    if origin is typing.Union:
+        args = typing.get_args(typehint)
+        return _load_expression(args[0] if args[1] is type(None) else args[1], module, value, namespace)
+    if origin is not None and issubclass(origin, list):
+        item = _load_expression(typing.get_args(typehint)[0], module, 'item', namespace)
+        return None if item is None else f'[{item} for item in {value}]'
+    if not isinstance(typehint, type):
+        return None
+    name = f'_load{len(namespace)}'
+    if issubclass(typehint, datetime.datetime):
+        namespace[name] = _load_datetime
+    elif issubclass(typehint, datetime.date):
+        namespace[name] = _load_date
+    elif issubclass(typehint, NSData):
+        # The codec's load is looked up on use, as the codec may still be under construction
+        namespace[name] = _codec(typehint)
+        return f'{name}.load({value})'
+    else:
+        return None
+    return f'{name}({value})'
+
+
+def _compile_load(attributes, loaders, namespace):
+    """Compile a function assigning the stored values to a new object with straight-line code, like the generated
+    decoders (see travel_information_decoders.py). A loop over the attributes with setattr() is three times slower."""
+    lines = ['def load(values):']
+    if attributes:
+        lines.append(f'    {", ".join(f"v{i}" for i in range(len(attributes)))}, = values')
+    lines.append('    obj = _new(_cls)')
+    for i, (attr, load) in enumerate(zip(attributes, loaders)):
+        lines.append(f'    obj.{attr} = v{i}' if load is None else f'    obj.{attr} = None if v{i} is None else {load}')
+    lines.append('    return obj')
+    exec('\n'.join(lines), namespace)
+    return namespace['load']
+
+
+def _schema_classes(cls, seen=None):
+    """All NSData classes reachable from the type hints of `cls`"""
+    seen = set() if seen is None else seen
+    if cls in seen:
+        return seen
+    seen.add(cls)
+    for klass in cls.__mro__:
+        module = sys.modules[klass.__module__]
+        for typehint in klass.__dict__.get('__annotations__', {}).values():
+            for found in _nsdata_types(typehint, module):
+                _schema_classes(found, seen)
+    return seen
+
+
+def _nsdata_types(typehint, module):
+    typehint = _resolve(typehint, module)
+    if isinstance(typehint, type) and issubclass(typehint, NSData):
+        return [typehint]
+    return [found for arg in typing.get_args(typehint) for found in _nsdata_types(arg, module)]
+
+
+_load_datetime = functools.lru_cache(4096)(datetime.datetime.fromisoformat)
+_load_date = functools.lru_cache(1024)(datetime.date.fromisoformat)
@@ -0,0 +1,39 @@
+"""Parsing of the timestamps used by the NS API, e.g. `2023-05-01T08:15:00+0200`"""
+import re
+import datetime
+import functools
+
+_TIMESTAMP = re.compile(r'(\d{4})-(\d\d)-(\d\d)T(\d\d):(\d\d):(\d\d)([+-])(\d\d)(\d\d)', re.ASCII)
+_DATE = re.compile(r'(\d{4})-(\d\d)-(\d\d)', re.ASCII)
+_timezones = {}
+
+
+def _timezone(sign: str, hours: str, minutes: str) -> datetime.timezone:
+    """Get a shared timezone instance for a UTC offset"""
+    key = sign + hours + minutes
+    tz = _timezones.get(key)
+    if tz is None:
+        offset = datetime.timedelta(hours=int(hours), minutes=int(minutes))
+        tz = datetime.timezone.utc if not offset else datetime.timezone(-offset if sign == '-' else offset)
+        tz = _timezones.setdefault(key, tz)
+    return tz
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_datetime(value: str) -> datetime.datetime:
+    match = _TIMESTAMP.fullmatch(value)
+    if match is None:
+        # Not in the usual NS format, let strptime decide whether it is valid
+        return datetime.datetime.strptime(value, "%Y-%m-%dT%H:%M:%S%z")
+    year, month, day, hour, minute, second, sign, tz_hours, tz_minutes = match.groups()
+    return datetime.datetime(int(year), int(month), int(day), int(hour), int(minute), int(second),
+                             tzinfo=_timezone(sign, tz_hours, tz_minutes))
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_date(value: str) -> datetime.date:
+    match = _DATE.fullmatch(value)
+    if match is None:
+        return datetime.datetime.strptime(value, '%Y-%m-%d').date()
+    year, month, day = match.groups()
+    return datetime.date(int(year), int(month), int(day))
@@ -5,6 +5,8 @@ from . import NSData
 
 
 class Arrival(NSData):
+    __slots__ = ('origin', 'name', 'plannedDateTime', 'plannedTimeZoneOffset', 'actualDateTime', 'actualTimeZoneOffset', 'plannedTrack', 'actualTrack', 'product', 'trainCategory', 'cancelled', 'journeyDetailRef', 'messages', 'arrivalStatus')
+
     origin: typing.Optional[str]
     name: str
     plannedDateTime: typing.Optional[datetime.datetime]
@@ -22,6 +24,8 @@ class Arrival(NSData):
 
 
 class ArrivalOrDeparture(NSData):
+    __slots__ = ('product', 'origin', 'destination', 'plannedTime', 'actualTime', 'delayInSeconds', 'plannedTrack', 'actualTrack', 'cancelled', 'punctuality', 'crowdForecast', 'shorterStockClassification', 'stockIdentifiers')
+
     product: "Product"
     origin: typing.Optional["Station"]
     destination: typing.Optional["Station"]
@@ -38,11 +42,15 @@ class ArrivalOrDeparture(NSData):
 
 
 class ArrivalsPayload(NSData):
+    __slots__ = ('source', 'arrivals')
+
     source: str
     arrivals: list["Arrival"]
 
 
 class CalamitiesResourceCalamity(NSData):
+    __slots__ = ('id', 'titel', 'beschrijving', 'lastModified', 'type', 'url', 'buttonPositie', 'laatstGewijzigd', 'volgendeUpdate', 'calltoactionbuttons', 'bodyitems')
+
     id: typing.Optional[str]
     titel: typing.Optional[str]
     beschrijving: typing.Optional[str]
@@ -57,11 +65,15 @@ class CalamitiesResourceCalamity(NSData):
 
 
 class CalamitiesResponse(NSData):
+    __slots__ = ('calamiteit', 'meldingen')
+
     calamiteit: typing.Optional["CalamitiesResourceCalamity"]
     meldingen: typing.Optional[list["CalamitiesResourceCalamity"]]
 
 
 class CalamityBodyItem(NSData):
+    __slots__ = ('objectType', 'content', 'titel', 'downloads', 'links')
+
     objectType: str
     content: typing.Optional[str]
     titel: typing.Optional[str]
@@ -70,6 +82,8 @@ class CalamityBodyItem(NSData):
 
 
 class CallToActionButton(NSData):
+    __slots__ = ('callToAction', 'url', 'type', 'voorleestitel')
+
     callToAction: typing.Optional[str]
     url: typing.Optional[str]
     type: typing.Optional[str]
@@ -77,17 +91,23 @@ class CallToActionButton(NSData):
 
 
 class CoachCrowdForecast(NSData):
+    __slots__ = ('paddingLeft', 'width', 'classification')
+
     paddingLeft: int
     width: int
     classification: str
 
 
 class Coordinate(NSData):
+    __slots__ = ('lat', 'lng')
+
     lat: float
     lng: float
 
 
 class Departure(NSData):
+    __slots__ = ('direction', 'name', 'plannedDateTime', 'plannedTimeZoneOffset', 'actualDateTime', 'actualTimeZoneOffset', 'plannedTrack', 'actualTrack', 'product', 'trainCategory', 'cancelled', 'journeyDetailRef', 'routeStations', 'messages', 'departureStatus')
+
     direction: typing.Optional[str]
     name: str
     plannedDateTime: typing.Optional[datetime.datetime]
@@ -106,11 +126,15 @@ class Departure(NSData):
 
 
 class DeparturesPayload(NSData):
+    __slots__ = ('source', 'departures')
+
     source: str
     departures: list["Departure"]
 
 
 class Download(NSData):
+    __slots__ = ('title', 'url', 'contentLength', 'mimeType', 'lastModified')
+
     title: typing.Optional[str]
     url: typing.Optional[str]
     contentLength: int
@@ -119,15 +143,21 @@ class Download(NSData):
 
 
 class Eco(NSData):
+    __slots__ = ('co2kg',)
+
     co2kg: float
 
 
 class EticketNotBuyableReason(NSData):
+    __slots__ = ('reason', 'description')
+
     reason: str
     description: typing.Optional[str]
 
 
 class FareLeg(NSData):
+    __slots__ = ('origin', 'destination', 'operator', 'productTypes', 'fares')
+
     origin: "TripOriginDestination"
     destination: "TripOriginDestination"
     operator: typing.Optional[str]
@@ -136,17 +166,23 @@ class FareLeg(NSData):
 
 
 class FareLegStop(NSData):
+    __slots__ = ('varCode', 'name')
+
     varCode: int
     name: typing.Optional[str]
 
 
 class FareRoute(NSData):
+    __slots__ = ('routeId', 'origin', 'destination')
+
     routeId: typing.Optional[str]
     origin: "FareLegStop"
     destination: "FareLegStop"
 
 
 class InternationalPrice(NSData):
+    __slots__ = ('priceInCents', 'priceInCentsExcludingSupplement', 'product', 'travelClass', 'link')
+
     priceInCents: int
     priceInCentsExcludingSupplement: int
     product: str
@@ -155,6 +191,8 @@ class InternationalPrice(NSData):
 
 
 class Journey(NSData):
+    __slots__ = ('notes', 'productNumbers', 'stops', 'allowCrowdReporting', 'source')
+
     notes: list["Note"]
     productNumbers: list[str]
     stops: list["JourneyStop"]
@@ -163,11 +201,15 @@ class Journey(NSData):
 
 
 class JourneyDetailLink(NSData):
+    __slots__ = ('type', 'link')
+
     type: str
     link: "Link"
 
 
 class JourneyRegistrationParameters(NSData):
+    __slots__ = ('url', 'searchUrl', 'status', 'bicycleReservationRequired', 'availability')
+
     url: typing.Optional[str]
     searchUrl: str
     status: str
@@ -176,6 +218,8 @@ class JourneyRegistrationParameters(NSData):
 
 
 class JourneyStop(NSData):
+    __slots__ = ('id', 'stop', 'previousStopId', 'nextStopId', 'destination', 'status', 'kind', 'arrivals', 'departures', 'actualStock', 'plannedStock', 'platformFeatures', 'coachCrowdForecast')
+
     id: str
     stop: "Station"
     previousStopId: list[str]
@@ -192,6 +236,8 @@ class JourneyStop(NSData):
 
 
 class Leg(NSData):
+    __slots__ = ('idx', 'name', 'travelType', 'direction', 'cancelled', 'changePossible', 'alternativeTransport', 'journeyDetailRef', 'origin', 'destination', 'product', 'sharedModality', 'notes', 'messages', 'stops', 'steps', 'coordinates', 'crowdForecast', 'punctuality', 'crossPlatformTransfer', 'shorterStock', 'changeCouldBePossible', 'shorterStockWarning', 'shorterStockClassification', 'journeyDetail', 'reachable', 'plannedDurationInMinutes', 'travelAssistanceDeparture', 'travelAssistanceArrival', 'overviewPolyLine')
+
     idx: typing.Optional[str]
     name: typing.Optional[str]
     travelType: typing.Optional[str]
@@ -225,6 +271,8 @@ class Leg(NSData):
 
 
 class Link(NSData):
+    __slots__ = ('title', 'url')
+
     title: typing.Optional[str]
     url: typing.Optional[str]
 
@@ -234,16 +282,22 @@ class Link(NSData):
 
 
 class Location(NSData):
+    __slots__ = ('station', 'description')
+
     station: "StationReference"  # Gives information about the station the alternative transport belongs to
     description: str  # Human readable description of the location of the alternative transport
 
 
 class MeetingPointDetails(NSData):
+    __slots__ = ('name', 'minutesBefore')
+
     name: str
     minutesBefore: int
 
 
 class Message(NSData):
+    __slots__ = ('id', 'externalId', 'head', 'text', 'lead', 'routeIdxFrom', 'routeIdxTo', 'type', 'nesColor', 'startDate', 'endDate', 'startTime', 'endTime')
+
     id: typing.Optional[str]
     externalId: typing.Optional[str]
     head: typing.Optional[str]
@@ -260,16 +314,22 @@ class Message(NSData):
 
 
 class NearbyMeLocationId(NSData):
+    __slots__ = ('value', 'type')
+
     value: str
     type: str
 
 
 class NesColor(NSData):
+    __slots__ = ('type', 'color', '__weakref__')
+
     type: str
     color: str
 
 
 class Note(NSData):
+    __slots__ = ('value', 'key', 'noteType', 'priority', 'routeIdxFrom', 'routeIdxTo', 'link', 'isPresentationRequired', 'category')
+
     value: typing.Optional[str]
     key: typing.Optional[str]
     noteType: typing.Optional[str]
@@ -282,6 +342,8 @@ class Note(NSData):
 
 
 class Part(NSData):
+    __slots__ = ('stockIdentifier', 'destination', 'facilities', 'image')
+
     stockIdentifier: typing.Optional[str]
     destination: typing.Optional["Station"]
     facilities: list[str]
@@ -289,6 +351,8 @@ class Part(NSData):
 
 
 class PlatformFeature(NSData):
+    __slots__ = ('paddingLeft', 'width', 'type', 'description')
+
     paddingLeft: int
     width: int
     type: str
@@ -296,6 +360,8 @@ class PlatformFeature(NSData):
 
 
 class PrimaryMessage(NSData):
+    __slots__ = ('title', 'nesColor', 'message', 'icon')
+
     title: str
     nesColor: "NesColor"
     message: typing.Optional["Message"]
@@ -303,6 +369,8 @@ class PrimaryMessage(NSData):
 
 
 class Product(NSData):
+    __slots__ = ('number', 'categoryCode', 'shortCategoryName', 'longCategoryName', 'operatorCode', 'operatorName', 'operatorAdministrativeCode', 'type', 'displayName', '__weakref__')
+
     number: typing.Optional[str]
     categoryCode: typing.Optional[str]
     shortCategoryName: typing.Optional[str]
@@ -315,6 +383,8 @@ class Product(NSData):
 
 
 class RegistrationAvailability(NSData):
+    __slots__ = ('seats', 'numberOfSeats', 'bicycle', 'numberOfBicyclePlaces')
+
     seats: bool
     numberOfSeats: typing.Optional[int]
     bicycle: bool
@@ -322,35 +392,47 @@ class RegistrationAvailability(NSData):
 
 
 class RepresentationResponseArrivalsPayload(NSData):
+    __slots__ = ('payload', 'links', 'meta')
+
     payload: "ArrivalsPayload"
     links: typing.Optional["object"]
     meta: typing.Optional["object"]
 
 
 class RepresentationResponseDeparturesPayload(NSData):
+    __slots__ = ('payload', 'links', 'meta')
+
     payload: "DeparturesPayload"
     links: typing.Optional["object"]
     meta: typing.Optional["object"]
 
 
 class RepresentationResponseInternationalPrice(NSData):
+    __slots__ = ('payload', 'links', 'meta')
+
     payload: "InternationalPrice"
     links: typing.Optional["object"]
     meta: typing.Optional["object"]
 
 
 class RepresentationResponseJourney(NSData):
+    __slots__ = ('payload', 'links', 'meta')
+
     payload: "Journey"
     links: typing.Optional["object"]
     meta: typing.Optional["object"]
 
 
 class RouteStation(NSData):
+    __slots__ = ('uicCode', 'mediumName', '__weakref__')
+
     uicCode: typing.Optional[str]
     mediumName: typing.Optional[str]
 
 
 class SalesOption(NSData):
+    __slots__ = ('type', 'permilleFullTariff', 'priceInCents', 'betterOption', 'recommendationText')
+
     type: str
     permilleFullTariff: typing.Optional[int]
     priceInCents: typing.Optional[int]
@@ -359,6 +441,8 @@ class SalesOption(NSData):
 
 
 class ServiceBookingInfo(NSData):
+    __slots__ = ('name', 'tripLegIndex', 'stationUic', 'serviceTypeIds', 'defaultAssistanceValue', 'canChangeAssistance', 'message')
+
     name: str
     tripLegIndex: str
     stationUic: typing.Optional[str]
@@ -369,6 +453,8 @@ class ServiceBookingInfo(NSData):
 
 
 class SharedModality(NSData):
+    __slots__ = ('provider', 'name', 'availability', 'nearByMeMapping', 'planIcon')
+
     provider: str
     name: typing.Optional[str]
     availability: bool
@@ -377,6 +463,8 @@ class SharedModality(NSData):
 
 
 class Station(NSData):
+    __slots__ = ('UICCode', 'stationType', 'EVACode', 'code', 'sporen', 'synoniemen', 'heeftFaciliteiten', 'heeftVertrektijden', 'heeftReisassistentie', 'namen', 'land', 'lat', 'lng', 'radius', 'naderenRadius', 'distance', 'ingangsDatum', 'eindDatum', 'nearbyMeLocationId')
+
     UICCode: str
     stationType: str
     EVACode: typing.Optional[str]
@@ -406,6 +494,8 @@ class Station(NSData):
 
 
 class StationReference(NSData):
+    __slots__ = ('uicCode', 'stationCode', 'name', 'coordinate', 'countryCode')
+
     uicCode: str
     stationCode: typing.Optional[str]
     name: str
@@ -414,12 +504,16 @@ class StationReference(NSData):
 
 
 class StationResponse(NSData):
+    __slots__ = ('payload', 'links', 'meta')
+
     payload: list["Station"]
     links: typing.Optional["object"]
     meta: typing.Optional["object"]
 
 
 class StationsNamen(NSData):
+    __slots__ = ('lang', 'middel', 'kort', 'festive', '__weakref__')
+
     lang: str
     middel: str
     kort: str
@@ -427,6 +521,8 @@ class StationsNamen(NSData):
 
 
 class Step(NSData):
+    __slots__ = ('distanceInMeters', 'durationInSeconds', 'startLocation', 'endLocation', 'instructions')
+
     distanceInMeters: int
     durationInSeconds: int
     startLocation: "Location"  # Gives more information about the location of the alternative transport
@@ -435,6 +531,8 @@ class Step(NSData):
 
 
 class Stock(NSData):
+    __slots__ = ('trainType', 'numberOfSeats', 'numberOfParts', 'trainParts', 'hasSignificantChange')
+
     trainType: typing.Optional[str]
     numberOfSeats: int
     numberOfParts: int
@@ -443,10 +541,14 @@ class Stock(NSData):
 
 
 class StockPartLink(NSData):
+    __slots__ = ('uri',)
+
     uri: str
 
 
 class Stop(NSData):
+    __slots__ = ('uicCode', 'name', 'lat', 'lng', 'countryCode', 'notes', 'routeIdx', 'departurePrognosisType', 'plannedDepartureDateTime', 'plannedDepartureTimeZoneOffset', 'actualDepartureDateTime', 'actualDepartureTimeZoneOffset', 'plannedArrivalDateTime', 'plannedArrivalTimeZoneOffset', 'actualArrivalDateTime', 'actualArrivalTimeZoneOffset', 'plannedPassingDateTime', 'actualPassingDateTime', 'arrivalPrognosisType', 'actualDepartureTrack', 'plannedDepartureTrack', 'plannedArrivalTrack', 'actualArrivalTrack', 'departureDelayInSeconds', 'arrivalDelayInSeconds', 'cancelled', 'borderStop', 'passing', 'quayCode')
+
     uicCode: typing.Optional[str]
     name: typing.Optional[str]
     lat: typing.Optional[float]
@@ -479,6 +581,8 @@ class Stop(NSData):
 
 
 class StopNote(NSData):
+    __slots__ = ('value', 'key', 'type', 'priority')
+
     value: str
     key: typing.Optional[str]
     type: str
@@ -486,10 +590,14 @@ class StopNote(NSData):
 
 
 class Track(NSData):
+    __slots__ = ('spoorNummer',)
+
     spoorNummer: str
 
 
 class TravelAdvice(NSData):
+    __slots__ = ('source', 'trips', 'scrollRequestBackwardContext', 'scrollRequestForwardContext', 'message')
+
     source: str  # Source system that has generated these travel advices
     trips: list["Trip"]  # List of trips
     scrollRequestBackwardContext: typing.Optional[str]  # Scroll context to use when scrolling back in time. Can be used in scrollContext query parameter
@@ -498,12 +606,16 @@ class TravelAdvice(NSData):
 
 
 class TravelAssistanceInfo(NSData):
+    __slots__ = ('termsAndConditionsLink', 'tripRequestId', 'isAssistanceRequired')
+
     termsAndConditionsLink: typing.Optional[str]
     tripRequestId: int
     isAssistanceRequired: bool
 
 
 class Trip(NSData):
+    __slots__ = ('uid', 'ctxRecon', 'plannedDurationInMinutes', 'actualDurationInMinutes', 'transfers', 'status', 'primaryMessage', 'messages', 'legs', 'overviewPolyLine', 'crowdForecast', 'punctuality', 'optimal', 'fareRoute', 'fares', 'fareLegs', 'productFare', 'fareOptions', 'bookingUrl', 'type', 'shareUrl', 'realtime', 'travelAssistanceInfo', 'routeId', 'registerJourney', 'eco')
+
     uid: str  # Unique identifier for this trip
     ctxRecon: str  # Reconstruction context for this trip. Can be used to reconstruct this exact trip with the v3/trips/trip endpoint
     plannedDurationInMinutes: typing.Optional[int]  # Planned duration of this trip in minutes
@@ -533,6 +645,8 @@ class Trip(NSData):
 
 
 class TripFareOptions(NSData):
+    __slots__ = ('isInternationalBookable', 'isInternational', 'isEticketBuyable', 'isPossibleWithOvChipkaart', 'isTotalPriceUnknown', 'supplementsBasedOnSelectedFare', 'reasonEticketNotBuyable', 'salesOptions')
+
     isInternationalBookable: bool
     isInternational: bool
     isEticketBuyable: bool
@@ -544,6 +658,8 @@ class TripFareOptions(NSData):
 
 
 class TripFareSupplement(NSData):
+    __slots__ = ('supplementPriceInCents', 'legIdx', 'fromUICCode', 'toUICCode', 'link')
+
     supplementPriceInCents: int
     legIdx: typing.Optional[str]
     fromUICCode: typing.Optional[str]
@@ -552,6 +668,8 @@ class TripFareSupplement(NSData):
 
 
 class TripOriginDestination(NSData):
+    __slots__ = ('name', 'lng', 'lat', 'city', 'countryCode', 'uicCode', 'type', 'prognosisType', 'plannedTimeZoneOffset', 'plannedDateTime', 'actualTimeZoneOffset', 'actualDateTime', 'plannedTrack', 'actualTrack', 'exitSide', 'checkinStatus', 'travelAssistanceBookingInfo', 'travelAssistanceMeetingPoints', 'travelAssistanceMeetingPointDetails', 'notes', 'quayCode')
+
     name: typing.Optional[str]
     lng: typing.Optional[float]
     lat: typing.Optional[float]
@@ -576,6 +694,8 @@ class TripOriginDestination(NSData):
 
 
 class TripSalesFare(NSData):
+    __slots__ = ('priceInCents', 'product', 'travelClass', 'priceInCentsExcludingSupplement', 'discountType', 'supplementInCents', 'link')
+
     priceInCents: typing.Optional[int]
     product: typing.Optional[str]
     travelClass: typing.Optional[str]
@@ -586,6 +706,8 @@ class TripSalesFare(NSData):
 
 
 class TripTravelFare(NSData):
+    __slots__ = ('priceInCents', 'priceInCentsExcludingSupplement', 'supplementInCents', 'buyableTicketPriceInCents', 'buyableTicketPriceInCentsExcludingSupplement', 'buyableTicketSupplementPriceInCents', 'product', 'travelClass', 'discountType', 'link')
+
     priceInCents: typing.Optional[int]
     priceInCentsExcludingSupplement: typing.Optional[int]
     supplementInCents: typing.Optional[int]
@@ -596,3 +718,6 @@ class TripTravelFare(NSData):
     travelClass: typing.Optional[str]
     discountType: str
     link: typing.Optional[str]
+
+
+from . import travel_information_decoders  # noqa: E402 (installs the generated decoders on the classes above)
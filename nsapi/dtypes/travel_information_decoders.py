@@ -0,0 +1,1366 @@
+"""Decoders for the classes in travel_information, generated by autogen/generate_type.py. Do not edit."""
+from .timestamps import parse_datetime, parse_date
+from .travel_information import (
+    Arrival,
+    ArrivalOrDeparture,
+    ArrivalsPayload,
+    CalamitiesResourceCalamity,
+    CalamitiesResponse,
+    CalamityBodyItem,
+    CallToActionButton,
+    CoachCrowdForecast,
+    Coordinate,
+    Departure,
+    DeparturesPayload,
+    Download,
+    Eco,
+    EticketNotBuyableReason,
+    FareLeg,
+    FareLegStop,
+    FareRoute,
+    InternationalPrice,
+    Journey,
+    JourneyDetailLink,
+    JourneyRegistrationParameters,
+    JourneyStop,
+    Leg,
+    Link,
+    Location,
+    MeetingPointDetails,
+    Message,
+    NearbyMeLocationId,
+    NesColor,
+    Note,
+    Part,
+    PlatformFeature,
+    PrimaryMessage,
+    Product,
+    RegistrationAvailability,
+    RepresentationResponseArrivalsPayload,
+    RepresentationResponseDeparturesPayload,
+    RepresentationResponseInternationalPrice,
+    RepresentationResponseJourney,
+    RouteStation,
+    SalesOption,
+    ServiceBookingInfo,
+    SharedModality,
+    Station,
+    StationReference,
+    StationResponse,
+    StationsNamen,
+    Step,
+    Stock,
+    StockPartLink,
+    Stop,
+    StopNote,
+    Track,
+    TravelAdvice,
+    TravelAssistanceInfo,
+    Trip,
+    TripFareOptions,
+    TripFareSupplement,
+    TripOriginDestination,
+    TripSalesFare,
+    TripTravelFare,
+)
+
+_new = object.__new__
+
+_Arrival_keys = frozenset(('origin', 'name', 'plannedDateTime', 'plannedTimeZoneOffset', 'actualDateTime', 'actualTimeZoneOffset', 'plannedTrack', 'actualTrack', 'product', 'trainCategory', 'cancelled', 'journeyDetailRef', 'messages', 'arrivalStatus'))
+
+
+def decode_Arrival(data, self=None):
+    if not data.keys() <= _Arrival_keys:
+        return None
+    if self is None:
+        self = _new(Arrival)
+    get = data.get
+    self.origin = get('origin')
+    self.name = get('name')
+    value = get('plannedDateTime')
+    self.plannedDateTime = None if value is None else parse_datetime(value)
+    self.plannedTimeZoneOffset = get('plannedTimeZoneOffset')
+    value = get('actualDateTime')
+    self.actualDateTime = None if value is None else parse_datetime(value)
+    self.actualTimeZoneOffset = get('actualTimeZoneOffset')
+    self.plannedTrack = get('plannedTrack')
+    self.actualTrack = get('actualTrack')
+    value = get('product')
+    self.product = None if value is None else (decode_Product(value) or Product(value))
+    self.trainCategory = get('trainCategory')
+    self.cancelled = get('cancelled')
+    self.journeyDetailRef = get('journeyDetailRef')
+    value = get('messages')
+    self.messages = None if value is None else [(decode_Message(item) or Message(item)) for item in value]
+    self.arrivalStatus = get('arrivalStatus')
+    return self
+
+
+_ArrivalOrDeparture_keys = frozenset(('product', 'origin', 'destination', 'plannedTime', 'actualTime', 'delayInSeconds', 'plannedTrack', 'actualTrack', 'cancelled', 'punctuality', 'crowdForecast', 'shorterStockClassification', 'stockIdentifiers'))
+
+
+def decode_ArrivalOrDeparture(data, self=None):
+    if not data.keys() <= _ArrivalOrDeparture_keys:
+        return None
+    if self is None:
+        self = _new(ArrivalOrDeparture)
+    get = data.get
+    value = get('product')
+    self.product = None if value is None else (decode_Product(value) or Product(value))
+    value = get('origin')
+    self.origin = None if value is None else (decode_Station(value) or Station(value))
+    value = get('destination')
+    self.destination = None if value is None else (decode_Station(value) or Station(value))
+    value = get('plannedTime')
+    self.plannedTime = None if value is None else parse_datetime(value)
+    value = get('actualTime')
+    self.actualTime = None if value is None else parse_datetime(value)
+    self.delayInSeconds = get('delayInSeconds')
+    self.plannedTrack = get('plannedTrack')
+    self.actualTrack = get('actualTrack')
+    self.cancelled = get('cancelled')
+    self.punctuality = get('punctuality')
+    self.crowdForecast = get('crowdForecast')
+    self.shorterStockClassification = get('shorterStockClassification')
+    self.stockIdentifiers = get('stockIdentifiers')
+    return self
+
+
+_ArrivalsPayload_keys = frozenset(('source', 'arrivals'))
+
+
+def decode_ArrivalsPayload(data, self=None):
+    if not data.keys() <= _ArrivalsPayload_keys:
+        return None
+    if self is None:
+        self = _new(ArrivalsPayload)
+    get = data.get
+    self.source = get('source')
+    value = get('arrivals')
+    self.arrivals = None if value is None else [(decode_Arrival(item) or Arrival(item)) for item in value]
+    return self
+
+
+_CalamitiesResourceCalamity_keys = frozenset(('id', 'titel', 'beschrijving', 'lastModified', 'type', 'url', 'buttonPositie', 'laatstGewijzigd', 'volgendeUpdate', 'calltoactionbuttons', 'bodyitems'))
+
+
+def decode_CalamitiesResourceCalamity(data, self=None):
+    if not data.keys() <= _CalamitiesResourceCalamity_keys:
+        return None
+    if self is None:
+        self = _new(CalamitiesResourceCalamity)
+    get = data.get
+    self.id = get('id')
+    self.titel = get('titel')
+    self.beschrijving = get('beschrijving')
+    self.lastModified = get('lastModified')
+    self.type = get('type')
+    self.url = get('url')
+    self.buttonPositie = get('buttonPositie')
+    self.laatstGewijzigd = get('laatstGewijzigd')
+    self.volgendeUpdate = get('volgendeUpdate')
+    value = get('calltoactionbuttons')
+    self.calltoactionbuttons = None if value is None else [(decode_CallToActionButton(item) or CallToActionButton(item)) for item in value]
+    value = get('bodyitems')
+    self.bodyitems = None if value is None else [(decode_CalamityBodyItem(item) or CalamityBodyItem(item)) for item in value]
+    return self
+
+
+_CalamitiesResponse_keys = frozenset(('calamiteit', 'meldingen'))
+
+
+def decode_CalamitiesResponse(data, self=None):
+    if not data.keys() <= _CalamitiesResponse_keys:
+        return None
+    if self is None:
+        self = _new(CalamitiesResponse)
+    get = data.get
+    value = get('calamiteit')
+    self.calamiteit = None if value is None else (decode_CalamitiesResourceCalamity(value) or CalamitiesResourceCalamity(value))
+    value = get('meldingen')
+    self.meldingen = None if value is None else [(decode_CalamitiesResourceCalamity(item) or CalamitiesResourceCalamity(item)) for item in value]
+    return self
+
+
+_CalamityBodyItem_keys = frozenset(('objectType', 'content', 'titel', 'downloads', 'links'))
+
+
+def decode_CalamityBodyItem(data, self=None):
+    if not data.keys() <= _CalamityBodyItem_keys:
+        return None
+    if self is None:
+        self = _new(CalamityBodyItem)
+    get = data.get
+    self.objectType = get('objectType')
+    self.content = get('content')
+    self.titel = get('titel')
+    value = get('downloads')
+    self.downloads = None if value is None else [(decode_Download(item) or Download(item)) for item in value]
+    value = get('links')
+    self.links = None if value is None else [(decode_Link(item) or Link(item)) for item in value]
+    return self
+
+
+_CallToActionButton_keys = frozenset(('callToAction', 'url', 'type', 'voorleestitel'))
+
+
+def decode_CallToActionButton(data, self=None):
+    if not data.keys() <= _CallToActionButton_keys:
+        return None
+    if self is None:
+        self = _new(CallToActionButton)
+    get = data.get
+    self.callToAction = get('callToAction')
+    self.url = get('url')
+    self.type = get('type')
+    self.voorleestitel = get('voorleestitel')
+    return self
+
+
+_CoachCrowdForecast_keys = frozenset(('paddingLeft', 'width', 'classification'))
+
+
+def decode_CoachCrowdForecast(data, self=None):
+    if not data.keys() <= _CoachCrowdForecast_keys:
+        return None
+    if self is None:
+        self = _new(CoachCrowdForecast)
+    get = data.get
+    self.paddingLeft = get('paddingLeft')
+    self.width = get('width')
+    self.classification = get('classification')
+    return self
+
+
+_Coordinate_keys = frozenset(('lat', 'lng'))
+
+
+def decode_Coordinate(data, self=None):
+    if not data.keys() <= _Coordinate_keys:
+        return None
+    if self is None:
+        self = _new(Coordinate)
+    get = data.get
+    self.lat = get('lat')
+    self.lng = get('lng')
+    return self
+
+
+_Departure_keys = frozenset(('direction', 'name', 'plannedDateTime', 'plannedTimeZoneOffset', 'actualDateTime', 'actualTimeZoneOffset', 'plannedTrack', 'actualTrack', 'product', 'trainCategory', 'cancelled', 'journeyDetailRef', 'routeStations', 'messages', 'departureStatus'))
+
+
+def decode_Departure(data, self=None):
+    if not data.keys() <= _Departure_keys:
+        return None
+    if self is None:
+        self = _new(Departure)
+    get = data.get
+    self.direction = get('direction')
+    self.name = get('name')
+    value = get('plannedDateTime')
+    self.plannedDateTime = None if value is None else parse_datetime(value)
+    self.plannedTimeZoneOffset = get('plannedTimeZoneOffset')
+    value = get('actualDateTime')
+    self.actualDateTime = None if value is None else parse_datetime(value)
+    self.actualTimeZoneOffset = get('actualTimeZoneOffset')
+    self.plannedTrack = get('plannedTrack')
+    self.actualTrack = get('actualTrack')
+    value = get('product')
+    self.product = None if value is None else (decode_Product(value) or Product(value))
+    self.trainCategory = get('trainCategory')
+    self.cancelled = get('cancelled')
+    self.journeyDetailRef = get('journeyDetailRef')
+    value = get('routeStations')
+    self.routeStations = None if value is None else [(decode_RouteStation(item) or RouteStation(item)) for item in value]
+    value = get('messages')
+    self.messages = None if value is None else [(decode_Message(item) or Message(item)) for item in value]
+    self.departureStatus = get('departureStatus')
+    return self
+
+
+_DeparturesPayload_keys = frozenset(('source', 'departures'))
+
+
+def decode_DeparturesPayload(data, self=None):
+    if not data.keys() <= _DeparturesPayload_keys:
+        return None
+    if self is None:
+        self = _new(DeparturesPayload)
+    get = data.get
+    self.source = get('source')
+    value = get('departures')
+    self.departures = None if value is None else [(decode_Departure(item) or Departure(item)) for item in value]
+    return self
+
+
+_Download_keys = frozenset(('title', 'url', 'contentLength', 'mimeType', 'lastModified'))
+
+
+def decode_Download(data, self=None):
+    if not data.keys() <= _Download_keys:
+        return None
+    if self is None:
+        self = _new(Download)
+    get = data.get
+    self.title = get('title')
+    self.url = get('url')
+    self.contentLength = get('contentLength')
+    self.mimeType = get('mimeType')
+    value = get('lastModified')
+    self.lastModified = None if value is None else parse_datetime(value)
+    return self
+
+
+_Eco_keys = frozenset(('co2kg',))
+
+
+def decode_Eco(data, self=None):
+    if not data.keys() <= _Eco_keys:
+        return None
+    if self is None:
+        self = _new(Eco)
+    get = data.get
+    self.co2kg = get('co2kg')
+    return self
+
+
+_EticketNotBuyableReason_keys = frozenset(('reason', 'description'))
+
+
+def decode_EticketNotBuyableReason(data, self=None):
+    if not data.keys() <= _EticketNotBuyableReason_keys:
+        return None
+    if self is None:
+        self = _new(EticketNotBuyableReason)
+    get = data.get
+    self.reason = get('reason')
+    self.description = get('description')
+    return self
+
+
+_FareLeg_keys = frozenset(('origin', 'destination', 'operator', 'productTypes', 'fares'))
+
+
+def decode_FareLeg(data, self=None):
+    if not data.keys() <= _FareLeg_keys:
+        return None
+    if self is None:
+        self = _new(FareLeg)
+    get = data.get
+    value = get('origin')
+    self.origin = None if value is None else (decode_TripOriginDestination(value) or TripOriginDestination(value))
+    value = get('destination')
+    self.destination = None if value is None else (decode_TripOriginDestination(value) or TripOriginDestination(value))
+    self.operator = get('operator')
+    self.productTypes = get('productTypes')
+    value = get('fares')
+    self.fares = None if value is None else [(decode_TripTravelFare(item) or TripTravelFare(item)) for item in value]
+    return self
+
+
+_FareLegStop_keys = frozenset(('varCode', 'name'))
+
+
+def decode_FareLegStop(data, self=None):
+    if not data.keys() <= _FareLegStop_keys:
+        return None
+    if self is None:
+        self = _new(FareLegStop)
+    get = data.get
+    self.varCode = get('varCode')
+    self.name = get('name')
+    return self
+
+
+_FareRoute_keys = frozenset(('routeId', 'origin', 'destination'))
+
+
+def decode_FareRoute(data, self=None):
+    if not data.keys() <= _FareRoute_keys:
+        return None
+    if self is None:
+        self = _new(FareRoute)
+    get = data.get
+    self.routeId = get('routeId')
+    value = get('origin')
+    self.origin = None if value is None else (decode_FareLegStop(value) or FareLegStop(value))
+    value = get('destination')
+    self.destination = None if value is None else (decode_FareLegStop(value) or FareLegStop(value))
+    return self
+
+
+_InternationalPrice_keys = frozenset(('priceInCents', 'priceInCentsExcludingSupplement', 'product', 'travelClass', 'link'))
+
+
+def decode_InternationalPrice(data, self=None):
+    if not data.keys() <= _InternationalPrice_keys:
+        return None
+    if self is None:
+        self = _new(InternationalPrice)
+    get = data.get
+    self.priceInCents = get('priceInCents')
+    self.priceInCentsExcludingSupplement = get('priceInCentsExcludingSupplement')
+    self.product = get('product')
+    self.travelClass = get('travelClass')
+    self.link = get('link')
+    return self
+
+
+_Journey_keys = frozenset(('notes', 'productNumbers', 'stops', 'allowCrowdReporting', 'source'))
+
+
+def decode_Journey(data, self=None):
+    if not data.keys() <= _Journey_keys:
+        return None
+    if self is None:
+        self = _new(Journey)
+    get = data.get
+    value = get('notes')
+    self.notes = None if value is None else [(decode_Note(item) or Note(item)) for item in value]
+    self.productNumbers = get('productNumbers')
+    value = get('stops')
+    self.stops = None if value is None else [(decode_JourneyStop(item) or JourneyStop(item)) for item in value]
+    self.allowCrowdReporting = get('allowCrowdReporting')
+    self.source = get('source')
+    return self
+
+
+_JourneyDetailLink_keys = frozenset(('type', 'link'))
+
+
+def decode_JourneyDetailLink(data, self=None):
+    if not data.keys() <= _JourneyDetailLink_keys:
+        return None
+    if self is None:
+        self = _new(JourneyDetailLink)
+    get = data.get
+    self.type = get('type')
+    value = get('link')
+    self.link = None if value is None else (decode_Link(value) or Link(value))
+    return self
+
+
+_JourneyRegistrationParameters_keys = frozenset(('url', 'searchUrl', 'status', 'bicycleReservationRequired', 'availability'))
+
+
+def decode_JourneyRegistrationParameters(data, self=None):
+    if not data.keys() <= _JourneyRegistrationParameters_keys:
+        return None
+    if self is None:
+        self = _new(JourneyRegistrationParameters)
+    get = data.get
+    self.url = get('url')
+    self.searchUrl = get('searchUrl')
+    self.status = get('status')
+    self.bicycleReservationRequired = get('bicycleReservationRequired')
+    value = get('availability')
+    self.availability = None if value is None else (decode_RegistrationAvailability(value) or RegistrationAvailability(value))
+    return self
+
+
+_JourneyStop_keys = frozenset(('id', 'stop', 'previousStopId', 'nextStopId', 'destination', 'status', 'kind', 'arrivals', 'departures', 'actualStock', 'plannedStock', 'platformFeatures', 'coachCrowdForecast'))
+
+
+def decode_JourneyStop(data, self=None):
+    if not data.keys() <= _JourneyStop_keys:
+        return None
+    if self is None:
+        self = _new(JourneyStop)
+    get = data.get
+    self.id = get('id')
+    value = get('stop')
+    self.stop = None if value is None else (decode_Station(value) or Station(value))
+    self.previousStopId = get('previousStopId')
+    self.nextStopId = get('nextStopId')
+    self.destination = get('destination')
+    self.status = get('status')
+    self.kind = get('kind')
+    value = get('arrivals')
+    self.arrivals = None if value is None else [(decode_ArrivalOrDeparture(item) or ArrivalOrDeparture(item)) for item in value]
+    value = get('departures')
+    self.departures = None if value is None else [(decode_ArrivalOrDeparture(item) or ArrivalOrDeparture(item)) for item in value]
+    value = get('actualStock')
+    self.actualStock = None if value is None else (decode_Stock(value) or Stock(value))
+    value = get('plannedStock')
+    self.plannedStock = None if value is None else (decode_Stock(value) or Stock(value))
+    value = get('platformFeatures')
+    self.platformFeatures = None if value is None else [(decode_PlatformFeature(item) or PlatformFeature(item)) for item in value]
+    value = get('coachCrowdForecast')
+    self.coachCrowdForecast = None if value is None else [(decode_CoachCrowdForecast(item) or CoachCrowdForecast(item)) for item in value]
+    return self
+
+
+_Leg_keys = frozenset(('idx', 'name', 'travelType', 'direction', 'cancelled', 'changePossible', 'alternativeTransport', 'journeyDetailRef', 'origin', 'destination', 'product', 'sharedModality', 'notes', 'messages', 'stops', 'steps', 'coordinates', 'crowdForecast', 'punctuality', 'crossPlatformTransfer', 'shorterStock', 'changeCouldBePossible', 'shorterStockWarning', 'shorterStockClassification', 'journeyDetail', 'reachable', 'plannedDurationInMinutes', 'travelAssistanceDeparture', 'travelAssistanceArrival', 'overviewPolyLine'))
+
+
+def decode_Leg(data, self=None):
+    if not data.keys() <= _Leg_keys:
+        return None
+    if self is None:
+        self = _new(Leg)
+    get = data.get
+    self.idx = get('idx')
+    self.name = get('name')
+    self.travelType = get('travelType')
+    self.direction = get('direction')
+    self.cancelled = get('cancelled')
+    self.changePossible = get('changePossible')
+    self.alternativeTransport = get('alternativeTransport')
+    self.journeyDetailRef = get('journeyDetailRef')
+    value = get('origin')
+    self.origin = None if value is None else (decode_TripOriginDestination(value) or TripOriginDestination(value))
+    value = get('destination')
+    self.destination = None if value is None else (decode_TripOriginDestination(value) or TripOriginDestination(value))
+    value = get('product')
+    self.product = None if value is None else (decode_Product(value) or Product(value))
+    value = get('sharedModality')
+    self.sharedModality = None if value is None else (decode_SharedModality(value) or SharedModality(value))
+    value = get('notes')
+    self.notes = None if value is None else [(decode_Note(item) or Note(item)) for item in value]
+    value = get('messages')
+    self.messages = None if value is None else [(decode_Message(item) or Message(item)) for item in value]
+    value = get('stops')
+    self.stops = None if value is None else [(decode_Stop(item) or Stop(item)) for item in value]
+    value = get('steps')
+    self.steps = None if value is None else [(decode_Step(item) or Step(item)) for item in value]
+    self.coordinates = get('coordinates')
+    self.crowdForecast = get('crowdForecast')
+    self.punctuality = get('punctuality')
+    self.crossPlatformTransfer = get('crossPlatformTransfer')
+    self.shorterStock = get('shorterStock')
+    self.changeCouldBePossible = get('changeCouldBePossible')
+    self.shorterStockWarning = get('shorterStockWarning')
+    self.shorterStockClassification = get('shorterStockClassification')
+    value = get('journeyDetail')
+    self.journeyDetail = None if value is None else [(decode_JourneyDetailLink(item) or JourneyDetailLink(item)) for item in value]
+    self.reachable = get('reachable')
+    self.plannedDurationInMinutes = get('plannedDurationInMinutes')
+    value = get('travelAssistanceDeparture')
+    self.travelAssistanceDeparture = None if value is None else (decode_ServiceBookingInfo(value) or ServiceBookingInfo(value))
+    value = get('travelAssistanceArrival')
+    self.travelAssistanceArrival = None if value is None else (decode_ServiceBookingInfo(value) or ServiceBookingInfo(value))
+    value = get('overviewPolyLine')
+    self.overviewPolyLine = None if value is None else [(decode_Coordinate(item) or Coordinate(item)) for item in value]
+    return self
+
+
+_Link_keys = frozenset(('title', 'url'))
+
+
+def decode_Link(data, self=None):
+    if not data.keys() <= _Link_keys:
+        return None
+    if self is None:
+        self = _new(Link)
+    get = data.get
+    self.title = get('title')
+    self.url = get('url')
+    self.__post_init__({})
+    return self
+
+
+_Location_keys = frozenset(('station', 'description'))
+
+
+def decode_Location(data, self=None):
+    if not data.keys() <= _Location_keys:
+        return None
+    if self is None:
+        self = _new(Location)
+    get = data.get
+    value = get('station')
+    self.station = None if value is None else (decode_StationReference(value) or StationReference(value))
+    self.description = get('description')
+    return self
+
+
+_MeetingPointDetails_keys = frozenset(('name', 'minutesBefore'))
+
+
+def decode_MeetingPointDetails(data, self=None):
+    if not data.keys() <= _MeetingPointDetails_keys:
+        return None
+    if self is None:
+        self = _new(MeetingPointDetails)
+    get = data.get
+    self.name = get('name')
+    self.minutesBefore = get('minutesBefore')
+    return self
+
+
+_Message_keys = frozenset(('id', 'externalId', 'head', 'text', 'lead', 'routeIdxFrom', 'routeIdxTo', 'type', 'nesColor', 'startDate', 'endDate', 'startTime', 'endTime'))
+
+
+def decode_Message(data, self=None):
+    if not data.keys() <= _Message_keys:
+        return None
+    if self is None:
+        self = _new(Message)
+    get = data.get
+    self.id = get('id')
+    self.externalId = get('externalId')
+    self.head = get('head')
+    self.text = get('text')
+    self.lead = get('lead')
+    self.routeIdxFrom = get('routeIdxFrom')
+    self.routeIdxTo = get('routeIdxTo')
+    self.type = get('type')
+    value = get('nesColor')
+    self.nesColor = None if value is None else (decode_NesColor(value) or NesColor(value))
+    self.startDate = get('startDate')
+    self.endDate = get('endDate')
+    self.startTime = get('startTime')
+    self.endTime = get('endTime')
+    return self
+
+
+_NearbyMeLocationId_keys = frozenset(('value', 'type'))
+
+
+def decode_NearbyMeLocationId(data, self=None):
+    if not data.keys() <= _NearbyMeLocationId_keys:
+        return None
+    if self is None:
+        self = _new(NearbyMeLocationId)
+    get = data.get
+    self.value = get('value')
+    self.type = get('type')
+    return self
+
+
+_NesColor_keys = frozenset(('type', 'color'))
+
+
+def decode_NesColor(data, self=None):
+    if not data.keys() <= _NesColor_keys:
+        return None
+    if self is None:
+        self = _new(NesColor)
+    get = data.get
+    self.type = get('type')
+    self.color = get('color')
+    return self
+
+
+_Note_keys = frozenset(('value', 'key', 'noteType', 'priority', 'routeIdxFrom', 'routeIdxTo', 'link', 'isPresentationRequired', 'category'))
+
+
+def decode_Note(data, self=None):
+    if not data.keys() <= _Note_keys:
+        return None
+    if self is None:
+        self = _new(Note)
+    get = data.get
+    self.value = get('value')
+    self.key = get('key')
+    self.noteType = get('noteType')
+    self.priority = get('priority')
+    self.routeIdxFrom = get('routeIdxFrom')
+    self.routeIdxTo = get('routeIdxTo')
+    value = get('link')
+    self.link = None if value is None else (decode_Link(value) or Link(value))
+    self.isPresentationRequired = get('isPresentationRequired')
+    self.category = get('category')
+    return self
+
+
+_Part_keys = frozenset(('stockIdentifier', 'destination', 'facilities', 'image'))
+
+
+def decode_Part(data, self=None):
+    if not data.keys() <= _Part_keys:
+        return None
+    if self is None:
+        self = _new(Part)
+    get = data.get
+    self.stockIdentifier = get('stockIdentifier')
+    value = get('destination')
+    self.destination = None if value is None else (decode_Station(value) or Station(value))
+    self.facilities = get('facilities')
+    value = get('image')
+    self.image = None if value is None else (decode_StockPartLink(value) or StockPartLink(value))
+    return self
+
+
+_PlatformFeature_keys = frozenset(('paddingLeft', 'width', 'type', 'description'))
+
+
+def decode_PlatformFeature(data, self=None):
+    if not data.keys() <= _PlatformFeature_keys:
+        return None
+    if self is None:
+        self = _new(PlatformFeature)
+    get = data.get
+    self.paddingLeft = get('paddingLeft')
+    self.width = get('width')
+    self.type = get('type')
+    self.description = get('description')
+    return self
+
+
+_PrimaryMessage_keys = frozenset(('title', 'nesColor', 'message', 'icon'))
+
+
+def decode_PrimaryMessage(data, self=None):
+    if not data.keys() <= _PrimaryMessage_keys:
+        return None
+    if self is None:
+        self = _new(PrimaryMessage)
+    get = data.get
+    self.title = get('title')
+    value = get('nesColor')
+    self.nesColor = None if value is None else (decode_NesColor(value) or NesColor(value))
+    value = get('message')
+    self.message = None if value is None else (decode_Message(value) or Message(value))
+    self.icon = get('icon')
+    return self
+
+
+_Product_keys = frozenset(('number', 'categoryCode', 'shortCategoryName', 'longCategoryName', 'operatorCode', 'operatorName', 'operatorAdministrativeCode', 'type', 'displayName'))
+
+
+def decode_Product(data, self=None):
+    if not data.keys() <= _Product_keys:
+        return None
+    if self is None:
+        self = _new(Product)
+    get = data.get
+    self.number = get('number')
+    self.categoryCode = get('categoryCode')
+    self.shortCategoryName = get('shortCategoryName')
+    self.longCategoryName = get('longCategoryName')
+    self.operatorCode = get('operatorCode')
+    self.operatorName = get('operatorName')
+    self.operatorAdministrativeCode = get('operatorAdministrativeCode')
+    self.type = get('type')
+    self.displayName = get('displayName')
+    return self
+
+
+_RegistrationAvailability_keys = frozenset(('seats', 'numberOfSeats', 'bicycle', 'numberOfBicyclePlaces'))
+
+
+def decode_RegistrationAvailability(data, self=None):
+    if not data.keys() <= _RegistrationAvailability_keys:
+        return None
+    if self is None:
+        self = _new(RegistrationAvailability)
+    get = data.get
+    self.seats = get('seats')
+    self.numberOfSeats = get('numberOfSeats')
+    self.bicycle = get('bicycle')
+    self.numberOfBicyclePlaces = get('numberOfBicyclePlaces')
+    return self
+
+
+_RepresentationResponseArrivalsPayload_keys = frozenset(('payload', 'links', 'meta'))
+
+
+def decode_RepresentationResponseArrivalsPayload(data, self=None):
+    if not data.keys() <= _RepresentationResponseArrivalsPayload_keys:
+        return None
+    if self is None:
+        self = _new(RepresentationResponseArrivalsPayload)
+    get = data.get
+    value = get('payload')
+    self.payload = None if value is None else (decode_ArrivalsPayload(value) or ArrivalsPayload(value))
+    self.links = get('links')
+    self.meta = get('meta')
+    return self
+
+
+_RepresentationResponseDeparturesPayload_keys = frozenset(('payload', 'links', 'meta'))
+
+
+def decode_RepresentationResponseDeparturesPayload(data, self=None):
+    if not data.keys() <= _RepresentationResponseDeparturesPayload_keys:
+        return None
+    if self is None:
+        self = _new(RepresentationResponseDeparturesPayload)
+    get = data.get
+    value = get('payload')
+    self.payload = None if value is None else (decode_DeparturesPayload(value) or DeparturesPayload(value))
+    self.links = get('links')
+    self.meta = get('meta')
+    return self
+
+
+_RepresentationResponseInternationalPrice_keys = frozenset(('payload', 'links', 'meta'))
+
+
+def decode_RepresentationResponseInternationalPrice(data, self=None):
+    if not data.keys() <= _RepresentationResponseInternationalPrice_keys:
+        return None
+    if self is None:
+        self = _new(RepresentationResponseInternationalPrice)
+    get = data.get
+    value = get('payload')
+    self.payload = None if value is None else (decode_InternationalPrice(value) or InternationalPrice(value))
+    self.links = get('links')
+    self.meta = get('meta')
+    return self
+
+
+_RepresentationResponseJourney_keys = frozenset(('payload', 'links', 'meta'))
+
+
+def decode_RepresentationResponseJourney(data, self=None):
+    if not data.keys() <= _RepresentationResponseJourney_keys:
+        return None
+    if self is None:
+        self = _new(RepresentationResponseJourney)
+    get = data.get
+    value = get('payload')
+    self.payload = None if value is None else (decode_Journey(value) or Journey(value))
+    self.links = get('links')
+    self.meta = get('meta')
+    return self
+
+
+_RouteStation_keys = frozenset(('uicCode', 'mediumName'))
+
+
+def decode_RouteStation(data, self=None):
+    if not data.keys() <= _RouteStation_keys:
+        return None
+    if self is None:
+        self = _new(RouteStation)
+    get = data.get
+    self.uicCode = get('uicCode')
+    self.mediumName = get('mediumName')
+    return self
+
+
+_SalesOption_keys = frozenset(('type', 'permilleFullTariff', 'priceInCents', 'betterOption', 'recommendationText'))
+
+
+def decode_SalesOption(data, self=None):
+    if not data.keys() <= _SalesOption_keys:
+        return None
+    if self is None:
+        self = _new(SalesOption)
+    get = data.get
+    self.type = get('type')
+    self.permilleFullTariff = get('permilleFullTariff')
+    self.priceInCents = get('priceInCents')
+    self.betterOption = get('betterOption')
+    self.recommendationText = get('recommendationText')
+    return self
+
+
+_ServiceBookingInfo_keys = frozenset(('name', 'tripLegIndex', 'stationUic', 'serviceTypeIds', 'defaultAssistanceValue', 'canChangeAssistance', 'message'))
+
+
+def decode_ServiceBookingInfo(data, self=None):
+    if not data.keys() <= _ServiceBookingInfo_keys:
+        return None
+    if self is None:
+        self = _new(ServiceBookingInfo)
+    get = data.get
+    self.name = get('name')
+    self.tripLegIndex = get('tripLegIndex')
+    self.stationUic = get('stationUic')
+    self.serviceTypeIds = get('serviceTypeIds')
+    self.defaultAssistanceValue = get('defaultAssistanceValue')
+    self.canChangeAssistance = get('canChangeAssistance')
+    self.message = get('message')
+    return self
+
+
+_SharedModality_keys = frozenset(('provider', 'name', 'availability', 'nearByMeMapping', 'planIcon'))
+
+
+def decode_SharedModality(data, self=None):
+    if not data.keys() <= _SharedModality_keys:
+        return None
+    if self is None:
+        self = _new(SharedModality)
+    get = data.get
+    self.provider = get('provider')
+    self.name = get('name')
+    self.availability = get('availability')
+    self.nearByMeMapping = get('nearByMeMapping')
+    self.planIcon = get('planIcon')
+    return self
+
+
+_Station_keys = frozenset(('UICCode', 'stationType', 'EVACode', 'code', 'sporen', 'synoniemen', 'heeftFaciliteiten', 'heeftVertrektijden', 'heeftReisassistentie', 'namen', 'land', 'lat', 'lng', 'radius', 'naderenRadius', 'distance', 'ingangsDatum', 'eindDatum', 'nearbyMeLocationId'))
+
+
+def decode_Station(data, self=None):
+    if not data.keys() <= _Station_keys:
+        return None
+    if self is None:
+        self = _new(Station)
+    get = data.get
+    self.UICCode = get('UICCode')
+    self.stationType = get('stationType')
+    self.EVACode = get('EVACode')
+    self.code = get('code')
+    value = get('sporen')
+    self.sporen = None if value is None else [(decode_Track(item) or Track(item)) for item in value]
+    self.synoniemen = get('synoniemen')
+    self.heeftFaciliteiten = get('heeftFaciliteiten')
+    self.heeftVertrektijden = get('heeftVertrektijden')
+    self.heeftReisassistentie = get('heeftReisassistentie')
+    value = get('namen')
+    self.namen = None if value is None else (decode_StationsNamen(value) or StationsNamen(value))
+    self.land = get('land')
+    self.lat = get('lat')
+    self.lng = get('lng')
+    self.radius = get('radius')
+    self.naderenRadius = get('naderenRadius')
+    self.distance = get('distance')
+    value = get('ingangsDatum')
+    self.ingangsDatum = None if value is None else parse_date(value)
+    value = get('eindDatum')
+    self.eindDatum = None if value is None else parse_date(value)
+    value = get('nearbyMeLocationId')
+    self.nearbyMeLocationId = None if value is None else (decode_NearbyMeLocationId(value) or NearbyMeLocationId(value))
+    self.__post_init__({})
+    return self
+
+
+_StationReference_keys = frozenset(('uicCode', 'stationCode', 'name', 'coordinate', 'countryCode'))
+
+
+def decode_StationReference(data, self=None):
+    if not data.keys() <= _StationReference_keys:
+        return None
+    if self is None:
+        self = _new(StationReference)
+    get = data.get
+    self.uicCode = get('uicCode')
+    self.stationCode = get('stationCode')
+    self.name = get('name')
+    value = get('coordinate')
+    self.coordinate = None if value is None else (decode_Coordinate(value) or Coordinate(value))
+    self.countryCode = get('countryCode')
+    return self
+
+
+_StationResponse_keys = frozenset(('payload', 'links', 'meta'))
+
+
+def decode_StationResponse(data, self=None):
+    if not data.keys() <= _StationResponse_keys:
+        return None
+    if self is None:
+        self = _new(StationResponse)
+    get = data.get
+    value = get('payload')
+    self.payload = None if value is None else [(decode_Station(item) or Station(item)) for item in value]
+    self.links = get('links')
+    self.meta = get('meta')
+    return self
+
+
+_StationsNamen_keys = frozenset(('lang', 'middel', 'kort', 'festive'))
+
+
+def decode_StationsNamen(data, self=None):
+    if not data.keys() <= _StationsNamen_keys:
+        return None
+    if self is None:
+        self = _new(StationsNamen)
+    get = data.get
+    self.lang = get('lang')
+    self.middel = get('middel')
+    self.kort = get('kort')
+    self.festive = get('festive')
+    return self
+
+
+_Step_keys = frozenset(('distanceInMeters', 'durationInSeconds', 'startLocation', 'endLocation', 'instructions'))
+
+
+def decode_Step(data, self=None):
+    if not data.keys() <= _Step_keys:
+        return None
+    if self is None:
+        self = _new(Step)
+    get = data.get
+    self.distanceInMeters = get('distanceInMeters')
+    self.durationInSeconds = get('durationInSeconds')
+    value = get('startLocation')
+    self.startLocation = None if value is None else (decode_Location(value) or Location(value))
+    value = get('endLocation')
+    self.endLocation = None if value is None else (decode_Location(value) or Location(value))
+    self.instructions = get('instructions')
+    return self
+
+
+_Stock_keys = frozenset(('trainType', 'numberOfSeats', 'numberOfParts', 'trainParts', 'hasSignificantChange'))
+
+
+def decode_Stock(data, self=None):
+    if not data.keys() <= _Stock_keys:
+        return None
+    if self is None:
+        self = _new(Stock)
+    get = data.get
+    self.trainType = get('trainType')
+    self.numberOfSeats = get('numberOfSeats')
+    self.numberOfParts = get('numberOfParts')
+    value = get('trainParts')
+    self.trainParts = None if value is None else [(decode_Part(item) or Part(item)) for item in value]
+    self.hasSignificantChange = get('hasSignificantChange')
+    return self
+
+
+_StockPartLink_keys = frozenset(('uri',))
+
+
+def decode_StockPartLink(data, self=None):
+    if not data.keys() <= _StockPartLink_keys:
+        return None
+    if self is None:
+        self = _new(StockPartLink)
+    get = data.get
+    self.uri = get('uri')
+    return self
+
+
+_Stop_keys = frozenset(('uicCode', 'name', 'lat', 'lng', 'countryCode', 'notes', 'routeIdx', 'departurePrognosisType', 'plannedDepartureDateTime', 'plannedDepartureTimeZoneOffset', 'actualDepartureDateTime', 'actualDepartureTimeZoneOffset', 'plannedArrivalDateTime', 'plannedArrivalTimeZoneOffset', 'actualArrivalDateTime', 'actualArrivalTimeZoneOffset', 'plannedPassingDateTime', 'actualPassingDateTime', 'arrivalPrognosisType', 'actualDepartureTrack', 'plannedDepartureTrack', 'plannedArrivalTrack', 'actualArrivalTrack', 'departureDelayInSeconds', 'arrivalDelayInSeconds', 'cancelled', 'borderStop', 'passing', 'quayCode'))
+
+
+def decode_Stop(data, self=None):
+    if not data.keys() <= _Stop_keys:
+        return None
+    if self is None:
+        self = _new(Stop)
+    get = data.get
+    self.uicCode = get('uicCode')
+    self.name = get('name')
+    self.lat = get('lat')
+    self.lng = get('lng')
+    self.countryCode = get('countryCode')
+    value = get('notes')
+    self.notes = None if value is None else [(decode_StopNote(item) or StopNote(item)) for item in value]
+    self.routeIdx = get('routeIdx')
+    self.departurePrognosisType = get('departurePrognosisType')
+    value = get('plannedDepartureDateTime')
+    self.plannedDepartureDateTime = None if value is None else parse_datetime(value)
+    self.plannedDepartureTimeZoneOffset = get('plannedDepartureTimeZoneOffset')
+    value = get('actualDepartureDateTime')
+    self.actualDepartureDateTime = None if value is None else parse_datetime(value)
+    self.actualDepartureTimeZoneOffset = get('actualDepartureTimeZoneOffset')
+    value = get('plannedArrivalDateTime')
+    self.plannedArrivalDateTime = None if value is None else parse_datetime(value)
+    self.plannedArrivalTimeZoneOffset = get('plannedArrivalTimeZoneOffset')
+    value = get('actualArrivalDateTime')
+    self.actualArrivalDateTime = None if value is None else parse_datetime(value)
+    self.actualArrivalTimeZoneOffset = get('actualArrivalTimeZoneOffset')
+    value = get('plannedPassingDateTime')
+    self.plannedPassingDateTime = None if value is None else parse_datetime(value)
+    value = get('actualPassingDateTime')
+    self.actualPassingDateTime = None if value is None else parse_datetime(value)
+    self.arrivalPrognosisType = get('arrivalPrognosisType')
+    self.actualDepartureTrack = get('actualDepartureTrack')
+    self.plannedDepartureTrack = get('plannedDepartureTrack')
+    self.plannedArrivalTrack = get('plannedArrivalTrack')
+    self.actualArrivalTrack = get('actualArrivalTrack')
+    self.departureDelayInSeconds = get('departureDelayInSeconds')
+    self.arrivalDelayInSeconds = get('arrivalDelayInSeconds')
+    self.cancelled = get('cancelled')
+    self.borderStop = get('borderStop')
+    self.passing = get('passing')
+    self.quayCode = get('quayCode')
+    return self
+
+
+_StopNote_keys = frozenset(('value', 'key', 'type', 'priority'))
+
+
+def decode_StopNote(data, self=None):
+    if not data.keys() <= _StopNote_keys:
+        return None
+    if self is None:
+        self = _new(StopNote)
+    get = data.get
+    self.value = get('value')
+    self.key = get('key')
+    self.type = get('type')
+    self.priority = get('priority')
+    return self
+
+
+_Track_keys = frozenset(('spoorNummer',))
+
+
+def decode_Track(data, self=None):
+    if not data.keys() <= _Track_keys:
+        return None
+    if self is None:
+        self = _new(Track)
+    get = data.get
+    self.spoorNummer = get('spoorNummer')
+    return self
+
+
+_TravelAdvice_keys = frozenset(('source', 'trips', 'scrollRequestBackwardContext', 'scrollRequestForwardContext', 'message'))
+
+
+def decode_TravelAdvice(data, self=None):
+    if not data.keys() <= _TravelAdvice_keys:
+        return None
+    if self is None:
+        self = _new(TravelAdvice)
+    get = data.get
+    self.source = get('source')
+    value = get('trips')
+    self.trips = None if value is None else [(decode_Trip(item) or Trip(item)) for item in value]
+    self.scrollRequestBackwardContext = get('scrollRequestBackwardContext')
+    self.scrollRequestForwardContext = get('scrollRequestForwardContext')
+    self.message = get('message')
+    return self
+
+
+_TravelAssistanceInfo_keys = frozenset(('termsAndConditionsLink', 'tripRequestId', 'isAssistanceRequired'))
+
+
+def decode_TravelAssistanceInfo(data, self=None):
+    if not data.keys() <= _TravelAssistanceInfo_keys:
+        return None
+    if self is None:
+        self = _new(TravelAssistanceInfo)
+    get = data.get
+    self.termsAndConditionsLink = get('termsAndConditionsLink')
+    self.tripRequestId = get('tripRequestId')
+    self.isAssistanceRequired = get('isAssistanceRequired')
+    return self
+
+
+_Trip_keys = frozenset(('uid', 'ctxRecon', 'plannedDurationInMinutes', 'actualDurationInMinutes', 'transfers', 'status', 'primaryMessage', 'messages', 'legs', 'overviewPolyLine', 'crowdForecast', 'punctuality', 'optimal', 'fareRoute', 'fares', 'fareLegs', 'productFare', 'fareOptions', 'bookingUrl', 'type', 'shareUrl', 'realtime', 'travelAssistanceInfo', 'routeId', 'registerJourney', 'eco'))
+
+
+def decode_Trip(data, self=None):
+    if not data.keys() <= _Trip_keys:
+        return None
+    if self is None:
+        self = _new(Trip)
+    get = data.get
+    self.uid = get('uid')
+    self.ctxRecon = get('ctxRecon')
+    self.plannedDurationInMinutes = get('plannedDurationInMinutes')
+    self.actualDurationInMinutes = get('actualDurationInMinutes')
+    self.transfers = get('transfers')
+    self.status = get('status')
+    value = get('primaryMessage')
+    self.primaryMessage = None if value is None else (decode_PrimaryMessage(value) or PrimaryMessage(value))
+    value = get('messages')
+    self.messages = None if value is None else [(decode_Message(item) or Message(item)) for item in value]
+    value = get('legs')
+    self.legs = None if value is None else [(decode_Leg(item) or Leg(item)) for item in value]
+    value = get('overviewPolyLine')
+    self.overviewPolyLine = None if value is None else [(decode_Coordinate(item) or Coordinate(item)) for item in value]
+    self.crowdForecast = get('crowdForecast')
+    self.punctuality = get('punctuality')
+    self.optimal = get('optimal')
+    value = get('fareRoute')
+    self.fareRoute = None if value is None else (decode_FareRoute(value) or FareRoute(value))
+    value = get('fares')
+    self.fares = None if value is None else [(decode_TripSalesFare(item) or TripSalesFare(item)) for item in value]
+    value = get('fareLegs')
+    self.fareLegs = None if value is None else [(decode_FareLeg(item) or FareLeg(item)) for item in value]
+    value = get('productFare')
+    self.productFare = None if value is None else (decode_TripTravelFare(value) or TripTravelFare(value))
+    value = get('fareOptions')
+    self.fareOptions = None if value is None else (decode_TripFareOptions(value) or TripFareOptions(value))
+    value = get('bookingUrl')
+    self.bookingUrl = None if value is None else (decode_Link(value) or Link(value))
+    self.type = get('type')
+    value = get('shareUrl')
+    self.shareUrl = None if value is None else (decode_Link(value) or Link(value))
+    self.realtime = get('realtime')
+    value = get('travelAssistanceInfo')
+    self.travelAssistanceInfo = None if value is None else (decode_TravelAssistanceInfo(value) or TravelAssistanceInfo(value))
+    self.routeId = get('routeId')
+    value = get('registerJourney')
+    self.registerJourney = None if value is None else (decode_JourneyRegistrationParameters(value) or JourneyRegistrationParameters(value))
+    value = get('eco')
+    self.eco = None if value is None else (decode_Eco(value) or Eco(value))
+    return self
+
+
+_TripFareOptions_keys = frozenset(('isInternationalBookable', 'isInternational', 'isEticketBuyable', 'isPossibleWithOvChipkaart', 'isTotalPriceUnknown', 'supplementsBasedOnSelectedFare', 'reasonEticketNotBuyable', 'salesOptions'))
+
+
+def decode_TripFareOptions(data, self=None):
+    if not data.keys() <= _TripFareOptions_keys:
+        return None
+    if self is None:
+        self = _new(TripFareOptions)
+    get = data.get
+    self.isInternationalBookable = get('isInternationalBookable')
+    self.isInternational = get('isInternational')
+    self.isEticketBuyable = get('isEticketBuyable')
+    self.isPossibleWithOvChipkaart = get('isPossibleWithOvChipkaart')
+    self.isTotalPriceUnknown = get('isTotalPriceUnknown')
+    value = get('supplementsBasedOnSelectedFare')
+    self.supplementsBasedOnSelectedFare = None if value is None else [(decode_TripFareSupplement(item) or TripFareSupplement(item)) for item in value]
+    value = get('reasonEticketNotBuyable')
+    self.reasonEticketNotBuyable = None if value is None else (decode_EticketNotBuyableReason(value) or EticketNotBuyableReason(value))
+    value = get('salesOptions')
+    self.salesOptions = None if value is None else [(decode_SalesOption(item) or SalesOption(item)) for item in value]
+    return self
+
+
+_TripFareSupplement_keys = frozenset(('supplementPriceInCents', 'legIdx', 'fromUICCode', 'toUICCode', 'link'))
+
+
+def decode_TripFareSupplement(data, self=None):
+    if not data.keys() <= _TripFareSupplement_keys:
+        return None
+    if self is None:
+        self = _new(TripFareSupplement)
+    get = data.get
+    self.supplementPriceInCents = get('supplementPriceInCents')
+    self.legIdx = get('legIdx')
+    self.fromUICCode = get('fromUICCode')
+    self.toUICCode = get('toUICCode')
+    value = get('link')
+    self.link = None if value is None else (decode_Link(value) or Link(value))
+    return self
+
+
+_TripOriginDestination_keys = frozenset(('name', 'lng', 'lat', 'city', 'countryCode', 'uicCode', 'type', 'prognosisType', 'plannedTimeZoneOffset', 'plannedDateTime', 'actualTimeZoneOffset', 'actualDateTime', 'plannedTrack', 'actualTrack', 'exitSide', 'checkinStatus', 'travelAssistanceBookingInfo', 'travelAssistanceMeetingPoints', 'travelAssistanceMeetingPointDetails', 'notes', 'quayCode'))
+
+
+def decode_TripOriginDestination(data, self=None):
+    if not data.keys() <= _TripOriginDestination_keys:
+        return None
+    if self is None:
+        self = _new(TripOriginDestination)
+    get = data.get
+    self.name = get('name')
+    self.lng = get('lng')
+    self.lat = get('lat')
+    self.city = get('city')
+    self.countryCode = get('countryCode')
+    self.uicCode = get('uicCode')
+    self.type = get('type')
+    self.prognosisType = get('prognosisType')
+    self.plannedTimeZoneOffset = get('plannedTimeZoneOffset')
+    value = get('plannedDateTime')
+    self.plannedDateTime = None if value is None else parse_datetime(value)
+    self.actualTimeZoneOffset = get('actualTimeZoneOffset')
+    value = get('actualDateTime')
+    self.actualDateTime = None if value is None else parse_datetime(value)
+    self.plannedTrack = get('plannedTrack')
+    self.actualTrack = get('actualTrack')
+    self.exitSide = get('exitSide')
+    self.checkinStatus = get('checkinStatus')
+    value = get('travelAssistanceBookingInfo')
+    self.travelAssistanceBookingInfo = None if value is None else (decode_ServiceBookingInfo(value) or ServiceBookingInfo(value))
+    self.travelAssistanceMeetingPoints = get('travelAssistanceMeetingPoints')
+    value = get('travelAssistanceMeetingPointDetails')
+    self.travelAssistanceMeetingPointDetails = None if value is None else [(decode_MeetingPointDetails(item) or MeetingPointDetails(item)) for item in value]
+    value = get('notes')
+    self.notes = None if value is None else [(decode_Note(item) or Note(item)) for item in value]
+    self.quayCode = get('quayCode')
+    return self
+
+
+_TripSalesFare_keys = frozenset(('priceInCents', 'product', 'travelClass', 'priceInCentsExcludingSupplement', 'discountType', 'supplementInCents', 'link'))
+
+
+def decode_TripSalesFare(data, self=None):
+    if not data.keys() <= _TripSalesFare_keys:
+        return None
+    if self is None:
+        self = _new(TripSalesFare)
+    get = data.get
+    self.priceInCents = get('priceInCents')
+    self.product = get('product')
+    self.travelClass = get('travelClass')
+    self.priceInCentsExcludingSupplement = get('priceInCentsExcludingSupplement')
+    self.discountType = get('discountType')
+    self.supplementInCents = get('supplementInCents')
+    self.link = get('link')
+    return self
+
+
+_TripTravelFare_keys = frozenset(('priceInCents', 'priceInCentsExcludingSupplement', 'supplementInCents', 'buyableTicketPriceInCents', 'buyableTicketPriceInCentsExcludingSupplement', 'buyableTicketSupplementPriceInCents', 'product', 'travelClass', 'discountType', 'link'))
+
+
+def decode_TripTravelFare(data, self=None):
+    if not data.keys() <= _TripTravelFare_keys:
+        return None
+    if self is None:
+        self = _new(TripTravelFare)
+    get = data.get
+    self.priceInCents = get('priceInCents')
+    self.priceInCentsExcludingSupplement = get('priceInCentsExcludingSupplement')
+    self.supplementInCents = get('supplementInCents')
+    self.buyableTicketPriceInCents = get('buyableTicketPriceInCents')
+    self.buyableTicketPriceInCentsExcludingSupplement = get('buyableTicketPriceInCentsExcludingSupplement')
+    self.buyableTicketSupplementPriceInCents = get('buyableTicketSupplementPriceInCents')
+    self.product = get('product')
+    self.travelClass = get('travelClass')
+    self.discountType = get('discountType')
+    self.link = get('link')
+    return self
+
+
+Arrival._from_json = decode_Arrival
+ArrivalOrDeparture._from_json = decode_ArrivalOrDeparture
+ArrivalsPayload._from_json = decode_ArrivalsPayload
+CalamitiesResourceCalamity._from_json = decode_CalamitiesResourceCalamity
+CalamitiesResponse._from_json = decode_CalamitiesResponse
+CalamityBodyItem._from_json = decode_CalamityBodyItem
+CallToActionButton._from_json = decode_CallToActionButton
+CoachCrowdForecast._from_json = decode_CoachCrowdForecast
+Coordinate._from_json = decode_Coordinate
+Departure._from_json = decode_Departure
+DeparturesPayload._from_json = decode_DeparturesPayload
+Download._from_json = decode_Download
+Eco._from_json = decode_Eco
+EticketNotBuyableReason._from_json = decode_EticketNotBuyableReason
+FareLeg._from_json = decode_FareLeg
+FareLegStop._from_json = decode_FareLegStop
+FareRoute._from_json = decode_FareRoute
+InternationalPrice._from_json = decode_InternationalPrice
+Journey._from_json = decode_Journey
+JourneyDetailLink._from_json = decode_JourneyDetailLink
+JourneyRegistrationParameters._from_json = decode_JourneyRegistrationParameters
+JourneyStop._from_json = decode_JourneyStop
+Leg._from_json = decode_Leg
+Link._from_json = decode_Link
+Location._from_json = decode_Location
+MeetingPointDetails._from_json = decode_MeetingPointDetails
+Message._from_json = decode_Message
+NearbyMeLocationId._from_json = decode_NearbyMeLocationId
+NesColor._from_json = decode_NesColor
+Note._from_json = decode_Note
+Part._from_json = decode_Part
+PlatformFeature._from_json = decode_PlatformFeature
+PrimaryMessage._from_json = decode_PrimaryMessage
+Product._from_json = decode_Product
+RegistrationAvailability._from_json = decode_RegistrationAvailability
+RepresentationResponseArrivalsPayload._from_json = decode_RepresentationResponseArrivalsPayload
+RepresentationResponseDeparturesPayload._from_json = decode_RepresentationResponseDeparturesPayload
+RepresentationResponseInternationalPrice._from_json = decode_RepresentationResponseInternationalPrice
+RepresentationResponseJourney._from_json = decode_RepresentationResponseJourney
+RouteStation._from_json = decode_RouteStation
+SalesOption._from_json = decode_SalesOption
+ServiceBookingInfo._from_json = decode_ServiceBookingInfo
+SharedModality._from_json = decode_SharedModality
+Station._from_json = decode_Station
+StationReference._from_json = decode_StationReference
+StationResponse._from_json = decode_StationResponse
+StationsNamen._from_json = decode_StationsNamen
+Step._from_json = decode_Step
+Stock._from_json = decode_Stock
+StockPartLink._from_json = decode_StockPartLink
+Stop._from_json = decode_Stop
+StopNote._from_json = decode_StopNote
+Track._from_json = decode_Track
+TravelAdvice._from_json = decode_TravelAdvice
+TravelAssistanceInfo._from_json = decode_TravelAssistanceInfo
+Trip._from_json = decode_Trip
+TripFareOptions._from_json = decode_TripFareOptions
+TripFareSupplement._from_json = decode_TripFareSupplement
+TripOriginDestination._from_json = decode_TripOriginDestination
+TripSalesFare._from_json = decode_TripSalesFare
+TripTravelFare._from_json = decode_TripTravelFare
@@ -0,0 +1,182 @@
+import math
+import time
+import logging
+import threading
+
+from .dtypes import NSData
+
+logger = logging.getLogger(__name__)
+
+TIMINGS = ('wait', 'connect', 'ttfb', 'transfer', 'parse', 'decode', 'total')
+
+
+class RequestEvent:
+    """Measurements of one request, passed to the `instrument` callback of NSAPI / AsyncNSAPI when it completes.
+    Times are in seconds. Coalesced requests (see SingleFlight) produce a single event."""
+    def __init__(self, method, path):
+        self.method = method
+        self.path = path
+        self.status = None
+        self.bytes = 0
+        self.attempts = 0           # HTTP requests made, more than 1 when throttled requests were retried
+        self.cache = None           # 'hit' for fresh cached responses, 'revalidated' for HTTP 304 responses
+        self.wait = 0.0             # Waiting for the rate limiter
+        self.connect = None         # Setting up the connection (including TLS), 0 when a connection was reused,
+                                    # None when unknown (an NSAPI transport other than the default one, or a proxy)
+        self.ttfb = 0.0             # From sending the request until the response headers arrived, includes `connect`
+        self.transfer = 0.0         # Receiving the response body
+        self.parse = 0.0            # JSON parsing
+        self.decode = 0.0           # Building the dtype objects
+        self.total = 0.0
+        self.objects = 0            # Number of dtype objects created
+        self.error = None
+        self._start = time.perf_counter()
+        self._marks = {}
+
+    def __repr__(self):
+        return (f'RequestEvent({self.method} {self.path}, status={self.status}, bytes={self.bytes}'
+                + ''.join(f', {name}={value:.4f}' for name in TIMINGS if (value := getattr(self, name)) is not None)
+                + f', objects={self.objects})')
+
+    async def trace(self, name, info):
+        """httpx trace extension, recording when each stage of the request started and completed"""
+        self._marks[name.split('.', 1)[1]] = time.perf_counter()
+
+    def _response(self, response, start, end, elapsed=None, connect=None):
+        """Record a received response. `elapsed` and `connect` are the time until the headers arrived and the time to
+        connect, when not traced."""
+        self.status = response.status_code
+        self.bytes += len(response.content)
+        self.attempts += 1
+        marks = self._marks
+        if elapsed is None and 'receive_response_headers.complete' in marks:
+            headers = marks['receive_response_headers.complete']
+            elapsed = headers - start
+            self.connect = ((marks.get('connect_tcp.complete', 0) - marks.get('connect_tcp.started', 0))
+                            + (marks.get('start_tls.complete', 0) - marks.get('start_tls.started', 0)))
+            marks.clear()
+        if connect is not None:
+            self.connect = connect
+        if elapsed is not None:
+            self.ttfb += elapsed
+            self.transfer += end - start - elapsed
+
+    def _finish(self, instrument, result=None, error=None):
+        self.total = time.perf_counter() - self._start
+        self.error = error
+        if result is not None:
+            self.objects = count_objects(result)
+        try:
+            instrument(self)
+        except Exception:
+            logger.exception(f'Instrument {instrument} failed')
+
+
+def timed(event, name, function, *args):
+    """Call function(*args), adding the time it took to the `name` timing of the event (if any)"""
+    if event is None:
+        return function(*args)
+    start = time.perf_counter()
+    try:
+        return function(*args)
+    finally:
+        setattr(event, name, getattr(event, name) + time.perf_counter() - start)
+
+
+def count_objects(value):
+    """Number of NSData objects in a decoded tree, not counting values that are still pending in lazy mode"""
+    if isinstance(value, NSData):
+        cls = type(value)
+        decoder = cls.__dict__.get('_decoder') or cls._compile_decoder()      # Not compiled if decoded by generated code
+        try:
+            pending = value._lazy
+        except AttributeError:
+            pending = ()
+        # Only fields with a converter can hold objects
+        return 1 + sum(count_objects(getattr(value, attr, None)) for attr in decoder.attributes
+                       if decoder.fields[attr][1] is not None and attr not in pending)
+    if isinstance(value, list):
+        return sum(count_objects(item) for item in value)
+    return 0
+
+
+class Histogram:
+    """Histogram with logarithmic buckets, 4 per doubling, from 10µs. Percentiles are accurate to about 10%."""
+    BASE = 1e-5
+    RESOLUTION = 4
+
+    def __init__(self):
+        self.buckets = {}           # Bucket index -> count
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def add(self, value):
+        index = max(0, math.ceil(math.log2(value / self.BASE) * self.RESOLUTION)) if value > self.BASE else 0
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def percentile(self, q):
+        """Upper bound of the bucket holding the q-th percentile (0 <= q <= 100)"""
+        if not self.count:
+            return None
+        rank = q / 100 * self.count
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(self.max, self.BASE * 2 ** (index / self.RESOLUTION))
+        return self.max
+
+    def summary(self):
+        if not self.count:
+            return {'count': 0}
+        return {'count': self.count, 'mean': self.sum / self.count, 'min': self.min, 'p50': self.percentile(50),
+                'p90': self.percentile(90), 'p99': self.percentile(99), 'max': self.max}
+
+
+class HistogramAggregator:
+    """Instrument keeping histograms of the timings, sizes and object counts of requests, per path.
+
+        histograms = HistogramAggregator()
+        api = NSAPI(token, instrument=histograms)
+        ...
+        histograms.summary()['reisinformatie-api/api/v3/trips']['decode']['p90']
+    """
+    METRICS = TIMINGS + ('bytes', 'objects')
+
+    def __init__(self):
+        self.paths = {}             # Path -> metric -> Histogram
+        self.statuses = {}          # Path -> status -> count
+        self.errors = {}            # Path -> number of failed requests
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        with self._lock:
+            histograms = self.paths.get(event.path)
+            if histograms is None:
+                histograms = self.paths[event.path] = {metric: Histogram() for metric in self.METRICS}
+                self.statuses[event.path] = {}
+            for metric in self.METRICS:
+                value = getattr(event, metric)
+                if value is not None:
+                    histograms[metric].add(value)
+            statuses = self.statuses[event.path]
+            statuses[event.status] = statuses.get(event.status, 0) + 1
+            if event.error is not None:
+                self.errors[event.path] = self.errors.get(event.path, 0) + 1
+
+    def summary(self):
+        with self._lock:
+            return {path: {metric: histogram.summary() for metric, histogram in histograms.items()}
+                    for path, histograms in self.paths.items()}
+
+    def clear(self):
+        with self._lock:
+            self.paths.clear()
+            self.statuses.clear()
+            self.errors.clear()
@@ -0,0 +1,215 @@
+import heapq
+
+from .dtypes.travel_information import RepresentationResponseJourney
+
+
+class StationTable:
+    """Stations numbered by UIC code, shared between JourneyIndexes so each station is stored once"""
+    def __init__(self):
+        self.stations = []          # Number -> Station
+        self.numbers = {}           # UIC code -> number
+
+    def add(self, station):
+        number = self.numbers.get(station.UICCode)
+        if number is None:
+            number = self.numbers[station.UICCode] = len(self.stations)
+            self.stations.append(station)
+        return number
+
+    def number(self, station):
+        """Number of a station, given as a UIC code or Station. None if unknown."""
+        return self.numbers.get(getattr(station, 'UICCode', station))
+
+    def __len__(self):
+        return len(self.stations)
+
+
+class JourneyIndex:
+    """Index over the stops of a journey() response, for questions like "when does this train reach X".
+
+        index = JourneyIndex(api.travel_information.journey(train=3052))
+        arrival, departure = index.time_at('8400621')
+
+    Stops are kept in topological order of their previousStopId/nextStopId links, which also holds for trains that
+    split or combine. Stations can be given as UIC codes or Station objects. Pass the same StationTable to the
+    indexes of many journeys to share their stations.
+    """
+    def __init__(self, journey, stations: StationTable = None):
+        if isinstance(journey, RepresentationResponseJourney):
+            journey = journey.payload
+        self.journey = journey
+        self.stations = stations if stations is not None else StationTable()
+        self.stops = {}             # Stop id -> JourneyStop
+        self.next = {}              # Stop id -> ids of the next stops (more than one where the train splits)
+        self.previous = {}          # Stop id -> ids of the previous stops (more than one where trains combine)
+        self.by_station = {}        # Station number -> ids of the stops at that station, in order
+        self.station = {}           # Stop id -> station number
+        for stop in journey.stops or []:
+            self.stops[stop.id] = stop
+            self.next[stop.id] = []
+            self.previous[stop.id] = []
+        for stop in journey.stops or []:
+            for other in stop.nextStopId or []:
+                self._link(stop.id, other)
+            for other in stop.previousStopId or []:
+                self._link(other, stop.id)
+        self.order = self._topological_order()
+        self.position = {stop_id: i for i, stop_id in enumerate(self.order)}
+        for stop_id in self.order:
+            stop = self.stops[stop_id]
+            if stop.stop is not None:
+                number = self.stations.add(stop.stop)
+                self.station[stop_id] = number
+                self.by_station.setdefault(number, []).append(stop_id)
+        self.delays = {stop_id: (_delay(self.stops[stop_id].arrivals), _delay(self.stops[stop_id].departures))
+                       for stop_id in self.order}
+        self.stock_changes = self._stock_changes()
+
+    def _link(self, from_id, to_id):
+        if from_id in self.stops and to_id in self.stops and to_id not in self.next[from_id]:
+            self.next[from_id].append(to_id)
+            self.previous[to_id].append(from_id)
+
+    def _topological_order(self):
+        """Stop ids ordered so that every stop comes after its previous stops, otherwise in the order of the response"""
+        rank = {stop_id: i for i, stop_id in enumerate(self.stops)}
+        incoming = {stop_id: len(previous) for stop_id, previous in self.previous.items()}
+        ready = [(rank[stop_id], stop_id) for stop_id, count in incoming.items() if count == 0]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            _, stop_id = heapq.heappop(ready)
+            order.append(stop_id)
+            for other in self.next[stop_id]:
+                incoming[other] -= 1
+                if incoming[other] == 0:
+                    heapq.heappush(ready, (rank[other], other))
+        if len(order) < len(self.stops):
+            raise ValueError('The stops of the journey contain a cycle')
+        return order
+
+    def _stock_changes(self):
+        """(previous stop id, stop id, previous stock, stock) where the actual (or planned) stock changes"""
+        changes = []
+        for stop_id in self.order:
+            stock = _stock(self.stops[stop_id])
+            for previous_id in self.previous[stop_id]:
+                previous = _stock(self.stops[previous_id])
+                if stock is not None and previous is not None and _composition(stock) != _composition(previous):
+                    changes.append((previous_id, stop_id, previous, stock))
+        return changes
+
+    def __len__(self):
+        return len(self.stops)
+
+    def __iter__(self):
+        return (self.stops[stop_id] for stop_id in self.order)
+
+    def stops_at(self, station):
+        """The stops at a station, in order. Empty if the journey does not call there."""
+        number = self.stations.number(station)
+        return [self.stops[stop_id] for stop_id in self.by_station.get(number, ())]
+
+    def _first(self, station):
+        number = self.stations.number(station)
+        stop_ids = self.by_station.get(number)
+        if not stop_ids:
+            raise KeyError(f'The journey does not call at {station}')
+        return stop_ids[0]
+
+    def _stop_ids(self, stop):
+        """Stop ids of a stop given as an id or JourneyStop, or of all stops at a station"""
+        if isinstance(stop, str) and stop in self.stops:
+            return [stop]
+        if getattr(stop, 'id', None) in self.stops:
+            return [stop.id]
+        return self.by_station.get(self.stations.number(stop), [])
+
+    def _stop_id(self, stop):
+        """Stop id of a stop given as an id or JourneyStop, or of the first stop at a station"""
+        if isinstance(stop, str) and stop in self.stops:
+            return stop
+        stop_id = getattr(stop, 'id', None)
+        if stop_id in self.stops:
+            return stop_id
+        return self._first(stop)
+
+    def time_at(self, stop, actual=True):
+        """(arrival, departure) datetimes at a stop (or the first stop at a station), None where not applicable"""
+        stop = self.stops[self._stop_id(stop)]
+        return _time(stop.arrivals, actual), _time(stop.departures, actual)
+
+    def delay_at(self, stop):
+        """(arrival, departure) delay in seconds at a stop, None where unknown"""
+        return self.delays[self._stop_id(stop)]
+
+    def remaining(self, stop, towards=None):
+        """The stops after `stop`, in order. Where the train splits, only the part going `towards` a station is
+        followed if it is given, otherwise the stops of all parts are returned."""
+        start = self._stop_id(stop)
+        reachable = self._reachable(start, self.next)
+        reachable.discard(start)
+        if towards is not None:
+            reachable &= self._leading_to(towards)
+        return [self.stops[stop_id] for stop_id in sorted(reachable, key=self.position.__getitem__)]
+
+    def propagation(self, stop=None, towards=None):
+        """How the delay develops: (from stop id, to stop id, departure delay, arrival delay) for every section of the
+        journey (after `stop`, going `towards` a station)"""
+        if stop is None:
+            stop_ids = set(self.order)
+        else:
+            stop_ids = {self._stop_id(stop)} | {s.id for s in self.remaining(stop, towards)}
+        if stop is None and towards is not None:
+            stop_ids &= self._leading_to(towards)
+        sections = []
+        for stop_id in self.order:
+            if stop_id not in stop_ids:
+                continue
+            for next_id in self.next[stop_id]:
+                if next_id in stop_ids:
+                    sections.append((stop_id, next_id, self.delays[stop_id][1], self.delays[next_id][0]))
+        return sections
+
+    def _leading_to(self, stop):
+        """Ids of the stops from which the train continues to `stop` (or any stop at a station), including those"""
+        return self._reachable(self._stop_ids(stop), self.previous)
+
+    def _reachable(self, start, edges):
+        """Ids of the stops reachable over `edges` from a stop id (or several)"""
+        seen = {start} if isinstance(start, str) else set(start)
+        pending = list(seen)
+        while pending:
+            for other in edges[pending.pop()]:
+                if other not in seen:
+                    seen.add(other)
+                    pending.append(other)
+        return seen
+
+
+def _time(events, actual):
+    if not events:
+        return None
+    event = events[0]
+    if actual and event.actualTime is not None:
+        return event.actualTime
+    return event.plannedTime
+
+
+def _delay(events):
+    if not events:
+        return None
+    event = events[0]
+    if event.delayInSeconds is not None:
+        return event.delayInSeconds
+    if event.actualTime is not None and event.plannedTime is not None:
+        return int((event.actualTime - event.plannedTime).total_seconds())
+    return None
+
+
+def _stock(stop):
+    return stop.actualStock if stop.actualStock is not None else stop.plannedStock
+
+
+def _composition(stock):
+    return stock.numberOfParts, tuple(part.stockIdentifier for part in stock.trainParts or ())
@@ -0,0 +1,33 @@
+"""JSON parsers that decode responses straight from their raw bytes, skipping charset detection and the text copy of
+`response.json()`. The fastest installed one is used by default: orjson, msgspec, then the standard library."""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+BACKENDS = {'json': json.loads}     # json.loads detects UTF-8/16/32 in bytes itself
+if orjson is not None:
+    BACKENDS['orjson'] = orjson.loads
+if msgspec is not None:
+    BACKENDS['msgspec'] = msgspec.json.Decoder().decode
+
+PREFERENCE = ('orjson', 'msgspec', 'json')
+
+
+def get_loads(backend='auto'):
+    """The function parsing JSON bytes for a backend: 'auto', the name of a backend, or a callable"""
+    if callable(backend):
+        return backend
+    if backend == 'auto':
+        backend = next(name for name in PREFERENCE if name in BACKENDS)
+    try:
+        return BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f'JSON backend {backend!r} is not available, choose from: {", ".join(BACKENDS)}') from None
@@ -0,0 +1,101 @@
+import asyncio
+import concurrent.futures
+
+
+class TripPager:
+    """Iterate over trips page by page, following the scroll contexts of the responses.
+    The next page is requested in the background while the trips of the current one are being processed.
+    Trips are yielded once (by uid), in the direction of travel through time: earliest first when scrolling forward,
+    latest first when scrolling backward. Iteration stops after `limit` trips, or at the first trip departing after
+    (forward) or before (backward) `until`.
+
+        for trip in api.travel_information.iter_trips('ut', 'gdm', until=datetime(..., tzinfo=...)):
+            ...
+
+    `until` must be timezone-aware, as the departure times of the trips are.
+    With AsyncNSAPI, use `async for`.
+    """
+    def __init__(self, endpoint, origin, destination, backward=False, limit=None, until=None, max_pages=100,
+                 lazy=False, **kwargs):
+        if until is not None and until.utcoffset() is None:
+            raise ValueError('`until` must be a timezone-aware datetime, the departure times of the trips are')
+        self.endpoint = endpoint
+        self.origin = origin
+        self.destination = destination
+        self.backward = backward
+        self.limit = limit
+        self.until = until
+        self.max_pages = max_pages
+        self.lazy = lazy
+        self.kwargs = kwargs
+        self.pages = 0
+
+    def _fetch(self, context):
+        kwargs = dict(self.kwargs)
+        if context is not None:
+            kwargs['scrollContext'] = context
+        self.pages += 1
+        return self.endpoint.trips(self.origin, self.destination, lazy=self.lazy, **kwargs)
+
+    def _next_context(self, advice):
+        if self.pages >= self.max_pages:
+            return None
+        return advice.scrollRequestBackwardContext if self.backward else advice.scrollRequestForwardContext
+
+    def _new_trips(self, advice, seen):
+        """Trips of a page that have not been seen before, in order"""
+        trips = reversed(advice.trips or []) if self.backward else advice.trips or []
+        new = [trip for trip in trips if trip.uid not in seen]
+        seen.update(trip.uid for trip in new)
+        return new
+
+    def _past_horizon(self, trip):
+        if self.until is None or not trip.legs:
+            return False
+        origin = trip.legs[0].origin
+        departure = origin.plannedDateTime or origin.actualDateTime
+        if departure is None:
+            return False
+        return departure < self.until if self.backward else departure > self.until
+
+    def _done(self, trip, count):
+        return (self.limit is not None and count >= self.limit) or self._past_horizon(trip)
+
+    def __iter__(self):
+        seen = set()
+        count = 0
+        # Not a with block: leaving it waits for the page being fetched, also when iteration stops early
+        executor = concurrent.futures.ThreadPoolExecutor(1)
+        try:
+            advice = self._fetch(None)
+            while advice is not None:
+                context = self._next_context(advice)
+                upcoming = executor.submit(self._fetch, context) if context else None
+                new = self._new_trips(advice, seen)
+                for trip in new:
+                    if self._done(trip, count):
+                        return
+                    count += 1
+                    yield trip
+                advice = upcoming.result() if upcoming is not None and new else None
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aiter__(self):
+        seen = set()
+        count = 0
+        advice = await self._fetch(None)
+        while advice is not None:
+            context = self._next_context(advice)
+            upcoming = asyncio.ensure_future(self._fetch(context)) if context else None
+            new = self._new_trips(advice, seen)
+            try:
+                for trip in new:
+                    if self._done(trip, count):
+                        return
+                    count += 1
+                    yield trip
+                advice = await upcoming if upcoming is not None and new else None
+            finally:
+                if upcoming is not None and not upcoming.done():
+                    upcoming.cancel()
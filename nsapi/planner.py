@@ -0,0 +1,357 @@
+"""Offline trip planning over collected journey() (and departures()) data, with the Connection Scan Algorithm.
+
+    planner = ConnectionPlanner()
+    for journey in journeys:
+        planner.add_journey(journey)
+    planner.add_departures(api.travel_information.departures('UT'), station_ut)     # Actual times and cancellations
+    trip = planner.earliest_arrival('8400621', '8400058', datetime.datetime.now(timezone))
+    trips = planner.profile('8400621', '8400058', start, end)
+
+Every pair of consecutive calls of a train is a connection. The connections are kept in one array sorted by departure
+time, which the queries scan from the departure time onwards (or backwards for profiles). Results are Trip objects,
+like those of trips(), with legs for every train taken.
+"""
+import bisect
+import datetime
+
+from .journey_index import JourneyIndex, StationTable
+from .dtypes.travel_information import Trip
+
+INFINITY = float('inf')
+TIMESTAMP = '%Y-%m-%dT%H:%M:%S%z'
+
+
+class Call:
+    """A train calling at a station. Times are datetimes, the actual ones (if known) are used for routing."""
+    __slots__ = ('station', 'arrival', 'departure', 'actual_arrival', 'actual_departure', 'track', 'actual_track',
+                 'cancelled')
+
+    def __init__(self, station, arrival=None, departure=None, actual_arrival=None, actual_departure=None, track=None,
+                 actual_track=None, cancelled=False):
+        self.station = station          # Station
+        self.arrival = arrival
+        self.departure = departure
+        self.actual_arrival = actual_arrival
+        self.actual_departure = actual_departure
+        self.track = track
+        self.actual_track = actual_track
+        self.cancelled = cancelled
+
+
+class _Run:
+    __slots__ = ('calls', 'stations', 'product', 'name', 'direction', 'journey_ref')
+
+    def __init__(self, calls, stations, product, name, direction, journey_ref):
+        self.calls = calls
+        self.stations = stations        # Station number of every call
+        self.product = product
+        self.name = name
+        self.direction = direction
+        self.journey_ref = journey_ref
+
+
+class ConnectionPlanner:
+    def __init__(self, transfer_time=datetime.timedelta(minutes=2), stations: StationTable = None):
+        self.transfer_time = int(transfer_time.total_seconds())
+        self.stations = stations if stations is not None else StationTable()
+        self.runs = []
+        self._calls = {}                # (train number, station number, planned departure) -> Call
+        self._built = False
+        # The connections, sorted by departure time, as columns
+        self.departure_times = []
+        self.arrival_times = []
+        self.departure_stations = []
+        self.arrival_stations = []
+        self.connection_runs = []
+        self.connection_calls = []      # Index in the run of the departure call
+        self.arrival_calls = []         # Index in the run of the arrival call
+
+    def __len__(self):
+        self._build()
+        return len(self.departure_times)
+
+    def add_trip(self, calls, product=None, name=None, direction=None, journey_ref=None):
+        """Add a train run, given the Calls in order"""
+        stations = [self.stations.add(call.station) for call in calls]
+        self.runs.append(_Run(calls, stations, product, name, direction, journey_ref))
+        number = product.number if product is not None else None
+        if number is not None:
+            for call, station in zip(calls, stations):
+                if call.departure is not None:
+                    self._calls[(number, station, call.departure)] = call
+        self._built = False
+
+    def add_journey(self, journey):
+        """Add the train of a journey() response. A train that splits (or combines) is added as a run per part."""
+        index = JourneyIndex(journey, self.stations)
+        shared = {stop_id: _call(stop) for stop_id, stop in index.stops.items()}      # One Call for all parts
+        for path in _paths(index):
+            stops = [index.stops[stop_id] for stop_id in path]
+            calls = [shared[stop_id] for stop_id in path]
+            events = [event for stop in stops for event in (stop.departures or []) + (stop.arrivals or [])]
+            product = next((event.product for event in events if event.product is not None), None)
+            name = f'{product.operatorName or ""} {product.longCategoryName or ""} {product.number or ""}'.strip() \
+                if product is not None else None
+            self.add_trip(calls, product, name, stops[0].destination)
+
+    def add_departures(self, response, station):
+        """Update the trains added earlier with the actual departure times, tracks and cancellations on a departures()
+        board of `station` (a UIC code or Station). Returns the number of updated calls."""
+        payload = getattr(response, 'payload', response)
+        number = self.stations.number(station)
+        updated = 0
+        for departure in payload.departures or []:
+            if departure.product is None:
+                continue
+            call = self._calls.get((departure.product.number, number, departure.plannedDateTime))
+            if call is None:
+                continue
+            call.actual_departure = departure.actualDateTime
+            call.actual_track = departure.actualTrack
+            call.cancelled = bool(departure.cancelled)
+            updated += 1
+        if updated:
+            self._built = False
+        return updated
+
+    def _build(self):
+        if self._built:
+            return
+        connections = []
+        for r, run in enumerate(self.runs):
+            calls = [k for k, call in enumerate(run.calls) if not call.cancelled]
+            for k0, k1 in zip(calls, calls[1:]):
+                departure = _departure_time(run.calls[k0])
+                arrival = _arrival_time(run.calls[k1])
+                if departure is not None and arrival is not None:
+                    connections.append((departure, arrival, run.stations[k0], run.stations[k1], r, k0, k1))
+        connections.sort()
+        columns = list(zip(*connections)) or [()] * 7
+        (self.departure_times, self.arrival_times, self.departure_stations, self.arrival_stations,
+         self.connection_runs, self.connection_calls, self.arrival_calls) = map(list, columns)
+        self._built = True
+
+    def earliest_arrival(self, origin, destination, departure: datetime.datetime):
+        """The trip departing at `departure` or later arriving at `destination` as early as possible, or None"""
+        self._build()
+        origin, destination = self._number(origin), self._number(destination)
+        if origin == destination:
+            return None
+        transfer = self.transfer_time
+        ready = {origin: departure.timestamp()}     # Station -> earliest time a train can be boarded there
+        boarded = {}                                # Run -> connection where it was boarded
+        reached = {}                                # Station -> (boarding connection, alighting connection)
+        best = INFINITY
+        departure_times, arrival_times = self.departure_times, self.arrival_times
+        departure_stations, arrival_stations = self.departure_stations, self.arrival_stations
+        runs = self.connection_runs
+        for i in range(bisect.bisect_left(departure_times, ready[origin]), len(departure_times)):
+            if departure_times[i] >= best:
+                break
+            run = runs[i]
+            enter = boarded.get(run)
+            if enter is None:
+                if ready.get(departure_stations[i], INFINITY) > departure_times[i]:
+                    continue
+                enter = boarded[run] = i
+            station = arrival_stations[i]
+            if arrival_times[i] + transfer < ready.get(station, INFINITY):
+                ready[station] = arrival_times[i] + transfer
+                reached[station] = (enter, i)
+                if station == destination:
+                    best = arrival_times[i]
+        if destination not in reached:
+            return None
+        legs = []
+        station = destination
+        while station != origin:
+            enter, exit = reached[station]
+            legs.append((enter, exit))
+            station = departure_stations[enter]
+        return self._trip(legs[::-1])
+
+    def profile(self, origin, destination, start: datetime.datetime, end: datetime.datetime,
+                max_duration=datetime.timedelta(hours=6)):
+        """All trips departing between `start` and `end` that are not dominated by another trip (departing later and
+        arriving earlier), in order of departure"""
+        self._build()
+        origin, destination = self._number(origin), self._number(destination)
+        if origin == destination:
+            return []
+        transfer = self.transfer_time
+        departure_times, arrival_times = self.departure_times, self.arrival_times
+        departure_stations, arrival_stations = self.departure_stations, self.arrival_stations
+        runs = self.connection_runs
+        # Station -> Pareto set of (departure, arrival, boarding connection, alighting connection), with departure
+        # and arrival both decreasing; and the negated departures, for bisection
+        profiles = {}
+        keys = {}
+        seated = {}             # Run -> (arrival at the destination when staying on board, alighting connection)
+        first = bisect.bisect_left(departure_times, start.timestamp())
+        last = bisect.bisect_right(departure_times, (end + max_duration).timestamp())
+        for i in range(last - 1, first - 1, -1):
+            arrival, exit = seated.get(runs[i], (INFINITY, None))
+            station = arrival_stations[i]
+            if station == destination and arrival_times[i] < arrival:
+                arrival, exit = arrival_times[i], i
+            elif station in profiles:
+                k = bisect.bisect_right(keys[station], -(arrival_times[i] + transfer)) - 1
+                if k >= 0 and profiles[station][k][1] < arrival:
+                    arrival, exit = profiles[station][k][1], i
+            if arrival == INFINITY:
+                continue
+            seated[runs[i]] = (arrival, exit)
+            station = departure_stations[i]
+            if station == destination:
+                continue
+            profile = profiles.setdefault(station, [])
+            key = keys.setdefault(station, [])
+            if profile and arrival >= profile[-1][1]:
+                continue
+            if profile and profile[-1][0] == departure_times[i]:
+                profile.pop()
+                key.pop()
+            profile.append((departure_times[i], arrival, i, exit))
+            key.append(-departure_times[i])
+        trips = []
+        for departure, arrival, enter, exit in reversed(profiles.get(origin, [])):
+            if departure > end.timestamp():
+                break
+            legs = [(enter, exit)]
+            while arrival_stations[exit] != destination:
+                station = arrival_stations[exit]
+                k = bisect.bisect_right(keys[station], -(arrival_times[exit] + transfer)) - 1
+                _, _, enter, exit = profiles[station][k]
+                legs.append((enter, exit))
+            trips.append(self._trip(legs))
+        return trips
+
+    def _number(self, station):
+        number = self.stations.number(station)
+        if number is None:
+            raise KeyError(f'Unknown station: {station}')
+        return number
+
+    def _trip(self, legs) -> Trip:
+        data = []
+        for i, (enter, exit) in enumerate(legs):
+            run = self.runs[self.connection_runs[enter]]
+            calls = run.calls[self.connection_calls[enter]:self.arrival_calls[exit] + 1]
+            calls = [call for call in calls if not call.cancelled]
+            data.append({
+                'idx': str(i),
+                'name': run.name,
+                'travelType': 'PUBLIC_TRANSIT',
+                'direction': run.direction,
+                'cancelled': False,
+                'changePossible': True,
+                'alternativeTransport': False,
+                'journeyDetailRef': run.journey_ref,
+                'origin': _origin_destination(calls[0], calls[0].departure, calls[0].actual_departure),
+                'destination': _origin_destination(calls[-1], calls[-1].arrival, calls[-1].actual_arrival),
+                'stops': [_stop(call, k) for k, call in enumerate(calls)],
+                'reachable': True,
+                'plannedDurationInMinutes': _minutes(calls[0].departure, calls[-1].arrival),
+            })
+        origin, destination = data[0]['origin'], data[-1]['destination']
+        first = self.runs[self.connection_runs[legs[0][0]]].calls[self.connection_calls[legs[0][0]]]
+        last = self.runs[self.connection_runs[legs[-1][1]]].calls[self.arrival_calls[legs[-1][1]]]
+        trip = Trip({
+            'uid': f'csa|{origin["uicCode"]}|{destination["uicCode"]}|{origin["plannedDateTime"]}|'
+                   + '|'.join(str(self.connection_runs[enter]) for enter, _ in legs),
+            'ctxRecon': '',
+            'plannedDurationInMinutes': _minutes(first.departure, last.arrival),
+            'actualDurationInMinutes': _minutes(first.actual_departure or first.departure,
+                                                last.actual_arrival or last.arrival),
+            'transfers': len(legs) - 1,
+            'status': 'NORMAL',
+            'legs': data,
+            'optimal': False,
+            'type': 'NS',
+            'realtime': False,
+        })
+        for leg, (enter, _) in zip(trip.legs, legs):
+            leg.product = self.runs[self.connection_runs[enter]].product
+        return trip
+
+
+def _paths(index):
+    """Stop ids of every path from a first to a last stop of a journey"""
+    paths = []
+    pending = [[stop_id] for stop_id in index.order if not index.previous[stop_id]]
+    while pending:
+        path = pending.pop()
+        following = index.next[path[-1]]
+        if not following:
+            paths.append(path)
+        pending.extend(path + [stop_id] for stop_id in following)
+    return paths
+
+
+def _call(stop):
+    arrival = stop.arrivals[0] if stop.arrivals else None
+    departure = stop.departures[0] if stop.departures else None
+    event = departure or arrival
+    return Call(stop.stop,
+                arrival.plannedTime if arrival else None, departure.plannedTime if departure else None,
+                arrival.actualTime if arrival else None, departure.actualTime if departure else None,
+                event.plannedTrack if event else None, event.actualTrack if event else None,
+                bool(event and event.cancelled))
+
+
+def _departure_time(call):
+    time = call.actual_departure or call.departure
+    return time.timestamp() if time is not None else None
+
+
+def _arrival_time(call):
+    time = call.actual_arrival or call.arrival or call.actual_departure or call.departure
+    return time.timestamp() if time is not None else None
+
+
+def _minutes(departure, arrival):
+    if departure is None or arrival is None:
+        return None
+    return int((arrival - departure).total_seconds() // 60)
+
+
+def _format(time):
+    return time.strftime(TIMESTAMP) if time is not None else None
+
+
+def _origin_destination(call, planned, actual):
+    station = call.station
+    return {
+        'name': station.namen.lang if station.namen is not None else None,
+        'lng': station.lng,
+        'lat': station.lat,
+        'countryCode': station.land,
+        'uicCode': station.UICCode,
+        'type': 'STATION',
+        'plannedDateTime': _format(planned),
+        'actualDateTime': _format(actual),
+        'plannedTrack': call.track,
+        'actualTrack': call.actual_track,
+    }
+
+
+def _stop(call, index):
+    station = call.station
+    return {
+        'uicCode': station.UICCode,
+        'name': station.namen.lang if station.namen is not None else None,
+        'lat': station.lat,
+        'lng': station.lng,
+        'countryCode': station.land,
+        'notes': [],
+        'routeIdx': index,
+        'plannedDepartureDateTime': _format(call.departure),
+        'actualDepartureDateTime': _format(call.actual_departure),
+        'plannedArrivalDateTime': _format(call.arrival),
+        'actualArrivalDateTime': _format(call.actual_arrival),
+        'plannedDepartureTrack': call.track,
+        'actualDepartureTrack': call.actual_track,
+        'cancelled': call.cancelled,
+        'borderStop': False,
+        'passing': False,
+    }
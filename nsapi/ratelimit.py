@@ -0,0 +1,118 @@
+import time
+import heapq
+import random
+import asyncio
+import itertools
+import threading
+import email.utils
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_DEFAULT = 1
+PRIORITY_BACKGROUND = 2
+
+
+class RateLimiter:
+    """Token bucket limiting the request rate of a client, shared by all threads and coroutines using it.
+    Waiting requests get tokens in order of priority (lowest first), then in order of arrival.
+
+    When the API responds with HTTP 429, all requests are paused for the time given in its Retry-After header
+    (or an exponential backoff), and the request is retried at a random moment in the half of that time after the pause.
+    """
+    def __init__(self, rate: float, burst: float = None, max_retries=5, backoff=0.5, max_backoff=60.0):
+        self.rate = rate                    # Requests per second
+        self.capacity = burst if burst is not None else max(1.0, rate)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.requests = 0
+        self.throttled = 0                  # Number of HTTP 429 responses
+        self.wait_time = 0.0                # Total time spent waiting for a token
+        self.max_wait_time = 0.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._queue = []                    # Heap of [priority, sequence number] tickets
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def acquire(self, priority=PRIORITY_DEFAULT):
+        """Wait until a request can be made"""
+        ticket, start = self._enqueue(priority)
+        try:
+            while (delay := self._reserve(ticket)) > 0:
+                time.sleep(delay)
+        finally:
+            self._finish(ticket, start)
+
+    async def acquire_async(self, priority=PRIORITY_DEFAULT):
+        ticket, start = self._enqueue(priority)
+        try:
+            while (delay := self._reserve(ticket)) > 0:
+                await asyncio.sleep(delay)
+        finally:
+            self._finish(ticket, start)
+
+    def on_throttled(self, headers, attempt) -> float:
+        """Register an HTTP 429 response. Pauses all requests, and returns the delay before retrying this one."""
+        delay = _retry_after(headers.get('Retry-After'))
+        if delay is None:
+            delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+        with self._lock:
+            self.throttled += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        # Spread the retries over the time after the pause, instead of having every throttled request retry the moment
+        # it ends
+        return delay + random.uniform(0, delay / 2)
+
+    def stats(self):
+        return {'requests': self.requests, 'throttled': self.throttled, 'waiting': len(self._queue),
+                'wait_time': self.wait_time, 'max_wait_time': self.max_wait_time,
+                'mean_wait_time': self.wait_time / self.requests if self.requests else 0.0}
+
+    def _enqueue(self, priority):
+        ticket = [priority, next(self._sequence)]
+        with self._lock:
+            heapq.heappush(self._queue, ticket)
+        return ticket, time.monotonic()
+
+    def _reserve(self, ticket):
+        """Try to take a token for `ticket`. Returns 0 on success, or the time to wait before trying again."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if now < self._paused_until:
+                return self._paused_until - now
+            if self._tokens >= 1 and self._queue[0] is ticket:
+                self._tokens -= 1
+                heapq.heappop(self._queue)
+                ticket.append(True)
+                return 0
+            # Requests behind the first in line check again when it should have gotten its token
+            return max((1 - self._tokens) / self.rate, 0.001)
+
+    def _finish(self, ticket, start):
+        waited = time.monotonic() - start
+        with self._lock:
+            if len(ticket) == 2:
+                # Not acquired (e.g. cancelled while waiting), give up the place in the queue
+                self._queue.remove(ticket)
+                heapq.heapify(self._queue)
+                return
+            self.requests += 1
+            self.wait_time += waited
+            self.max_wait_time = max(self.max_wait_time, waited)
+
+
+def _retry_after(value):
+    """Seconds to wait according to a Retry-After header, which holds either a number of seconds or an HTTP date"""
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
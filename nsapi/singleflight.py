@@ -0,0 +1,61 @@
+import asyncio
+import threading
+
+
+class SingleFlight:
+    """Coalesce concurrent identical calls: while a call for a key is in flight, other calls for the same key wait for
+    it and share its result (or exception) instead of making their own call."""
+    def __init__(self):
+        self.calls = 0          # Calls that were made
+        self.shared = 0         # Calls that shared the result of another call
+        self._calls = {}        # key -> _Call, for threads
+        self._tasks = {}        # key -> asyncio.Task, for coroutines
+        self._lock = threading.Lock()
+
+    def do(self, key, function):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                self.shared += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = function()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key, function):
+        """Like do(), for a coroutine function. The call runs in its own task, so it continues when the caller that
+        started it gets cancelled while others are still waiting for it."""
+        with self._lock:
+            task = self._tasks.get(key)
+            if task is None:
+                task = self._tasks[key] = asyncio.ensure_future(function())
+                task.add_done_callback(lambda _: self._tasks.pop(key, None))
+                self.calls += 1
+            else:
+                self.shared += 1
+        return await asyncio.shield(task)
+
+    def stats(self):
+        return {'calls': self.calls, 'shared': self.shared, 'in_flight': len(self._calls) + len(self._tasks)}
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
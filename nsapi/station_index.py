@@ -0,0 +1,146 @@
+import gzip
+import json
+import heapq
+import math
+import unicodedata
+
+from .dtypes.travel_information import Station
+
+EARTH_RADIUS = 6371.0     # km
+FORMAT_VERSION = 1
+# Station fields kept in a saved index
+FIELDS = ('UICCode', 'EVACode', 'code', 'stationType', 'land', 'lat', 'lng', 'synoniemen')
+NAMES = ('lang', 'middel', 'kort', 'festive')
+
+
+def normalize(text: str) -> str:
+    """Lowercase `text` and strip accents, so 'Étampes' and 'etampes' match"""
+    text = unicodedata.normalize('NFKD', text.casefold())
+    return ''.join(c for c in text if not unicodedata.combining(c))
+
+
+class StationIndex:
+    """Offline lookup of stations, built from a full `stations()` dump.
+
+        index = StationIndex(api.travel_information.stations().payload)
+        index.search('amst')                    # Stations with a name, synonym or code starting with 'amst'
+        index.get('UT')                         # Station by code, UIC code or EVA code
+        index.nearest(52.09, 5.11, k=3)         # [(distance in km, station), ...]
+    """
+    def __init__(self, stations):
+        self.stations = list(stations)
+        self._trie = [{}, []]       # [children by character, indices of stations with a key starting here]
+        self._codes = {}
+        for i, station in enumerate(self.stations):
+            for code in (station.code, station.UICCode, station.EVACode):
+                if code is not None:
+                    self._codes.setdefault(str(code).upper(), station)
+            for key in self._keys(station):
+                self._insert(key, i)
+        points = [(i, _to_xyz(station.lat, station.lng)) for i, station in enumerate(self.stations)
+                  if station.lat is not None and station.lng is not None]
+        self._tree = _build_kdtree(points, 0)
+
+    @staticmethod
+    def _keys(station):
+        """All strings a station can be found by. Names are also indexed from the start of every word."""
+        names = set(station.synoniemen or [])
+        if station.namen is not None:
+            names.update(getattr(station.namen, name) for name in NAMES)
+        names.discard(None)
+        keys = {normalize(station.code)} if station.code is not None else set()
+        for name in names:
+            words = normalize(name).split()
+            keys.update(' '.join(words[i:]) for i in range(len(words)))
+        return keys
+
+    def _insert(self, key, i):
+        node = self._trie
+        for char in key:
+            node = node[0].setdefault(char, [{}, []])
+            if not node[1] or node[1][-1] != i:
+                node[1].append(i)
+
+    def search(self, prefix: str, limit=10) -> list[Station]:
+        """Stations with a name, synonym or code starting with `prefix`"""
+        node = self._trie
+        for char in normalize(prefix):
+            node = node[0].get(char)
+            if node is None:
+                return []
+        return [self.stations[i] for i in node[1][:limit]]
+
+    def get(self, code) -> Station:
+        """Get a station by its code, UIC code or EVA code"""
+        return self._codes.get(str(code).upper())
+
+    def nearest(self, lat: float, lng: float, k=1) -> list[tuple[float, Station]]:
+        """The `k` stations nearest to a coordinate, as (distance in km, station), nearest first"""
+        target = _to_xyz(lat, lng)
+        best = []       # Max-heap of (-squared chord length, index)
+        _search_kdtree(self._tree, target, k, best)
+        result = []
+        for negative, i in sorted(best, reverse=True):
+            chord = math.sqrt(-negative)
+            result.append((2 * EARTH_RADIUS * math.asin(min(1.0, chord / 2)), self.stations[i]))
+        return result
+
+    def save(self, file):
+        """Save the index as gzipped JSON, with only the fields needed to rebuild it"""
+        records = [[getattr(station, field) for field in FIELDS] +
+                   [[getattr(station.namen, name) for name in NAMES] if station.namen is not None else None,
+                    [track.spoorNummer for track in station.sporen or []]]
+                   for station in self.stations]
+        with gzip.open(file, 'wt', encoding='utf-8') as f:
+            json.dump({'version': FORMAT_VERSION, 'fields': FIELDS, 'stations': records}, f, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, file):
+        with gzip.open(file, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != FORMAT_VERSION:
+            raise ValueError(f'Unsupported station index version: {data.get("version")}')
+        stations = []
+        for record in data['stations']:
+            station = dict(zip(FIELDS, record))
+            names, tracks = record[len(FIELDS):]
+            station['namen'] = dict(zip(NAMES, names)) if names is not None else None
+            station['sporen'] = [{'spoorNummer': track} for track in tracks]
+            stations.append(Station(station))
+        return cls(stations)
+
+    def __len__(self):
+        return len(self.stations)
+
+
+def _to_xyz(lat, lng):
+    """Point on the unit sphere. The straight line distance between them orders points like the great-circle distance."""
+    lat, lng = math.radians(lat), math.radians(lng)
+    return math.cos(lat) * math.cos(lng), math.cos(lat) * math.sin(lng), math.sin(lat)
+
+
+def _build_kdtree(points, axis):
+    """KD-tree nodes are (index, point, axis, left, right)"""
+    if not points:
+        return None
+    points.sort(key=lambda point: point[1][axis])
+    middle = len(points) // 2
+    i, point = points[middle]
+    next_axis = (axis + 1) % 3
+    return i, point, axis, _build_kdtree(points[:middle], next_axis), _build_kdtree(points[middle + 1:], next_axis)
+
+
+def _search_kdtree(node, target, k, best):
+    if node is None:
+        return
+    i, point, axis, left, right = node
+    distance = (point[0] - target[0]) ** 2 + (point[1] - target[1]) ** 2 + (point[2] - target[2]) ** 2
+    if len(best) < k:
+        heapq.heappush(best, (-distance, i))
+    elif distance < -best[0][0]:
+        heapq.heapreplace(best, (-distance, i))
+    difference = target[axis] - point[axis]
+    near, far = (left, right) if difference < 0 else (right, left)
+    _search_kdtree(near, target, k, best)
+    if len(best) < k or difference ** 2 < -best[0][0]:
+        _search_kdtree(far, target, k, best)
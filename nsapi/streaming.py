@@ -0,0 +1,198 @@
+import re
+import json
+import codecs
+
+_WHITESPACE = re.compile(r'\s*')
+_SCALAR_END = re.compile(r'[\s,\]}]')
+_DECODER = json.JSONDecoder()
+
+
+class ArrayStream:
+    """Decode a JSON object incrementally, yielding the items of one of its array members as soon as they are complete.
+    The other members (the envelope) are decoded to `dtype` once the stream is exhausted, and can be accessed as
+    attributes of the stream. Memory use is bounded by the size of a single item.
+
+        stream = api.travel_information.trips_stream('ut', 'gdm')
+        for trip in stream:
+            ...
+        stream.scrollRequestForwardContext
+    """
+    def __init__(self, chunks, dtype, key, item_dtype, lazy=False):
+        self.chunks = chunks
+        self.dtype = dtype
+        self.item_dtype = item_dtype
+        self.lazy = lazy
+        self.envelope = None
+        self._parser = _ArrayParser(key)
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            yield from self._decode(self._parser.feed(chunk))
+        yield from self._finish()
+
+    async def __aiter__(self):
+        async for chunk in self.chunks:
+            for item in self._decode(self._parser.feed(chunk)):
+                yield item
+        for item in self._finish():
+            yield item
+
+    def _decode(self, items):
+        decode = self.item_dtype.lazy if self.lazy else self.item_dtype
+        return [decode(item) for item in items]
+
+    def _finish(self):
+        items = self._decode(self._parser.close())
+        self.envelope = self.dtype.lazy(self._parser.envelope) if self.lazy else self.dtype(self._parser.envelope)
+        return items
+
+    def __getattr__(self, name):
+        if name != 'envelope' and self.envelope is not None:
+            return getattr(self.envelope, name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+
+class _ArrayParser:
+    """Push parser for a JSON object. Items of the array member `key` are returned by feed() as soon as they are
+    complete, the other members are collected in `envelope`."""
+    def __init__(self, key):
+        self.key = key
+        self.envelope = {}
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._pos = 0
+        self._state = self._object_start
+        self._member = None
+        self._retry_at = 0      # Length of the buffer before parsing an incomplete value is tried again
+
+    def feed(self, data: bytes) -> list:
+        self._retry_at -= self._pos
+        self._buffer = self._buffer[self._pos:] + self._decoder.decode(data)
+        self._pos = 0
+        return self._parse()
+
+    def close(self) -> list:
+        """Parse the remaining data, once all of it has been fed"""
+        self._decoder.decode(b'', final=True)      # Raises on a truncated UTF-8 sequence
+        items = self.feed(b'')
+        self._retry_at = 0
+        items += self._parse()
+        if self._state is not None or self._skip_whitespace():
+            raise ValueError('Incomplete or invalid JSON response')
+        return items
+
+    def _parse(self):
+        items = []
+        while self._state is not None and self._skip_whitespace() and self._state(items):
+            pass
+        return items
+
+    def _skip_whitespace(self):
+        """Skip whitespace, returns whether there is more data to parse"""
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+        return self._pos < len(self._buffer)
+
+    def _expect(self, chars):
+        char = self._buffer[self._pos]
+        if char not in chars:
+            raise ValueError(f'Invalid JSON response: expected one of {chars!r} at {char!r}')
+        self._pos += 1
+        return char
+
+    def _value(self):
+        """The next complete JSON value, or raises _Incomplete"""
+        if self._buffer[self._pos] in '[{"':
+            # A string, array or object can not be mistaken for a complete value before all of it has been received.
+            # Invalid JSON also ends up here, and is reported by close() once all data has been received.
+            # Retries wait for the partial value to grow by a fraction of its size, keeping parsing time linear.
+            if len(self._buffer) < self._retry_at:
+                raise _Incomplete()
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                partial = len(self._buffer) - self._pos
+                self._retry_at = len(self._buffer) + max(partial // 4, 4096)
+                raise _Incomplete()
+        else:
+            # Number or literal: it could continue in the next chunk, unless followed by a delimiter
+            match = _SCALAR_END.search(self._buffer, self._pos)
+            if match is None:
+                raise _Incomplete()
+            end = match.start()
+            value = json.loads(self._buffer[self._pos:end])
+        self._pos = end
+        self._retry_at = 0
+        return value
+
+    # States of the parser. Each gets called with the position at a non-whitespace character,
+    # and returns whether parsing can continue with the data that is available.
+
+    def _object_start(self, items):
+        self._expect('{')
+        self._state = self._member_or_end
+        return True
+
+    def _member_or_end(self, items):
+        if self._buffer[self._pos] == '}':
+            self._pos += 1
+            self._state = None
+            return False
+        try:
+            self._member = self._value()
+        except _Incomplete:
+            return False
+        self._state = self._colon
+        return True
+
+    def _colon(self, items):
+        self._expect(':')
+        self._state = self._array_start if self._member == self.key else self._member_value
+        return True
+
+    def _member_value(self, items):
+        try:
+            self.envelope[self._member] = self._value()
+        except _Incomplete:
+            return False
+        self._state = self._member_end
+        return True
+
+    def _member_end(self, items):
+        if self._expect(',}') == '}':
+            self._state = None
+            return False
+        self._state = self._member_or_end
+        return True
+
+    def _array_start(self, items):
+        if self._buffer[self._pos] != '[':
+            # Not an array after all (e.g. null), treat it like any other member
+            self._state = self._member_value
+            return True
+        self._pos += 1
+        self._state = self._item_or_end
+        return True
+
+    def _item_or_end(self, items):
+        if self._buffer[self._pos] == ']':
+            self._pos += 1
+            self._state = self._member_end
+            return True
+        try:
+            items.append(self._value())
+        except _Incomplete:
+            return False
+        self._state = self._item_end
+        return True
+
+    def _item_end(self, items):
+        if self._expect(',]') == ']':
+            self._state = self._member_end
+        else:
+            self._state = self._item_or_end
+        return True
+
+
+class _Incomplete(Exception):
+    pass
+
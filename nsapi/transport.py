@@ -0,0 +1,250 @@
+"""Record responses of the API to an archive, and replay them without the network:
+
+    archive = Archive()
+    api = NSAPI(token, transport=RecordingAdapter(archive))
+    ...                                                     # Use the API as usual
+    archive.save('responses.json.gz')
+
+    api = NSAPI(token, transport=ReplayAdapter(Archive.load('responses.json.gz')))         # In-process
+    api = AsyncNSAPI(token, transport=AsyncReplayTransport(archive))
+    with StandInServer(archive, latency=0.05, errors={503: 0.01}) as url:                 # Over HTTP
+        api = NSAPI(token, base_url=url)
+
+Requests are matched on method, path and query parameters (in any order), regardless of the host.
+When a request was recorded more than once, the responses are replayed in turn.
+"""
+import gzip
+import json
+import time
+import random
+import datetime
+import threading
+import http.server
+import urllib.parse
+
+import requests
+import requests.adapters
+import requests.structures
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+FORMAT_VERSION = 1
+
+# Headers that no longer apply to the recorded (decoded, complete) body
+SKIP_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection', 'keep-alive', 'date'}
+
+
+class Archive:
+    def __init__(self):
+        self.entries = {}           # (method, path, query) -> [(status, headers, body)]
+        self._next = {}             # (method, path, query) -> index of the response to replay next
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(method, url):
+        url = urllib.parse.urlsplit(url)
+        query = tuple(sorted(urllib.parse.parse_qsl(url.query, keep_blank_values=True)))
+        return method.upper(), url.path.rstrip('/'), query
+
+    def add(self, method, url, status, headers, body: bytes):
+        headers = {name: value for name, value in headers.items() if name.lower() not in SKIP_HEADERS}
+        with self._lock:
+            self.entries.setdefault(self.key(method, url), []).append((status, headers, body))
+
+    def find(self, method, url):
+        """The next recorded (status, headers, body) for a request, or None if it was not recorded"""
+        key = self.key(method, url)
+        with self._lock:
+            responses = self.entries.get(key)
+            if not responses:
+                return None
+            index = self._next.get(key, 0)
+            self._next[key] = (index + 1) % len(responses)
+            return responses[index]
+
+    def __len__(self):
+        return sum(len(responses) for responses in self.entries.values())
+
+    def save(self, file):
+        records = [[method, path, query, [[status, headers, body.decode('utf-8')] for status, headers, body in responses]]
+                   for (method, path, query), responses in self.entries.items()]
+        with gzip.open(file, 'wt', encoding='utf-8') as f:
+            json.dump({'version': FORMAT_VERSION, 'entries': records}, f, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, file):
+        with gzip.open(file, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != FORMAT_VERSION:
+            raise ValueError(f'Unsupported archive version: {data.get("version")}')
+        archive = cls()
+        for method, path, query, responses in data['entries']:
+            key = (method, path, tuple(tuple(item) for item in query))
+            archive.entries[key] = [(status, headers, body.encode('utf-8')) for status, headers, body in responses]
+        return archive
+
+
+class RecordingAdapter(requests.adapters.HTTPAdapter):
+    """Transport for NSAPI that makes real requests, and adds the responses to an archive"""
+    def __init__(self, archive, **kwargs):
+        super().__init__(**kwargs)
+        self.archive = archive
+
+    def send(self, request, *args, **kwargs):
+        response = super().send(request, *args, **kwargs)
+        self.archive.add(request.method, request.url, response.status_code, response.headers, response.content)
+        return response
+
+
+class ReplayAdapter(requests.adapters.BaseAdapter):
+    """Transport for NSAPI that answers requests from an archive, with HTTP 404 for requests that were not recorded"""
+    def __init__(self, archive):
+        super().__init__()
+        self.archive = archive
+
+    def send(self, request, *args, **kwargs):
+        status, headers, body = _replay(self.archive, request.method, request.url)
+        response = requests.Response()
+        response.status_code = status
+        response.reason = http.server.BaseHTTPRequestHandler.responses.get(status, ('',))[0]
+        response.headers = requests.structures.CaseInsensitiveDict(headers)
+        response._content = body
+        response._content_consumed = True
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        response.elapsed = datetime.timedelta(0)
+        return response
+
+    def close(self):
+        pass
+
+
+if httpx is not None:
+    class AsyncRecordingTransport(httpx.AsyncBaseTransport):
+        """Transport for AsyncNSAPI that makes real requests, and adds the responses to an archive"""
+        def __init__(self, archive, transport=None):
+            self.archive = archive
+            self.transport = transport or httpx.AsyncHTTPTransport()
+
+        async def handle_async_request(self, request):
+            response = await self.transport.handle_async_request(request)
+            body = await response.aread()
+            self.archive.add(request.method, str(request.url), response.status_code, response.headers, body)
+            headers = {name: value for name, value in response.headers.items() if name.lower() not in SKIP_HEADERS}
+            return httpx.Response(response.status_code, headers=headers, content=body, request=request)
+
+        async def aclose(self):
+            await self.transport.aclose()
+
+    class AsyncReplayTransport(httpx.AsyncBaseTransport):
+        """Transport for AsyncNSAPI that answers requests from an archive, with HTTP 404 for requests that were not
+        recorded"""
+        def __init__(self, archive):
+            self.archive = archive
+
+        async def handle_async_request(self, request):
+            status, headers, body = _replay(self.archive, request.method, str(request.url))
+            return httpx.Response(status, headers=headers, content=body, request=request)
+
+
+class _Server(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128        # Room for many concurrent clients connecting at once
+
+
+def _replay(archive, method, url):
+    response = archive.find(method, url)
+    if response is None:
+        return 404, {'Content-Type': 'application/json'}, json.dumps({'message': f'Not recorded: {method} {url}'}).encode()
+    return response
+
+
+class StandInServer:
+    """Local HTTP server replaying an archive, with optional latency and injected errors.
+
+    `latency` (seconds) is added to every response, plus a random delay of up to `jitter` seconds.
+    `errors` maps HTTP statuses to the fraction of requests answered with it, e.g. {429: 0.05, 503: 0.01}.
+    HTTP 429 responses carry a Retry-After header of `retry_after` seconds. Conditional requests matching the ETag
+    of the recorded response get HTTP 304.
+    """
+    def __init__(self, archive, latency=0.0, jitter=0.0, errors=None, retry_after=1, host='127.0.0.1', port=0, seed=None):
+        self.archive = archive
+        self.latency = latency
+        self.jitter = jitter
+        self.errors = errors or {}
+        self.retry_after = retry_after
+        self.requests = 0
+        self.injected = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = _Server((host, port), self._handler())
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.url
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _respond(self, method, url, headers):
+        """(status, headers, body) for a request"""
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            draw = self._random.random()
+        for status, rate in self.errors.items():
+            if draw < rate:
+                with self._lock:
+                    self.injected += 1
+                extra = {'Retry-After': str(self.retry_after)} if status == 429 else {}
+                return delay, status, extra, b''
+            draw -= rate
+        status, recorded, body = _replay(self.archive, method, url)
+        etag = next((value for name, value in recorded.items() if name.lower() == 'etag'), None)
+        if etag is not None and headers.get('If-None-Match') == etag:
+            return delay, 304, {'ETag': etag}, b''
+        return delay, status, recorded, body
+
+    def _handler(self):
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True      # Headers and body are written separately
+
+            def do_GET(self):
+                delay, status, headers, body = server._respond(self.command, self.path, self.headers)
+                if delay > 0:
+                    time.sleep(delay)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_POST = do_PUT = do_DELETE = do_GET
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,141 @@
+import json
+import time
+import heapq
+import asyncio
+import logging
+
+from .ratelimit import PRIORITY_BACKGROUND
+from .dtypes.travel_information import Departure, Arrival
+
+logger = logging.getLogger(__name__)
+
+ADDED = 'added'
+REMOVED = 'removed'
+CHANGED = 'changed'
+
+
+class BoardChange:
+    def __init__(self, kind, station, key, entry, changes=None):
+        self.kind = kind            # ADDED, REMOVED or CHANGED
+        self.station = station
+        self.key = key              # (journeyDetailRef or name, plannedDateTime)
+        self.entry = entry          # The Departure or Arrival, as it was last seen for removed entries
+        self.changes = changes or {}    # Field -> (old, new) JSON value, for changed entries
+
+    def __repr__(self):
+        return f'BoardChange({self.kind}, {self.station}, {self.key}, {self.changes})'
+
+
+class BoardWatcher:
+    """Poll the departure (or arrival) boards of a set of stations, and yield only what changed between polls.
+
+        watcher = BoardWatcher(api.travel_information, ['UT', 'ASD'], interval=30)
+        for change in watcher:
+            if change.kind == CHANGED and 'actualTrack' in change.changes:
+                ...
+
+    Entries are identified by their journeyDetailRef (or name) and planned time. Every entry of a board is hashed, and
+    only entries with a new hash are compared field by field and decoded. With AsyncNSAPI, use `async for`.
+    The polls of the stations are spread evenly over the interval.
+    """
+    def __init__(self, endpoint, stations, interval=30.0, arrivals=False, initial=True, limit=None, lazy=False):
+        self.endpoint = endpoint
+        self.stations = list(stations)
+        self.interval = interval
+        self.arrivals = arrivals
+        self.initial = initial      # Report the entries of the first poll of a station as added
+        self.limit = limit
+        self.lazy = lazy
+        self.path = 'api/v2/arrivals' if arrivals else 'api/v2/departures'
+        self.dtype = Arrival if arrivals else Departure
+        self.boards = {}            # Station -> {key: (hash, JSON entry)}
+        self.errors = {}            # Station -> exception of the last failed poll
+        self.polls = 0
+        self.unchanged = 0          # Entries skipped because their hash did not change
+
+    def _schedule(self):
+        start = time.monotonic()
+        step = self.interval / max(1, len(self.stations))
+        schedule = [(start + i * step, i, station) for i, station in enumerate(self.stations)]
+        heapq.heapify(schedule)
+        return schedule
+
+    def _params(self, station):
+        params = {'station': station}
+        if self.limit is not None:
+            params['maxJourneys'] = self.limit
+        return params
+
+    def update(self, station, data):
+        """Process a response for a station, returning the changes since the previous one"""
+        self.polls += 1
+        self.errors.pop(station, None)
+        entries = data['payload']['arrivals' if self.arrivals else 'departures']
+        first = station not in self.boards
+        previous = self.boards.get(station, {})
+        board = {}
+        changes = []
+        for entry in entries:
+            key = (entry.get('journeyDetailRef') or entry.get('name'), entry.get('plannedDateTime'))
+            digest = hash(json.dumps(entry, sort_keys=True))
+            board[key] = (digest, entry)
+            old = previous.get(key)
+            if old is None:
+                if not first or self.initial:
+                    changes.append(BoardChange(ADDED, station, key, self._decode(entry)))
+            elif old[0] == digest:
+                self.unchanged += 1
+            else:
+                diff = _diff(old[1], entry)
+                if diff:
+                    changes.append(BoardChange(CHANGED, station, key, self._decode(entry), diff))
+        for key, (_, entry) in previous.items():
+            if key not in board:
+                changes.append(BoardChange(REMOVED, station, key, self._decode(entry)))
+        self.boards[station] = board
+        return changes
+
+    def _decode(self, entry):
+        return self.dtype.lazy(entry) if self.lazy else self.dtype(entry)
+
+    def _failed(self, station, error):
+        self.errors[station] = error
+        logger.warning(f'Polling {station} failed: {error!r}')
+
+    def __iter__(self):
+        schedule = self._schedule()
+        while schedule:
+            due, i, station = heapq.heappop(schedule)
+            if (delay := due - time.monotonic()) > 0:
+                time.sleep(delay)
+            heapq.heappush(schedule, (due + self.interval, i, station))
+            try:
+                data = self.endpoint.get(self.path, params=self._params(station), priority=PRIORITY_BACKGROUND)
+                # A malformed response (e.g. without a payload) fails this station's poll, not the whole iteration
+                changes = self.update(station, data)
+            except Exception as e:
+                self._failed(station, e)
+                continue
+            yield from changes
+
+    async def __aiter__(self):
+        schedule = self._schedule()
+        while schedule:
+            due, i, station = heapq.heappop(schedule)
+            if (delay := due - time.monotonic()) > 0:
+                await asyncio.sleep(delay)
+            heapq.heappush(schedule, (due + self.interval, i, station))
+            try:
+                data = await self.endpoint.get(self.path, params=self._params(station), priority=PRIORITY_BACKGROUND)
+                changes = self.update(station, data)
+            except Exception as e:
+                self._failed(station, e)
+                continue
+            for change in changes:
+                yield change
+
+
+def _diff(old, new):
+    """Field -> (old, new) for the top-level fields that differ between two JSON entries"""
+    return {field: (old.get(field), new.get(field)) for field in old.keys() | new.keys()
+            if old.get(field) != new.get(field)}
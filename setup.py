@@ -5,9 +5,14 @@ setup(name='nsapi',
       description='An unofficial package to communicate with the NS API',
       url='https://github.com/Frederic98/ns_api',
       author='Frederic98',
-      packages=['nsapi'],
+      packages=['nsapi', 'nsapi.dtypes'],
       zip_safe=False,
       install_requires=[
             'requests',
-      ]
+      ],
+      extras_require={
+            'async': ['httpx'],
+            'columnar': ['numpy'],
+            'arrow': ['numpy', 'pyarrow'],
+      }
       )